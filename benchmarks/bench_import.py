@@ -0,0 +1,85 @@
+'''
+Import-time benchmark for the logic_toolkit package
+
+Starts fresh interpreters that only import the package and reports how long that takes,
+using the cumulative time from 'python -X importtime'.
+Also checks which of the heavier modules got imported along the way,
+those are supposed to load lazily, on first use.
+
+Usage: python benchmarks/bench_import.py [--runs N] [--output results.json]
+'''
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# modules that importing logic_toolkit should not pull in
+LAZY_MODULES = ["asyncio", "random", "json", "threading", "concurrent.futures", "numpy", "sqlite3", "multiprocessing"]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import_time():
+    '''
+    Imports the package in a fresh interpreter
+    Returns the cumulative import time of logic_toolkit in microseconds
+    '''
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import logic_toolkit"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+    # lines look like 'import time:       123 |        456 | logic_toolkit'
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "logic_toolkit":
+            return int(parts[1])
+    raise RuntimeError("logic_toolkit not found in the -X importtime output")
+
+
+def find_loaded_lazy_modules():
+    '''
+    Returns the LAZY_MODULES that were imported as a side effect of importing the package
+    '''
+
+    code = "import sys, logic_toolkit; print(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    loaded = set(result.stdout.split())
+    return [module for module in LAZY_MODULES if module in loaded]
+
+
+def main(args):
+    runs = 20
+    output = None
+    for i, arg in enumerate(args):
+        if arg == "--runs":
+            runs = int(args[i+1])
+        elif arg == "--output":
+            output = args[i+1]
+
+    times = [measure_import_time() for _ in range(runs)]
+    results = {
+        "python" : sys.version.split()[0],
+        "runs" : runs,
+        "import_us_min" : min(times),
+        "import_us_median" : statistics.median(times),
+        "import_us_max" : max(times),
+        "eagerly_loaded" : find_loaded_lazy_modules()
+    }
+
+    print("import logic_toolkit: min " + str(results["import_us_min"]) + " us, median " +
+        str(results["import_us_median"]) + " us (" + str(runs) + " runs)")
+    if results["eagerly_loaded"]:
+        print("loaded at import time, should be lazy: " + ", ".join(results["eagerly_loaded"]))
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    # non-zero exit code so a CI job notices when something heavy is imported eagerly again
+    return 1 if results["eagerly_loaded"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,244 @@
+'''
+Benchmark suite for the LogicToolkit engines
+
+Every benchmark runs on seeded workloads of increasing size, so the numbers can be
+compared between runs and versions, and the growth between sizes shows the asymptotic behavior.
+For every size it reports the median and minimum wall time per call, and the peak memory
+allocated during one call (measured with tracemalloc, in a separate run so it doesn't skew the timings).
+
+Usage: python benchmarks/bench_suite.py [--only NAME,NAME] [--repeat N] [--samples N]
+                                        [--output results.json] [--compare old_results.json]
+'''
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic_toolkit import LogicToolkit
+
+LITERALS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# a result counts as a regression when it's this many times slower than in the compared file
+REGRESSION_THRESHOLD = 1.25
+
+
+def make_formulas(ltk, samples, *, minimum_length, n_of_literals):
+    '''
+    Returns a list of seeded random formulas, the seeds are the sample numbers
+    '''
+    return [ltk.make_random_formula(minimum_length=minimum_length, n_of_literals=n_of_literals, seed=seed)
+        for seed in range(samples)]
+
+
+def make_rule_base(size, seed):
+    '''
+    Returns a list of size definite rules ('A', 'A->B', 'Z,C->F', ...) for add_rule
+    A..Y form a chain (A, A->B, B->C, ..., X->Y), every letter is derivable from the one before it.
+    The rest of the rules are alternatives starting with Z, which has no rules, so they are dead ends.
+    This way the rule base grows, but make_query only explores a number of paths linear in its size
+    (make_query doesn't remember literals it has already proven, so a denser rule base blows up exponentially)
+    '''
+
+    import random
+    rng = random.Random(seed)
+    rules = ["A"] + [LITERALS[i-1] + "->" + LITERALS[i] for i in range(1, min(size, 25))]
+    while len(rules) < size:
+        head = rng.randrange(1, 25)
+        body = ["Z"] + [LITERALS[rng.randrange(head)] for _ in range(rng.randrange(1, 3))]
+        rules.append(",".join(body) + "->" + LITERALS[head])
+    return rules
+
+
+def make_toolkit_with_rules(size, seed):
+    ltk = LogicToolkit()
+    for rule in make_rule_base(size, seed):
+        ltk.add_rule(rule)
+    return ltk
+
+
+# Every benchmark has:
+#   - the name of the parameter that grows, and its values
+#   - a setup function: (size, samples) -> list of (function, argument) pairs to time
+#     setup isn't timed, and a fresh pair is made for every sample
+def setup_formula_to_list(size, samples):
+    ltk = LogicToolkit()
+    return [(ltk.formula_to_list, f) for f in make_formulas(ltk, samples, minimum_length=size, n_of_literals=4)]
+
+def setup_to_cnf(size, samples):
+    ltk = LogicToolkit()
+    return [(ltk.to_cnf, f) for f in make_formulas(ltk, samples, minimum_length=size, n_of_literals=4)]
+
+def setup_to_dnf(size, samples):
+    ltk = LogicToolkit()
+    return [(ltk.to_dnf, f) for f in make_formulas(ltk, samples, minimum_length=size, n_of_literals=4)]
+
+def setup_is_satisfiable(size, samples):
+    ltk = LogicToolkit()
+    return [(ltk.is_satisfiable, f) for f in make_formulas(ltk, samples, minimum_length=size*4, n_of_literals=size)]
+
+def setup_is_satisfiable_3cnf(size, samples):
+    # random 3-CNF at the phase transition ratio, the hard region for satisfiability checks
+    from logic_toolkit.workloads import WorkloadGenerator
+    ltk = LogicToolkit()
+    return [(ltk.is_satisfiable, WorkloadGenerator(seed).random_kcnf(size)) for seed in range(samples)]
+
+def setup_is_tautology(size, samples):
+    ltk = LogicToolkit()
+    return [(ltk.is_tautology, f) for f in make_formulas(ltk, samples, minimum_length=size*4, n_of_literals=size)]
+
+def setup_make_query(size, samples):
+    pairs = []
+    for seed in range(samples):
+        ltk = make_toolkit_with_rules(size, seed)
+        pairs.append((ltk.make_query, "Y"))
+    return pairs
+
+def setup_make_shortcuts(size, samples):
+    pairs = []
+    for seed in range(samples):
+        ltk = make_toolkit_with_rules(size, seed)
+        pairs.append((lambda _, ltk=ltk: ltk.make_shortcuts(), None))
+    return pairs
+
+
+BENCHMARKS = {
+    "formula_to_list" : ("formula_length", [10, 20, 40, 80, 160], setup_formula_to_list),
+    "to_cnf" : ("formula_length", [10, 20, 40, 80], setup_to_cnf),
+    "to_dnf" : ("formula_length", [10, 20, 40, 80], setup_to_dnf),
+    "is_satisfiable" : ("variables", [2, 4, 6, 8, 10], setup_is_satisfiable),
+    "is_satisfiable_3cnf" : ("variables", [3, 5, 7, 9], setup_is_satisfiable_3cnf),
+    "is_tautology" : ("variables", [2, 4, 6, 8, 10], setup_is_tautology),
+    "make_query" : ("rules", [25, 50, 100, 200, 400], setup_make_query),
+    "make_shortcuts" : ("rules", [25, 50, 100, 200, 400], setup_make_shortcuts)
+}
+
+
+def run_case(name, size, *, samples, repeat):
+    '''
+    Runs one benchmark at one size
+    Returns a dict with the timings (seconds per call) and the peak memory (bytes per call)
+    The workload is fixed by the seeds, so if any call raises, the case as a whole is marked as failed
+    and has no numbers, instead of being timed on whichever samples happened to work
+    '''
+
+    result = {
+        "benchmark" : name,
+        "parameter" : BENCHMARKS[name][0],
+        "size" : size,
+        "calls" : 0,
+        "error" : None,
+        "time_median_s" : None,
+        "time_min_s" : None,
+        "peak_memory_bytes" : None
+    }
+
+    setup = BENCHMARKS[name][2]
+    times = []
+    peak = 0
+    try:
+        for _ in range(repeat):
+            for function, argument in setup(size, samples):
+                start = time.perf_counter()
+                function(argument)
+                times.append(time.perf_counter() - start)
+
+        for function, argument in setup(size, samples):
+            tracemalloc.start()
+            try:
+                function(argument)
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+    except Exception as e:
+        result["error"] = type(e).__name__ + ": " + str(e) + " (argument: " + repr(argument) + ")"
+        return result
+
+    result["calls"] = len(times)
+    result["time_median_s"] = statistics.median(times)
+    result["time_min_s"] = min(times)
+    result["peak_memory_bytes"] = peak
+    return result
+
+
+def print_results(results, compared):
+    '''
+    Prints a table of the results
+    'growth' is the ratio of the median time to the one at the previous size
+    If there are compared results, also prints the ratio new/old and marks regressions
+    '''
+
+    old = {(r["benchmark"], r["size"]) : r for r in compared}
+    previous = {}
+    print("%-20s %-15s %6s %12s %8s %12s %s" % ("benchmark", "parameter", "size", "median", "growth", "peak mem", "compared"))
+    for r in results:
+        median = r["time_median_s"]
+        growth = ""
+        before = previous.get(r["benchmark"])
+        if median is not None and before:
+            growth = "x%.2f" % (median / before)
+        previous[r["benchmark"]] = median
+
+        comparison = ""
+        old_result = old.get((r["benchmark"], r["size"]))
+        if median is not None and old_result is not None and old_result["time_median_s"]:
+            ratio = median / old_result["time_median_s"]
+            comparison = "x%.2f" % ratio
+            if ratio > REGRESSION_THRESHOLD:
+                comparison += "  REGRESSION"
+
+        if r["error"] is not None:
+            print("%-20s %-15s %6d FAILED: %s" % (r["benchmark"], r["parameter"], r["size"], r["error"]))
+            continue
+        print("%-20s %-15s %6d %12s %8s %12d %s" % (r["benchmark"], r["parameter"], r["size"],
+            "%.1f us" % (median * 1e6), growth, r["peak_memory_bytes"], comparison))
+
+
+def main(args):
+    only = list(BENCHMARKS)
+    repeat, samples = 3, 5
+    output = compare = None
+    for i, arg in enumerate(args):
+        if arg == "--only":
+            only = args[i+1].split(",")
+        elif arg == "--repeat":
+            repeat = int(args[i+1])
+        elif arg == "--samples":
+            samples = int(args[i+1])
+        elif arg == "--output":
+            output = args[i+1]
+        elif arg == "--compare":
+            compare = args[i+1]
+
+    results = []
+    for name in only:
+        for size in BENCHMARKS[name][1]:
+            results.append(run_case(name, size, samples=samples, repeat=repeat))
+
+    compared = []
+    if compare is not None:
+        with open(compare) as f:
+            compared = json.load(f)["results"]
+    print_results(results, compared)
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump({
+                "python" : sys.version.split()[0],
+                "platform" : platform.platform(),
+                "repeat" : repeat,
+                "samples" : samples,
+                "results" : results
+            }, f, indent=2)
+
+    # a failed case means the numbers are incomplete, so the run fails as well
+    return 1 if any(r["error"] is not None for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
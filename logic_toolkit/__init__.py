@@ -0,0 +1,37 @@
+'''
+LogicToolkit, a toolkit for working with logic formulas
+
+Importing the package only loads the LogicToolkit class itself.
+Everything else (the server, and any heavier engines) is loaded the first time it's used,
+so short-lived worker processes don't pay for what they don't need.
+Run 'python -m logic_toolkit' for the interactive prompt, or add '--serve' for the JSON-RPC server.
+'''
+
+from .clauses import ClauseSet
+from .dag import FormulaDAG
+from .toolkit import ConversionBudgetExceeded, LogicToolkit
+
+# name -> submodule that defines it, these are imported on first access
+_lazy_attributes = {
+    "LogicToolkitServer" : "server",
+    "run_server" : "server",
+    "SatSession" : "sat",
+    "CompiledFormula" : "ddnnf",
+    "TruthTableFile" : "truthtable",
+    "NormalizationCache" : "cache",
+    "Portfolio" : "portfolio",
+    "WorkloadGenerator" : "workloads"
+}
+
+__all__ = ["LogicToolkit","ClauseSet","FormulaDAG","ConversionBudgetExceeded"] + list(_lazy_attributes)
+
+
+def __getattr__(name):
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError("module 'logic_toolkit' has no attribute '" + name + "'")
+
+    from importlib import import_module
+    value = getattr(import_module("." + module_name,__name__),name)
+    globals()[name] = value # cached, so __getattr__ isn't called for it again
+    return value
@@ -0,0 +1,24 @@
+import sys
+
+
+def main(args=None):
+    '''
+    Entry point for 'python -m logic_toolkit'
+    Starts the interactive prompt, or the JSON-RPC server if the first argument is --serve
+    '''
+
+    if args is None:
+        args = sys.argv[1:]
+
+    if len(args) > 0 and args[0] == "--serve":
+        # long-running JSON-RPC server instead of the interactive prompt
+        from .server import run_server
+        from .toolkit import LogicToolkit
+        run_server(LogicToolkit(),args[1:])
+    else:
+        from .repl import main as run_repl
+        run_repl()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+
+# part of every key, raised whenever a change to the toolkit can change what it returns,
+# so results computed by an older version are never used (they're evicted like any unused entry)
+ENGINE_VERSION = 1
+
+
+class NormalizationCache:
+    '''
+    Results of conversions and checks kept in a local SQLite file, so they survive restarts
+    and are shared by every process using the same file (see LogicToolkit.use_cache)
+
+    - Keys are a SHA-256 hash of the operation, ENGINE_VERSION and the formula written out by the toolkit
+      (so 'A v B', 'AvB' and ['A','v','B'] share an entry)
+    - Values are stored as compressed JSON
+    - The file is kept under max_bytes of stored values by evicting the least recently used entries
+    - The database is in WAL mode: readers in any number of processes don't block each other
+      or the writer. Marking an entry as used is skipped when the database is busy, rather than waiting
+    '''
+
+    # milliseconds a write waits for another process holding the lock
+    BUSY_TIMEOUT = 5000
+
+    def __init__(self,path,*,max_bytes=64 * 2**20):
+        if type(max_bytes) != int or max_bytes < 0:
+            raise ValueError("max_bytes has to be a non-negative integer")
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock() # the connection is shared by the threads of this process
+        self._connection = sqlite3.connect(str(path),timeout=self.BUSY_TIMEOUT / 1000,isolation_level=None,check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL,"
+            " size INTEGER NOT NULL, used REAL NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+
+        self.stats = {"hits" : 0, "misses" : 0, "stores" : 0, "evictions" : 0}
+
+    def key(self,operation,formula):
+        '''
+        The key of an operation (like "to_cnf") on a formula string
+        '''
+        text = operation + "\n" + str(ENGINE_VERSION) + "\n" + formula
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self,key):
+        '''
+        Returns the stored value, or None if there isn't one
+        '''
+
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM entries WHERE key = ?",(key,)).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            # the connection waits for locks otherwise, marking the entry as used isn't worth waiting for
+            self._connection.execute("PRAGMA busy_timeout = 0")
+            try:
+                self._connection.execute("UPDATE entries SET used = ? WHERE key = ?",(time.time(),key))
+            except sqlite3.OperationalError:
+                pass # another process is writing, the entry just looks a little older than it is
+            finally:
+                self._connection.execute("PRAGMA busy_timeout = " + str(self.BUSY_TIMEOUT))
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self,key,value):
+        '''
+        Stores a value (anything JSON can hold), then evicts the least recently used entries over max_bytes
+        '''
+
+        blob = zlib.compress(json.dumps(value,separators=(",",":")).encode("utf-8"))
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute("INSERT OR REPLACE INTO entries (key,value,size,used) VALUES (?,?,?,?)",
+                    (key,blob,len(blob),time.time()))
+                total = self._connection.execute("SELECT COALESCE(SUM(size),0) FROM entries").fetchone()[0]
+                evicted = 0
+                if total > self.max_bytes:
+                    for old_key,size in self._connection.execute("SELECT key,size FROM entries ORDER BY used").fetchall():
+                        if total <= self.max_bytes:
+                            break
+                        self._connection.execute("DELETE FROM entries WHERE key = ?",(old_key,))
+                        total -= size
+                        evicted += 1
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self.stats["stores"] += 1
+            self.stats["evictions"] += evicted
+
+    def size(self):
+        '''
+        Returns (number of entries, bytes of stored values)
+        '''
+        with self._lock:
+            return tuple(self._connection.execute("SELECT COUNT(*),COALESCE(SUM(size),0) FROM entries").fetchone())
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,256 @@
+class ClauseSet:
+    '''
+    A CNF formula stored as a set of clauses, the form the satisfiability checks work on
+
+    Variables are numbered from 1 in the order they're first seen, and literals are signed integers:
+    A is 1, !A is -1, B is 2, and so on. Every clause is a sorted tuple of literals, so (AvB)a!C is {(1,2),(-3,)}
+
+    Redundant clauses are left out as they're added:
+    - tautologies, clauses with both a literal and its negation, like Av!A
+    - duplicates, clauses with the same literals as one already in the set
+    - subsumed clauses, which have all the literals of a smaller clause: AvB is implied by A, so it's dropped
+    Adding a clause that subsumes clauses already in the set removes those instead.
+    Both checks use occurrence lists (literal -> ids of the clauses it's in),
+    so only the clauses sharing a literal with the new one are ever looked at.
+
+    An empty clause is always False, a clause set containing it is a contradiction
+    An empty clause set is always True
+    '''
+
+    def __init__(self,clauses=(),*,variables=()):
+        '''
+        clauses is an iterable of clauses, each an iterable of literals,
+        either as strings ('A', '!A') or as signed integers
+        variables are names to register up front, so they're numbered in that order
+        '''
+
+        self.variables = [] # variable number - 1 -> name
+        self._numbers = {} # name -> variable number
+        self._clauses = {} # clause id -> clause
+        self._occurrences = {} # literal -> set of ids of the clauses it's in
+        self._next_id = 0
+
+        # how many clauses were left out or removed, and why
+        self.removed = {"tautologies" : 0, "duplicates" : 0, "subsumed" : 0}
+
+        for name in variables:
+            self.variable(name)
+        for clause in clauses:
+            self.add_clause(clause)
+
+    def variable(self,name):
+        '''
+        Returns the number of the given variable, registering it if it's new
+        '''
+        number = self._numbers.get(name)
+        if number is None:
+            self.variables.append(name)
+            number = self._numbers[name] = len(self.variables)
+        return number
+
+    def literal(self,literal):
+        '''
+        Turns a literal string like 'A' or '!A' into its signed integer, integers are returned as they are
+        '''
+        if type(literal) == int:
+            if literal == 0 or abs(literal) > len(self.variables):
+                raise ValueError("Unknown literal: " + str(literal))
+            return literal
+        if literal.startswith("!"):
+            return -self.variable(literal[1:])
+        return self.variable(literal)
+
+    def literal_name(self,literal):
+        '''
+        Turns a signed integer literal back into its string, -1 becomes '!A' if A is the first variable
+        '''
+        name = self.variables[abs(literal) - 1]
+        return "!" + name if literal < 0 else name
+
+    def add_clause(self,literals):
+        '''
+        Adds a clause, given as an iterable of literals
+        Returns True if it was added, False if it was left out as redundant
+        '''
+
+        clause = set()
+        for literal in literals:
+            literal = self.literal(literal)
+            if -literal in clause:
+                self.removed["tautologies"] += 1
+                return False
+            clause.add(literal)
+
+        if self.__is_subsumed(clause):
+            return False
+        for clause_id in self.__subsumed_by(clause):
+            self.__remove(clause_id)
+            self.removed["subsumed"] += 1
+
+        clause_id = self._next_id
+        self._next_id += 1
+        self._clauses[clause_id] = tuple(sorted(clause))
+        for literal in clause:
+            self._occurrences.setdefault(literal,set()).add(clause_id)
+        return True
+
+    def __is_subsumed(self,clause):
+        '''
+        Checks whether a clause already in the set has only literals from the given clause
+        Such a clause has to share a literal with it, so only the occurrence lists of its literals are counted through
+        '''
+
+        if self.has_empty_clause():
+            self.removed["subsumed"] += 1
+            return True
+
+        shared = {} # clause id -> how many of the given clause's literals it has
+        for literal in clause:
+            for clause_id in self._occurrences.get(literal,()):
+                shared[clause_id] = shared.get(clause_id,0) + 1
+        for clause_id,count in shared.items():
+            if count == len(self._clauses[clause_id]):
+                if count == len(clause):
+                    self.removed["duplicates"] += 1
+                else:
+                    self.removed["subsumed"] += 1
+                return True
+        return False
+
+    def __subsumed_by(self,clause):
+        '''
+        Returns the ids of the clauses in the set that have all the literals of the given clause
+        Starts from the shortest occurrence list and narrows it down with the others
+        '''
+
+        if len(clause) == 0:
+            return list(self._clauses)
+        occurrence_lists = sorted((self._occurrences.get(literal,set()) for literal in clause),key=len)
+        candidates = set(occurrence_lists[0])
+        for occurrences in occurrence_lists[1:]:
+            if not candidates:
+                break
+            candidates &= occurrences
+        return list(candidates)
+
+    def __remove(self,clause_id):
+        for literal in self._clauses.pop(clause_id):
+            occurrences = self._occurrences[literal]
+            occurrences.discard(clause_id)
+            if not occurrences:
+                del self._occurrences[literal]
+
+    def has_empty_clause(self):
+        '''
+        Returns True if the set contains the empty clause, making it a contradiction
+        '''
+        return () in self._clauses.values() if len(self._clauses) == 1 else False
+
+    def clauses(self):
+        '''
+        Returns the clauses as a list of sorted tuples of signed integer literals
+        '''
+        return list(self._clauses.values())
+
+    def occurrences(self,literal):
+        '''
+        Returns the clauses the given literal (string or integer) is in
+        '''
+        literal = self.literal(literal)
+        return [self._clauses[clause_id] for clause_id in self._occurrences.get(literal,())]
+
+    def evaluate(self,values):
+        '''
+        Evaluates the clause set, values holds a bool for every variable, in the order of self.variables
+        '''
+        for clause in self._clauses.values():
+            for literal in clause:
+                if values[literal - 1] if literal > 0 else not values[-literal - 1]:
+                    break
+            else:
+                return False
+        return True
+
+    def models(self):
+        '''
+        Yields every interpretation satisfying the clause set, as tuples of bools in the order of self.variables
+
+        Interpretations are visited in Gray-code order, starting with every variable True,
+        so only one variable changes from one to the next (the last variable every other step, and so on).
+        Every clause keeps a count of its True literals, and when a variable flips,
+        only the clauses it's in (found through the occurrence lists) have their count changed.
+        The number of clauses with no True literal says whether the interpretation is a model,
+        so a step costs the number of occurrences of the flipped variable, not the size of the clause set
+        '''
+
+        n = len(self.variables)
+        values = [True] * n
+        true_counts = {} # clause id -> how many of its literals are True
+        for clause_id,clause in self._clauses.items():
+            true_counts[clause_id] = sum(1 for literal in clause if literal > 0)
+        unsatisfied = sum(1 for count in true_counts.values() if count == 0)
+        if unsatisfied == 0:
+            yield tuple(values)
+
+        for step in range(1,2**n):
+            # the lowest set bit of the step picks the variable to flip, counted from the last one
+            variable = n - ((step & -step).bit_length() - 1)
+            falling = variable if values[variable - 1] else -variable # the literal that becomes False
+            values[variable - 1] = not values[variable - 1]
+            for clause_id in self._occurrences.get(falling,()):
+                true_counts[clause_id] -= 1
+                if true_counts[clause_id] == 0:
+                    unsatisfied += 1
+            for clause_id in self._occurrences.get(-falling,()):
+                if true_counts[clause_id] == 0:
+                    unsatisfied -= 1
+                true_counts[clause_id] += 1
+            if unsatisfied == 0:
+                yield tuple(values)
+
+    def to_f_list(self):
+        '''
+        Returns the clause set as a CNF f_list, like [['A','v',['!','B']],'a','C']
+        An empty clause set is returned as [True], one with the empty clause as [False]
+        '''
+
+        if len(self._clauses) == 0:
+            return [True]
+        if self.has_empty_clause():
+            return [False]
+
+        def to_part(literal):
+            name = self.variables[abs(literal) - 1]
+            return ['!',name] if literal < 0 else name
+
+        f_list = []
+        for clause in self._clauses.values():
+            if len(clause) == 1:
+                f_list.append(to_part(clause[0]))
+            else:
+                disjunction = []
+                for literal in clause:
+                    disjunction.append(to_part(literal))
+                    disjunction.append('v')
+                f_list.append(disjunction[:-1])
+            f_list.append('a')
+        f_list = f_list[:-1]
+
+        if len(self._clauses) == 1 and type(f_list[0]) == list and len(f_list[0]) > 2:
+            # a single clause is a plain disjunction, not a conjunction of one
+            return f_list[0]
+        return f_list
+
+    def __len__(self):
+        return len(self._clauses)
+
+    def __iter__(self):
+        return iter(list(self._clauses.values()))
+
+    def __contains__(self,clause):
+        clause = tuple(sorted(self.literal(literal) for literal in clause))
+        return clause in self._clauses.values()
+
+    def __repr__(self):
+        clauses = ["(" + "v".join(self.literal_name(literal) for literal in clause) + ")" for clause in self]
+        return "ClauseSet(" + "a".join(clauses) + ")"
@@ -0,0 +1,7 @@
+def padded_print(string):
+    '''
+    Gives the print to console a slight padding on the left
+    '''
+
+    print("    ",end="") # side-padding
+    print(string)
@@ -0,0 +1,191 @@
+import sys
+
+
+class FormulaDAG:
+    '''
+    Formulas in NNF (see LogicToolkit.__to_nnf) stored as a directed acyclic graph,
+    where every distinct subformula is a single node, however many times it appears
+
+    Nodes are tuples, their children are node numbers:
+    - ("constant", value), with value True or False
+    - ("literal", literal), with literal a string like 'A' or '!A'
+    - ("a", children) and ("v", children), a conjunction / disjunction of its children, in order
+    Adding a node that's already there returns the existing one (hash-consing), so AvB in
+    (AvB)a(C->(AvB)) is stored once, and everything working on the graph handles it once
+
+    Every node counts its references: one from every parent node, and one for every time it was
+    added from outside (see add). release() drops a reference, and a node nobody refers to anymore
+    is removed together with the children only it was using
+    '''
+
+    def __init__(self):
+        self._nodes = [] # node number -> node, None once it's removed
+        self._references = [] # node number -> how many references it has
+        self._unique = {} # node -> its number
+        self._free = [] # numbers of removed nodes, reused for new ones
+
+    def __node(self,node):
+        number = self._unique.get(node)
+        if number is not None:
+            return number
+        if self._free:
+            number = self._free.pop()
+            self._nodes[number] = node
+            self._references[number] = 0
+        else:
+            number = len(self._nodes)
+            self._nodes.append(node)
+            self._references.append(0)
+        self._unique[node] = number
+        if node[0] == "a" or node[0] == "v":
+            for child in node[1]:
+                self._references[child] += 1
+        return number
+
+    def add(self,nnf):
+        '''
+        Adds an f_list in NNF, returns the number of its root node, which gets one more reference
+        '''
+
+        numbers = {} # id(part) -> (part, node number), the part is kept so its id can't be reused
+        stack = [(nnf,False)]
+        while stack:
+            part,children_done = stack.pop()
+            if id(part) in numbers:
+                continue
+
+            if type(part) == bool:
+                numbers[id(part)] = (part,self.__node(("constant",part)))
+                continue
+            if type(part) == str:
+                numbers[id(part)] = (part,self.__node(("literal",part)))
+                continue
+            if len(part) == 2 and part[0] == '!':
+                numbers[id(part)] = (part,self.__node(("literal","!" + part[1])))
+                continue
+
+            children = part[::2]
+            if not children_done:
+                stack.append((part,True))
+                for child in children:
+                    if id(child) not in numbers:
+                        stack.append((child,False))
+                continue
+
+            children = tuple(numbers[id(child)][1] for child in children)
+            if len(children) == 1:
+                numbers[id(part)] = (part,children[0])
+            else:
+                numbers[id(part)] = (part,self.__node((part[1],children)))
+
+        root = numbers[id(nnf)][1]
+        self._references[root] += 1
+        return root
+
+    def release(self,number):
+        '''
+        Drops one reference to a node, removing it (and then its children, the same way) when none are left
+        '''
+
+        stack = [number]
+        while stack:
+            number = stack.pop()
+            if self._nodes[number] is None or self._references[number] == 0:
+                raise ValueError("Node " + str(number) + " has no references to release")
+            self._references[number] -= 1
+            if self._references[number] == 0:
+                node = self._nodes[number]
+                del self._unique[node]
+                self._nodes[number] = None
+                self._free.append(number)
+                if node[0] == "a" or node[0] == "v":
+                    stack.extend(node[1])
+
+    def references(self,number):
+        return self._references[number]
+
+    def to_f_list(self,number):
+        '''
+        Turns a node back into an f_list in NNF, where every node is a single list object,
+        so a subformula used in several places is the same list in all of them
+        '''
+
+        built = {} # node number -> its part of the f_list
+        stack = [(number,False)]
+        while stack:
+            current,children_done = stack.pop()
+            if current in built:
+                continue
+            node = self._nodes[current]
+            if node[0] == "constant":
+                built[current] = node[1]
+            elif node[0] == "literal":
+                built[current] = ['!',node[1][1:]] if node[1].startswith("!") else node[1]
+            elif not children_done:
+                stack.append((current,True))
+                stack.extend((child,False) for child in node[1] if child not in built)
+            else:
+                f_list = []
+                for child in node[1]:
+                    f_list.append(built[child])
+                    f_list.append(node[0])
+                built[current] = f_list[:-1]
+        return built[number]
+
+    def size(self,number=None):
+        '''
+        Reports how much memory sharing saves, for one root node or for the whole graph:
+        - nodes / bytes: the nodes stored, and the bytes they take
+        - tree_nodes / tree_bytes: the same if every node was copied into every place it's used, as in an f_list
+        Bytes are the sizes of the node tuples (and their child tuples), counted with sys.getsizeof
+        '''
+
+        def node_bytes(node):
+            if node[0] == "a" or node[0] == "v":
+                return sys.getsizeof(node) + sys.getsizeof(node[1])
+            return sys.getsizeof(node)
+
+        if number is None:
+            live = [n for n,node in enumerate(self._nodes) if node is not None]
+        else:
+            live = []
+            seen = {number}
+            stack = [number]
+            while stack:
+                current = stack.pop()
+                live.append(current)
+                if self._nodes[current][0] in ("a","v"):
+                    for child in self._nodes[current][1]:
+                        if child not in seen:
+                            seen.add(child)
+                            stack.append(child)
+
+        # the size of every node as a tree, children first
+        tree = {} # node number -> (tree nodes, tree bytes)
+        for root in live:
+            stack = [(root,False)]
+            while stack:
+                current,children_done = stack.pop()
+                if current in tree:
+                    continue
+                node = self._nodes[current]
+                if node[0] != "a" and node[0] != "v":
+                    tree[current] = (1,node_bytes(node))
+                elif not children_done:
+                    stack.append((current,True))
+                    stack.extend((child,False) for child in node[1] if child not in tree)
+                else:
+                    tree[current] = (1 + sum(tree[child][0] for child in node[1]),
+                        node_bytes(node) + sum(tree[child][1] for child in node[1]))
+
+        if number is None:
+            # in the whole graph, the roots are the nodes no other node refers to
+            children = {child for n in live if self._nodes[n][0] in ("a","v") for child in self._nodes[n][1]}
+            roots = [n for n in live if n not in children]
+        else:
+            roots = [number]
+        return {"nodes" : len(live), "bytes" : sum(node_bytes(self._nodes[n]) for n in live),
+            "tree_nodes" : sum(tree[root][0] for root in roots), "tree_bytes" : sum(tree[root][1] for root in roots)}
+
+    def __len__(self):
+        return len(self._unique)
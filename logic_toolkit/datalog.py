@@ -0,0 +1,321 @@
+import re
+
+# a predicate name, followed by its arguments in brackets, for example edge(a,X)
+ATOM = re.compile(r"(!?)([a-z][a-z0-9_]*)\(([A-Za-z0-9_,]+)\)")
+ARGUMENT = re.compile(r"[A-Za-z0-9][A-Za-z0-9_]*")
+
+
+def is_variable(argument):
+    '''
+    Variables start with an uppercase letter (X, Node), constants don't (a, bob, 42)
+    '''
+    return argument[0].isupper()
+
+
+class _Relation:
+    '''
+    The rows of one predicate, as a set of tuples
+    Also keeps hash indexes: for a tuple of argument positions, a dict from the values at those positions
+    to the rows having them. An index is built the first time it's needed and kept up to date after that
+    '''
+
+    def __init__(self,rows=()):
+        self.rows = set()
+        self._indexes = {} # positions -> {values at those positions -> rows}
+        for row in rows:
+            self.add(row)
+
+    def add(self,row):
+        '''
+        Adds a row, returns False if it was already there
+        '''
+        if row in self.rows:
+            return False
+        self.rows.add(row)
+        for positions,index in self._indexes.items():
+            index.setdefault(tuple(row[p] for p in positions),[]).append(row)
+        return True
+
+    def lookup(self,positions,values):
+        '''
+        Returns the rows with the given values at the given positions
+        '''
+        if not positions:
+            return self.rows
+        index = self._indexes.get(positions)
+        if index is None:
+            index = self._indexes[positions] = {}
+            for row in self.rows:
+                index.setdefault(tuple(row[p] for p in positions),[]).append(row)
+        return index.get(values,())
+
+
+class DatalogProgram:
+    '''
+    Rules over predicates with variables (Datalog), for example:
+    - facts: 'edge(a,b)', 'edge(b,c)'
+    - rules: 'edge(X,Y)->reach(X,Y)', 'reach(X,Y),edge(Y,Z)->reach(X,Z)'
+    - negation in rule bodies: 'node(X),!reach(a,X)->unreachable(X)'
+    Variables start with an uppercase letter, constants and predicate names with a lowercase one (or a digit)
+
+    Everything that follows from the rules is computed bottom-up, the first time it's needed after a change:
+    - predicates are split into strata, so that a negated predicate is complete before it's used
+      (rules that go through a negation in a cycle can't be split like that, and are rejected)
+    - every stratum is evaluated semi-naively: after the first round, a rule is only joined
+      with the rows that were new in the previous round, so no derivation is repeated
+    - joins look rows up in hash indexes on the argument positions that are already bound
+
+    Queries are atoms, variables in them are answered: 'reach(a,Z)' gives [{'Z' : 'b'}, {'Z' : 'c'}]
+    '''
+
+    def __init__(self):
+        self._facts = {} # predicate -> set of rows
+        self._rules = [] # (head, positive body atoms, negated body atoms), an atom is (predicate, arguments)
+        self._arities = {} # predicate -> number of arguments
+        self._relations = None # predicate -> _Relation, everything derived, None when out of date
+
+        self.stats = {"evaluations" : 0, "rounds" : 0, "derived" : 0}
+
+    def __parse_atom(self,text):
+        '''
+        Parses an atom like 'edge(a,X)' or '!edge(a,X)', returns (negated, predicate, arguments)
+        '''
+        match = ATOM.fullmatch(text)
+        if match is None:
+            raise ValueError("Invalid atom: " + text)
+        arguments = tuple(match.group(3).split(","))
+        for argument in arguments:
+            if ARGUMENT.fullmatch(argument) is None:
+                raise ValueError("Invalid argument '" + argument + "' in " + text)
+        return match.group(1) == "!",match.group(2),arguments
+
+    def parse_rule(self,rule_string):
+        '''
+        Parses a fact or a rule, returns (head, positive body atoms, negated body atoms)
+        Raises ValueError if it isn't valid, or isn't safe: every variable of the head
+        and of the negated atoms has to appear in a positive atom of the body
+        '''
+
+        rule_string = rule_string.replace(" ","")
+        if rule_string.count("->") > 1:
+            raise ValueError("Invalid rule: " + rule_string)
+        body_string,_,head_string = rule_string.rpartition("->")
+
+        negated,predicate,arguments = self.__parse_atom(head_string)
+        if negated:
+            raise ValueError("The head of a rule can't be negated")
+        head = (predicate,arguments)
+
+        positive,negative = [],[]
+        if "->" in rule_string:
+            atoms = [match.group(0) for match in ATOM.finditer(body_string)]
+            if ",".join(atoms) != body_string:
+                raise ValueError("Invalid rule body: " + body_string)
+            for atom in atoms:
+                negated,predicate,arguments = self.__parse_atom(atom)
+                (negative if negated else positive).append((predicate,arguments))
+
+        bound = {argument for _,arguments in positive for argument in arguments if is_variable(argument)}
+        for predicate,arguments in [head] + negative:
+            for argument in arguments:
+                if is_variable(argument) and argument not in bound:
+                    raise ValueError("Variable " + argument + " has to appear in a positive atom of the body")
+        return head,positive,negative
+
+    def is_valid_rule(self,rule_string):
+        try:
+            self.parse_rule(rule_string)
+        except ValueError:
+            return False
+        return True
+
+    def add_rule(self,rule_string):
+        '''
+        Adds a fact ('edge(a,b)') or a rule ('reach(X,Y),edge(Y,Z)->reach(X,Z)')
+        Raises ValueError if it's invalid, uses a predicate with a different number of arguments than before,
+        or would make the program impossible to stratify (a predicate depending on its own negation)
+        '''
+
+        head,positive,negative = self.parse_rule(rule_string)
+        arities = dict(self._arities)
+        for predicate,arguments in [head] + positive + negative:
+            if arities.setdefault(predicate,len(arguments)) != len(arguments):
+                raise ValueError("Predicate " + predicate + " has " + str(arities[predicate]) + " arguments")
+
+        if not positive and not negative:
+            self._facts.setdefault(head[0],set()).add(head[1])
+        else:
+            self._rules.append((head,positive,negative))
+            try:
+                self.__strata()
+            except ValueError:
+                self._rules.pop()
+                raise
+        self._arities = arities
+        self._relations = None
+
+    def __strata(self):
+        '''
+        Splits the predicates into strata: a predicate is in at least the stratum of every predicate
+        its rules use, and in a higher one than every predicate they use negated
+        Returns a list of sets of predicates, lowest stratum first
+        '''
+
+        stratum = {predicate : 0 for predicate in self._arities}
+        for head,positive,negative in self._rules:
+            for predicate,_ in [head] + positive + negative:
+                stratum.setdefault(predicate,0)
+
+        changed = True
+        while changed:
+            changed = False
+            for head,positive,negative in self._rules:
+                needed = max([stratum[p] for p,_ in positive] + [stratum[p] + 1 for p,_ in negative])
+                if stratum[head[0]] < needed:
+                    stratum[head[0]] = needed
+                    changed = True
+                    if needed > len(stratum):
+                        raise ValueError("The rules can't be stratified, " + head[0] + " depends on its own negation")
+
+        strata = [set() for _ in range(max(stratum.values(),default=-1) + 1)]
+        for predicate,level in stratum.items():
+            strata[level].add(predicate)
+        return strata
+
+    def __evaluate(self):
+        '''
+        Computes every fact that follows from the rules, stratum by stratum
+        '''
+
+        self.stats["evaluations"] += 1
+        relations = {predicate : _Relation(rows) for predicate,rows in self._facts.items()}
+        for predicate in self._arities:
+            relations.setdefault(predicate,_Relation())
+
+        for predicates in self.__strata():
+            rules = [rule for rule in self._rules if rule[0][0] in predicates]
+
+            # the first round uses every rule with everything known so far
+            delta = {predicate : _Relation() for predicate in predicates}
+            for rule in rules:
+                for row in list(self.__fire(rule,relations)):
+                    if relations[rule[0][0]].add(row):
+                        delta[rule[0][0]].add(row)
+                        self.stats["derived"] += 1
+
+            # later rounds only join with what the previous round found
+            while any(relation.rows for relation in delta.values()):
+                self.stats["rounds"] += 1
+                found = {predicate : _Relation() for predicate in predicates}
+                for rule in rules:
+                    for i,(predicate,_) in enumerate(rule[1]):
+                        if predicate in predicates and delta[predicate].rows:
+                            for row in self.__fire(rule,relations,i,delta[predicate]):
+                                if row not in relations[rule[0][0]].rows:
+                                    found[rule[0][0]].add(row)
+                for predicate,relation in found.items():
+                    for row in relation.rows:
+                        relations[predicate].add(row)
+                        self.stats["derived"] += 1
+                delta = found
+
+        self._relations = relations
+
+    def __fire(self,rule,relations,delta_position=None,delta=None):
+        '''
+        Joins the body of a rule, yielding the rows of its head
+        If delta_position is given, the positive atom at that position is joined with delta instead
+        Every atom is looked up in the index of the positions its already bound variables and constants are at
+        '''
+
+        head,positive,negative = rule
+        bindings = [{}]
+        for i,(predicate,arguments) in enumerate(positive):
+            relation = delta if i == delta_position else relations[predicate]
+            joined = []
+            for binding in bindings:
+                positions,values = self.__bound(arguments,binding)
+                for row in relation.lookup(positions,values):
+                    extended = self.__extend(arguments,row,binding)
+                    if extended is not None:
+                        joined.append(extended)
+            bindings = joined
+            if not bindings:
+                return
+
+        for binding in bindings:
+            # the negated predicates are in lower strata, so they're already complete
+            if any(relations[predicate].lookup(*self.__bound(arguments,binding)) for predicate,arguments in negative):
+                continue
+            yield tuple(binding[argument] if is_variable(argument) else argument for argument in head[1])
+
+    def __bound(self,arguments,binding):
+        '''
+        Returns the positions of the arguments that have a value (constants and bound variables), and those values
+        '''
+        positions,values = [],[]
+        for position,argument in enumerate(arguments):
+            if not is_variable(argument):
+                positions.append(position)
+                values.append(argument)
+            elif argument in binding:
+                positions.append(position)
+                values.append(binding[argument])
+        return tuple(positions),tuple(values)
+
+    def __extend(self,arguments,row,binding):
+        '''
+        Binds the variables of an atom to the values of a row, None if a variable repeated in the atom doesn't match
+        '''
+        extended = dict(binding)
+        for argument,value in zip(arguments,row):
+            if is_variable(argument):
+                if extended.setdefault(argument,value) != value:
+                    return None
+        return extended
+
+    def query(self,goal):
+        '''
+        Answers a goal like 'reach(a,Z)', returns a list of dicts, one for every answer,
+        from the goal's variables to their values: [{'Z' : 'b'}, {'Z' : 'c'}]
+        A goal without variables gives [{}] if it's true and [] if it isn't
+        '''
+
+        negated,predicate,arguments = self.__parse_atom(goal.replace(" ",""))
+        if negated:
+            raise ValueError("Queries can't be negated")
+        if predicate in self._arities and self._arities[predicate] != len(arguments):
+            raise ValueError("Predicate " + predicate + " has " + str(self._arities[predicate]) + " arguments")
+        if self._relations is None:
+            self.__evaluate()
+
+        relation = self._relations.get(predicate,_Relation())
+        answers = set()
+        for row in relation.lookup(*self.__bound(arguments,{})):
+            binding = self.__extend(arguments,row,{})
+            if binding is not None:
+                answers.add(tuple(sorted(binding.items())))
+        return [dict(answer) for answer in sorted(answers)]
+
+    def is_ground(self,goal):
+        '''
+        Checks whether a goal has no variables, like 'reach(a,c)'
+        '''
+        _,_,arguments = self.__parse_atom(goal.replace(" ",""))
+        return not any(is_variable(argument) for argument in arguments)
+
+    def rules(self):
+        '''
+        Returns the facts and rules as strings, in the form add_rule takes them
+        '''
+
+        def atom_string(atom,negated=False):
+            return ("!" if negated else "") + atom[0] + "(" + ",".join(atom[1]) + ")"
+
+        strings = []
+        for predicate,rows in self._facts.items():
+            strings.extend(atom_string((predicate,row)) for row in sorted(rows))
+        for head,positive,negative in self._rules:
+            body = [atom_string(atom) for atom in positive] + [atom_string(atom,True) for atom in negative]
+            strings.append(",".join(body) + "->" + atom_string(head))
+        return strings
@@ -0,0 +1,337 @@
+FORMAT_VERSION = 1
+
+
+class _Builder:
+    '''
+    Builds the nodes of a d-DNNF, making sure the same node is never stored twice
+    Nodes are tuples, children always come before their parents in the node list:
+    - ("true",) and ("false",)
+    - ("literal", l), with l a signed variable number
+    - ("and", children): the children share no variables (decomposable)
+    - ("or", variable, children): no two children can be true at once (deterministic),
+      variable is the one they were decided on, or None
+    '''
+
+    def __init__(self):
+        self.nodes = []
+        self._unique = {} # node -> its position in nodes
+        self.true = self.node(("true",))
+        self.false = self.node(("false",))
+
+    def node(self,node):
+        position = self._unique.get(node)
+        if position is None:
+            position = self._unique[node] = len(self.nodes)
+            self.nodes.append(node)
+        return position
+
+    def literal(self,literal):
+        return self.node(("literal",literal))
+
+    def conjoin(self,children):
+        if self.false in children:
+            return self.false
+        children = tuple(sorted(set(child for child in children if child != self.true)))
+        if len(children) == 0:
+            return self.true
+        if len(children) == 1:
+            return children[0]
+        return self.node(("and",children))
+
+    def disjoin(self,variable,children):
+        children = tuple(child for child in children if child != self.false)
+        if len(children) == 0:
+            return self.false
+        if len(children) == 1:
+            return children[0]
+        return self.node(("or",variable,children))
+
+
+class _Compiler(_Builder):
+    '''
+    Compiles a set of clauses into a d-DNNF, top-down, like an exhaustive DPLL search:
+    - unit clauses are propagated, and their literals conjoined with the rest
+    - clauses that share no variables are split into components, compiled separately and conjoined
+    - otherwise, the variable in most clauses is decided: (X and the rest with X) or (!X and the rest with !X)
+    Every residual clause set is compiled only once, the results are cached by the clause set itself
+    '''
+
+    def __init__(self):
+        super().__init__()
+        self._cache = {} # frozenset of clauses -> node
+        self.cache_hits = 0
+
+    def compile(self,clauses):
+        if not clauses:
+            return self.true
+        if frozenset() in clauses:
+            return self.false
+        cached = self._cache.get(clauses)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+
+        units = []
+        residual = clauses
+        while residual is not None:
+            unit = next((clause for clause in residual if len(clause) == 1),None)
+            if unit is None:
+                break
+            literal = next(iter(unit))
+            units.append(literal)
+            residual = self.__assign(residual,literal)
+
+        if residual is None:
+            result = self.false
+        elif units:
+            result = self.conjoin([self.literal(literal) for literal in units] + [self.compile(residual)])
+        else:
+            components = self.__components(residual)
+            if len(components) > 1:
+                result = self.conjoin([self.compile(component) for component in components])
+            else:
+                variable = self.__most_frequent(residual)
+                branches = []
+                for literal in (variable,-variable):
+                    rest = self.__assign(residual,literal)
+                    branches.append(self.false if rest is None else self.conjoin([self.literal(literal),self.compile(rest)]))
+                result = self.disjoin(variable,branches)
+
+        self._cache[clauses] = result
+        return result
+
+    def __assign(self,clauses,literal):
+        '''
+        The clauses left after making literal True, None if one of them becomes empty
+        '''
+        assigned = set()
+        for clause in clauses:
+            if literal in clause:
+                continue
+            if -literal in clause:
+                clause = clause - {-literal}
+                if not clause:
+                    return None
+            assigned.add(clause)
+        return frozenset(assigned)
+
+    def __components(self,clauses):
+        '''
+        Splits clauses into groups that don't share variables (connected components, with union-find)
+        '''
+        parent = {}
+
+        def find(variable):
+            while parent.setdefault(variable,variable) != variable:
+                parent[variable] = parent[parent[variable]]
+                variable = parent[variable]
+            return variable
+
+        for clause in clauses:
+            variables = [abs(literal) for literal in clause]
+            root = find(variables[0])
+            for variable in variables[1:]:
+                parent[find(variable)] = root
+
+        components = {}
+        for clause in clauses:
+            components.setdefault(find(abs(next(iter(clause)))),set()).add(clause)
+        return [frozenset(component) for component in components.values()]
+
+    def __most_frequent(self,clauses):
+        counts = {}
+        for clause in clauses:
+            for literal in clause:
+                counts[abs(literal)] = counts.get(abs(literal),0) + 1
+        return max(sorted(counts),key=lambda variable: counts[variable])
+
+
+class CompiledFormula:
+    '''
+    A formula compiled into decision-DNNF (see LogicToolkit.compile)
+    Compiling can take exponential time, but after that every question is answered
+    in a single pass over the nodes, in time linear in their number:
+    - condition: fix the values of some variables, gives a new CompiledFormula
+    - is_satisfiable, model_count
+    - entails: whether a literal is True in every model
+    It can be saved with dumps() and loaded back with CompiledFormula.loads(), in any process
+    '''
+
+    def __init__(self,variables,nodes,root,assigned=None):
+        self.variables = list(variables) # variable number - 1 -> name
+        self._numbers = {name : i + 1 for i,name in enumerate(self.variables)}
+        self._nodes = nodes
+        self._root = root
+        # variables fixed by condition(), they're not counted as free anymore
+        self.assigned = dict(assigned) if assigned is not None else {}
+
+    def __len__(self):
+        # children come before their parents, so every node the root uses is at or before it
+        return self._root + 1
+
+    def condition(self,values):
+        '''
+        Returns the formula with some variables fixed, values is a dict of name -> bool
+        Literal nodes of fixed variables become True or False, and the nodes above them are simplified
+        '''
+
+        fixed = {}
+        for name,value in values.items():
+            if name not in self._numbers:
+                raise ValueError("Unknown variable: " + str(name))
+            if type(value) != bool:
+                raise ValueError("Values have to be True or False")
+            fixed[self._numbers[name]] = value
+
+        builder = _Builder()
+        mapping = []
+        for node in self._nodes[:self._root + 1]:
+            kind = node[0]
+            if kind == "true":
+                mapping.append(builder.true)
+            elif kind == "false":
+                mapping.append(builder.false)
+            elif kind == "literal":
+                variable = abs(node[1])
+                if variable in fixed:
+                    mapping.append(builder.true if fixed[variable] == (node[1] > 0) else builder.false)
+                else:
+                    mapping.append(builder.literal(node[1]))
+            elif kind == "and":
+                mapping.append(builder.conjoin([mapping[child] for child in node[1]]))
+            else:
+                mapping.append(builder.disjoin(node[1],[mapping[child] for child in node[2]]))
+
+        assigned = dict(self.assigned)
+        assigned.update(values)
+        return CompiledFormula(self.variables,builder.nodes,mapping[self._root],assigned)
+
+    def is_satisfiable(self):
+        '''
+        Checks whether the formula has a model: an and-node needs all of its children satisfiable
+        (they share no variables, so they can be satisfied together), an or-node needs one
+        '''
+        satisfiable = []
+        for node in self._nodes[:self._root + 1]:
+            kind = node[0]
+            if kind == "and":
+                satisfiable.append(all(satisfiable[child] for child in node[1]))
+            elif kind == "or":
+                satisfiable.append(any(satisfiable[child] for child in node[2]))
+            else:
+                satisfiable.append(kind != "false")
+        return satisfiable[self._root]
+
+    def model_count(self):
+        '''
+        Counts the models over the variables that aren't fixed
+        Children of an and-node share no variables, so their counts multiply,
+        children of an or-node share no models, so their counts add up,
+        after counting each over the or-node's variables (a variable a child doesn't mention doubles its count)
+        '''
+
+        counts = []
+        variables = []
+        for node in self._nodes[:self._root + 1]:
+            kind = node[0]
+            if kind == "true" or kind == "false":
+                counts.append(int(kind == "true"))
+                variables.append(frozenset())
+            elif kind == "literal":
+                counts.append(1)
+                variables.append(frozenset([abs(node[1])]))
+            elif kind == "and":
+                count = 1
+                for child in node[1]:
+                    count *= counts[child]
+                counts.append(count)
+                variables.append(frozenset().union(*[variables[child] for child in node[1]]))
+            else:
+                union = frozenset().union(*[variables[child] for child in node[2]])
+                counts.append(sum(counts[child] << (len(union) - len(variables[child])) for child in node[2]))
+                variables.append(union)
+
+        free = len(self.variables) - len(self.assigned)
+        return counts[self._root] << (free - len(variables[self._root]))
+
+    def entails(self,literal):
+        '''
+        Checks whether a literal ('A' or '!A') is True in every model of the formula
+        That's the case when the formula with the literal made False has no models
+        '''
+        name = literal[1:] if literal.startswith("!") else literal
+        return not self.condition({name : literal.startswith("!")}).is_satisfiable()
+
+    def implied_literals(self):
+        '''
+        Returns the literals (as strings) that are True in every model, for the variables that aren't fixed
+        An unsatisfiable formula implies everything, so it returns an empty list instead
+        '''
+        if not self.is_satisfiable():
+            return []
+        implied = []
+        for name in self.variables:
+            if name in self.assigned:
+                continue
+            for literal in (name,"!" + name):
+                if self.entails(literal):
+                    implied.append(literal)
+        return implied
+
+    def dumps(self):
+        '''
+        Returns the compiled formula as a JSON string, see CompiledFormula.loads
+        '''
+        import json
+        nodes = []
+        for node in self._nodes[:self._root + 1]:
+            if node[0] == "and":
+                nodes.append([node[0],list(node[1])])
+            elif node[0] == "or":
+                nodes.append([node[0],node[1],list(node[2])])
+            else:
+                nodes.append(list(node))
+        return json.dumps({"format" : "d-dnnf", "version" : FORMAT_VERSION, "variables" : self.variables,
+            "assigned" : self.assigned, "root" : self._root, "nodes" : nodes})
+
+    @classmethod
+    def loads(cls,text):
+        '''
+        Loads a compiled formula saved with dumps()
+        Raises ValueError if it isn't one, or was saved by an incompatible version
+        '''
+
+        import json
+        data = json.loads(text)
+        if type(data) != dict or data.get("format") != "d-dnnf" or data.get("version") != FORMAT_VERSION:
+            raise ValueError("Not a compiled formula of version " + str(FORMAT_VERSION))
+
+        nodes = []
+        for position,node in enumerate(data["nodes"]):
+            kind = node[0]
+            if kind == "true" or kind == "false":
+                nodes.append((kind,))
+            elif kind == "literal":
+                if type(node[1]) != int or not 0 < abs(node[1]) <= len(data["variables"]):
+                    raise ValueError("Invalid literal in node " + str(position))
+                nodes.append((kind,node[1]))
+            elif kind == "and" or kind == "or":
+                children = tuple(node[-1])
+                if any(type(child) != int or not 0 <= child < position for child in children):
+                    raise ValueError("Invalid children in node " + str(position))
+                nodes.append((kind,children) if kind == "and" else (kind,node[1],children))
+            else:
+                raise ValueError("Unknown node kind: " + str(kind))
+        if not 0 <= data["root"] < len(nodes):
+            raise ValueError("Invalid root node")
+        return cls(data["variables"],nodes,data["root"],data["assigned"])
+
+
+def compile_clause_set(clause_set):
+    '''
+    Compiles a ClauseSet into a CompiledFormula
+    Returns it together with the number of times a residual clause set was found in the cache
+    '''
+    compiler = _Compiler()
+    root = compiler.compile(frozenset(frozenset(clause) for clause in clause_set))
+    return CompiledFormula(clause_set.variables,compiler.nodes,root),compiler.cache_hits
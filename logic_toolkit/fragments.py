@@ -0,0 +1,173 @@
+'''
+Satisfiability in polynomial time for fragments of propositional logic, see LogicToolkit.is_satisfiable
+- 2-CNF and Horn clauses, in linear time, the solvers take a ClauseSet
+- systems of parity constraints (exclusive ors / biconditionals), by Gaussian elimination
+Every solver returns a satisfying interpretation (a list of bools, in the order of the variables),
+or None if there is none
+'''
+
+
+def is_2cnf(clause_set):
+    '''
+    Every clause has at most two literals
+    '''
+    return all(len(clause) <= 2 for clause in clause_set)
+
+
+def is_horn(clause_set):
+    '''
+    Every clause has at most one positive literal, like the definite rules Q,T->S (!Qv!TvS)
+    '''
+    return all(sum(1 for literal in clause if literal > 0) <= 1 for clause in clause_set)
+
+
+def solve_2sat(clause_set):
+    '''
+    Solves a 2-CNF through its implication graph: a clause XvY means !X->Y and !Y->X
+    The clauses are unsatisfiable exactly when some variable and its negation imply each other,
+    which is when they're in the same strongly connected component (found with Tarjan's algorithm)
+    Otherwise, every variable is made True if its component comes after its negation's in topological order
+    '''
+
+    if clause_set.has_empty_clause():
+        return None
+    n = len(clause_set.variables)
+
+    def node(literal):
+        # A is node 0, !A node 1, B node 2, ...
+        return 2 * (abs(literal) - 1) + (literal < 0)
+
+    edges = [[] for _ in range(2 * n)]
+    for clause in clause_set:
+        first,second = clause if len(clause) == 2 else (clause[0],clause[0])
+        edges[node(-first)].append(node(second))
+        edges[node(-second)].append(node(first))
+
+    # Tarjan's algorithm, without recursion: components are numbered in reverse topological order
+    component = [-1] * (2 * n)
+    index = [-1] * (2 * n)
+    lowest = [0] * (2 * n)
+    on_stack = [False] * (2 * n)
+    stack = []
+    counter = 0
+    components = 0
+    for start in range(2 * n):
+        if index[start] != -1:
+            continue
+        work = [(start,0)]
+        while work:
+            current,edge = work.pop()
+            if edge == 0:
+                index[current] = lowest[current] = counter
+                counter += 1
+                stack.append(current)
+                on_stack[current] = True
+            if edge < len(edges[current]):
+                work.append((current,edge + 1))
+                following = edges[current][edge]
+                if index[following] == -1:
+                    work.append((following,0))
+                elif on_stack[following]:
+                    lowest[current] = min(lowest[current],index[following])
+                continue
+            if lowest[current] == index[current]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component[member] = components
+                    if member == current:
+                        break
+                components += 1
+            if work:
+                parent = work[-1][0]
+                lowest[parent] = min(lowest[parent],lowest[current])
+
+    values = []
+    for variable in range(n):
+        positive,negative = component[2 * variable],component[2 * variable + 1]
+        if positive == negative:
+            return None
+        values.append(positive < negative)
+    return values
+
+
+def solve_horn(clause_set):
+    '''
+    Solves Horn clauses by marking: every variable starts False, and a variable is made True
+    only when a clause forces it, that is when all the variables negated in the clause are True already
+    A clause with no positive literal whose negated variables all become True can't be satisfied
+    Every clause keeps a count of its negated variables that are still False, so it's looked at
+    once per variable it mentions, which makes the whole search linear in the size of the clauses
+    '''
+
+    if clause_set.has_empty_clause():
+        return None
+    n = len(clause_set.variables)
+    values = [False] * n
+    waiting = [] # clause -> how many of its negated variables are still False
+    heads = [] # clause -> its positive literal, None if it has none
+    watchers = [[] for _ in range(n)] # variable - 1 -> clauses it's negated in
+    queue = []
+
+    for i,clause in enumerate(clause_set):
+        negated = [-literal for literal in clause if literal < 0]
+        positive = [literal for literal in clause if literal > 0]
+        waiting.append(len(negated))
+        heads.append(positive[0] if positive else None)
+        for variable in negated:
+            watchers[variable - 1].append(i)
+        if not negated:
+            queue.append(i)
+
+    while queue:
+        head = heads[queue.pop()]
+        if head is None:
+            return None
+        if values[head - 1]:
+            continue
+        values[head - 1] = True
+        for i in watchers[head - 1]:
+            waiting[i] -= 1
+            if waiting[i] == 0:
+                queue.append(i)
+    return values
+
+
+def solve_parity(constraints,variables):
+    '''
+    Solves parity constraints, each a (variables, parity) pair saying that an odd (parity True)
+    or even (parity False) number of the variables are True, for example AxB is ({'A','B'}, True)
+    That's a system of linear equations over GF(2), solved by Gaussian elimination:
+    every equation is a bit mask of its variables, reduced by the equations kept so far
+    until its lowest variable isn't the pivot of any of them. An equation reduced to nothing
+    with parity True (0 = 1) makes the system unsatisfiable. Variables that aren't a pivot are False
+    '''
+
+    index = {name : i for i,name in enumerate(variables)}
+    pivots = {} # lowest bit of an equation -> (mask, parity)
+    for names,parity in constraints:
+        mask = 0
+        for name in names:
+            mask ^= 1 << index[name]
+        while mask:
+            bit = mask & -mask
+            if bit not in pivots:
+                pivots[bit] = (mask,parity)
+                break
+            mask ^= pivots[bit][0]
+            parity ^= pivots[bit][1]
+        else:
+            if parity:
+                return None
+
+    # every other variable of an equation is above its pivot, so the values are found from the top down
+    values = [False] * len(variables)
+    for bit in sorted(pivots,reverse=True):
+        mask,parity = pivots[bit]
+        rest = mask ^ bit
+        while rest:
+            other = rest & -rest
+            parity ^= values[other.bit_length() - 1]
+            rest ^= other
+        values[bit.bit_length() - 1] = parity
+    return values
@@ -0,0 +1,252 @@
+from itertools import product
+
+
+class Minimizer:
+    '''
+    Finds small sums of products (DNFs) for a function over a fixed list of variables
+
+    Terms are cubes: strings with one character per variable, '1' for the variable, '0' for its negation,
+    and '-' if the variable isn't in the term. Over variables A,B,C the cube '1-0' is Aa!C
+
+    Two methods are available:
+    - exact: Quine-McCluskey finds all prime implicants from the true minterms,
+      then the essential ones are taken and Petrick's method picks the fewest of the rest covering everything.
+      It needs the full truth table, so it's only used for a few variables
+    - heuristic: in the style of Espresso, starts from any cover of the function
+      and repeatedly expands every term as far as it goes without covering a false point,
+      then drops the terms that the others already cover.
+      It never looks at the truth table, the false points are given as a cover too
+    A product of sums (CNF) is found by minimizing the negated function, see LogicToolkit.minimize
+    '''
+
+    # Petrick's method multiplies out a product of sums, this many products at most are kept around
+    # past that, the remaining minterms are covered greedily instead
+    PETRICK_LIMIT = 5000
+
+    # for sorting cubes, see __sorted
+    ORDER = str.maketrans("10-","012")
+
+    def __init__(self,variables):
+        self.variables = list(variables)
+
+    def exact(self,minterms):
+        '''
+        Quine-McCluskey with Petrick's method
+        minterms are the true points, as tuples of bools in the order of self.variables
+        Returns a minimal list of cubes, and whether Petrick's method had to fall back to a greedy cover
+        '''
+
+        on_set = {"".join("1" if value else "0" for value in minterm) for minterm in minterms}
+        if not on_set:
+            return [],False
+
+        primes = self.__prime_implicants(on_set)
+
+        # the prime implicants covering every minterm
+        covering = {minterm : [prime for prime in primes if self.__covers(prime,minterm)] for minterm in on_set}
+
+        # essential prime implicants are the only ones covering some minterm
+        chosen = {options[0] for options in covering.values() if len(options) == 1}
+        remaining = [minterm for minterm,options in covering.items()
+            if not any(prime in chosen for prime in options)]
+        if not remaining:
+            return self.__sorted(chosen),False
+
+        cover,greedy = self.__petrick([covering[minterm] for minterm in remaining])
+        return self.__sorted(chosen | cover),greedy
+
+    def __prime_implicants(self,on_set):
+        '''
+        Merges cubes that differ in a single variable ('101' and '111' become '1-1') until nothing merges,
+        the cubes that never merged are the prime implicants
+        Only cubes with the same dashes and a difference of one in their number of 1s can merge,
+        so cubes are grouped by those first
+        '''
+
+        primes = set()
+        cubes = set(on_set)
+        while cubes:
+            groups = {}
+            for cube in cubes:
+                groups.setdefault((cube.replace("1","0"),cube.count("1")),[]).append(cube)
+
+            merged = set()
+            used = set()
+            for (shape,ones),group in groups.items():
+                for other in groups.get((shape,ones + 1),()):
+                    for cube in group:
+                        difference = [i for i in range(len(cube)) if cube[i] != other[i]]
+                        if len(difference) == 1:
+                            i = difference[0]
+                            merged.add(cube[:i] + "-" + cube[i+1:])
+                            used.add(cube)
+                            used.add(other)
+            primes |= cubes - used
+            cubes = merged
+        return primes
+
+    def __petrick(self,options):
+        '''
+        Petrick's method: options holds, for every minterm left to cover, the prime implicants covering it
+        Multiplies out the product of those sums, keeping only the products no other product is part of,
+        and returns the cheapest (fewest terms, then fewest literals)
+        '''
+
+        products = {frozenset()}
+        for choices in sorted(options,key=len):
+            expanded = set()
+            for chosen in products:
+                if any(prime in chosen for prime in choices):
+                    expanded.add(chosen)
+                else:
+                    for prime in choices:
+                        expanded.add(chosen | {prime})
+            # absorption: XaY isn't needed next to X
+            products = {chosen for chosen in expanded if not any(other < chosen for other in expanded)}
+            if len(products) > self.PETRICK_LIMIT:
+                return self.__greedy_cover(options),True
+
+        best = min(products,key=lambda chosen: (len(chosen),self.__literal_count(chosen),sorted(chosen)))
+        return set(best),False
+
+    def __greedy_cover(self,options):
+        '''
+        Covers the minterms by repeatedly taking the prime implicant covering most of the ones still uncovered
+        '''
+
+        uncovered = list(range(len(options)))
+        chosen = set()
+        while uncovered:
+            counts = {}
+            for i in uncovered:
+                for prime in options[i]:
+                    counts[prime] = counts.get(prime,0) + 1
+            best = max(sorted(counts),key=lambda prime: (counts[prime],prime.count("-")))
+            chosen.add(best)
+            uncovered = [i for i in uncovered if best not in options[i]]
+        return chosen
+
+    def heuristic(self,on_cubes,off_cubes):
+        '''
+        Espresso-style minimization
+        on_cubes cover the true points (for example the terms of a DNF), off_cubes cover the false points
+        Returns a list of prime implicants covering the same true points, usually close to the fewest possible
+        '''
+
+        cover = self.__irredundant(self.__expand(list(on_cubes),off_cubes))
+        while True:
+            # reduces every term back to the part only it covers, then expands it again,
+            # possibly in a different direction, keeping the result only if it's smaller
+            reduced = self.__reduce(cover)
+            candidate = self.__irredundant(self.__expand(reduced,off_cubes))
+            if self.__cost(candidate) >= self.__cost(cover):
+                return self.__sorted(cover)
+            cover = candidate
+
+    def __expand(self,cubes,off_cubes):
+        '''
+        Removes literals from every cube as long as it stays clear of all the false points
+        Bigger cubes go first, and a cube already inside an expanded one is dropped
+        '''
+
+        expanded = []
+        for cube in sorted(cubes,key=lambda cube: (-cube.count("-"),cube)):
+            if any(self.__contains(done,cube) for done in expanded):
+                continue
+            for i in range(len(cube)):
+                if cube[i] == "-":
+                    continue
+                wider = cube[:i] + "-" + cube[i+1:]
+                if not any(self.__intersects(wider,off_cube) for off_cube in off_cubes):
+                    cube = wider
+            expanded.append(cube)
+        return [cube for i,cube in enumerate(expanded)
+            if not any(self.__contains(other,cube) for j,other in enumerate(expanded) if j != i and other != cube)]
+
+    def __irredundant(self,cubes):
+        '''
+        Drops every cube that the rest of the cover already covers, starting with the ones with most literals
+        '''
+
+        cover = list(dict.fromkeys(cubes))
+        for cube in sorted(cover,key=lambda cube: (cube.count("-"),cube)):
+            rest = [other for other in cover if other != cube]
+            if self.__covers_cube(rest,cube):
+                cover = rest
+        return cover
+
+    def __reduce(self,cubes):
+        '''
+        Shrinks every cube to the smallest cube containing the points only it covers
+        '''
+
+        reduced = []
+        for i,cube in enumerate(cubes):
+            rest = reduced + cubes[i+1:]
+            for j in range(len(cube)):
+                if cube[j] != "-":
+                    continue
+                for value in "01":
+                    # if one half of the cube is covered by the rest, the cube shrinks to the other half
+                    half = cube[:j] + value + cube[j+1:]
+                    if self.__covers_cube(rest,half):
+                        cube = cube[:j] + ("1" if value == "0" else "0") + cube[j+1:]
+                        break
+            reduced.append(cube)
+        return reduced
+
+    def __covers_cube(self,cover,cube):
+        '''
+        Checks whether the cubes of cover together contain every point of cube
+        That's the case when cover, restricted to cube (the cofactor), is a tautology
+        '''
+
+        cofactor = []
+        for other in cover:
+            if self.__intersects(other,cube):
+                cofactor.append("".join("-" if c != "-" else o for o,c in zip(other,cube)))
+        return self.__is_tautology(cofactor)
+
+    def __is_tautology(self,cubes):
+        '''
+        Checks whether a list of cubes covers every point, by splitting on the variable used in most cubes
+        '''
+
+        if not cubes:
+            return False
+        if any(cube.count("-") == len(cube) for cube in cubes):
+            return True
+
+        n = len(cubes[0])
+        used = [sum(1 for cube in cubes if cube[i] != "-") for i in range(n)]
+        i = max(range(n),key=lambda i: used[i])
+        for value in "01":
+            half = [cube[:i] + "-" + cube[i+1:] for cube in cubes if cube[i] != ("1" if value == "0" else "0")]
+            if not self.__is_tautology(half):
+                return False
+        return True
+
+    def __covers(self,cube,minterm):
+        return all(c == "-" or c == m for c,m in zip(cube,minterm))
+
+    def __contains(self,outer,inner):
+        return all(o == "-" or o == i for o,i in zip(outer,inner))
+
+    def __intersects(self,first,second):
+        return all(f == "-" or s == "-" or f == s for f,s in zip(first,second))
+
+    def __literal_count(self,cubes):
+        return sum(len(cube) - cube.count("-") for cube in cubes)
+
+    def __cost(self,cubes):
+        return (len(cubes),self.__literal_count(cubes))
+
+    def __sorted(self,cubes):
+        # bigger cubes first, then in the order of the variables, with a variable before its negation
+        return sorted(cubes,key=lambda cube: (-cube.count("-"),cube.translate(self.ORDER)))
+
+    def minterms(self,function):
+        '''
+        Returns the points where function (taking a tuple of bools) is true, in the order of self.variables
+        '''
+        return [values for values in product([True,False],repeat=len(self.variables)) if function(values)]
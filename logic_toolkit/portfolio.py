@@ -0,0 +1,178 @@
+import multiprocessing
+import queue
+from time import perf_counter
+
+from .sat import SatSession
+from .toolkit import LogicToolkit
+
+
+def _truth_table(f_list):
+    # Gray-code enumeration, stops at the first model (see ClauseSet.models)
+    return next(LogicToolkit().to_clause_set(f_list).models(),None) is not None
+
+
+def _search(f_list):
+    # CDCL search (see SatSession)
+    session = SatSession()
+    session.add_formula(f_list)
+    return session.solve()
+
+
+def _compiled(f_list):
+    # compiled into d-DNNF (see LogicToolkit.compile), the structured counterpart of a BDD
+    return LogicToolkit().compile(f_list).is_satisfiable()
+
+
+def _race(engine,f_list,answers):
+    '''
+    Runs in a process of its own, puts (engine, answer) in the answers queue,
+    or (engine, None) if the engine failed
+    '''
+    try:
+        answers.put((engine,Portfolio.ENGINES[engine](f_list)))
+    except Exception:
+        answers.put((engine,None))
+
+
+class Portfolio:
+    '''
+    Answers satisfiability by racing several engines, each in its own process (see LogicToolkit.use_portfolio)
+    No engine is best on every formula: the truth table on tiny ones, search on big sparse ones,
+    compilation on structured ones. The first definitive answer wins, and the other processes are terminated
+
+    Every race is recorded under the shape of its formula (how many variables and nodes it has, roughly),
+    in wins: shape -> {engine : races won}. Once a shape has been raced MIN_RACES times and one engine
+    won at least DOMINANCE of them, it's started first, and the others only join the race
+    if it hasn't answered after HEAD_START seconds (or half of the time left, whichever is shorter)
+    wins holds only strings and numbers, so it can be saved as JSON and given back to a new Portfolio
+    '''
+
+    ENGINES = {"truth_table" : _truth_table, "search" : _search, "compiled" : _compiled}
+    MIN_RACES = 5
+    DOMINANCE = 0.75
+    # seconds between checks of the deadline while waiting for an answer
+    POLL_INTERVAL = 0.05
+    # seconds the engine that usually wins runs alone before the others join the race
+    HEAD_START = 0.5
+
+    def __init__(self,engines=None,*,timeout=None,wins=None,learn=True):
+        '''
+        engines are the names of the engines to race, all of ENGINES by default
+        timeout is the default deadline of a race, in seconds
+        learn turns the per-shape dispatch on, races are recorded in wins either way
+        '''
+
+        self.engines = list(engines) if engines is not None else list(self.ENGINES)
+        for engine in self.engines:
+            if engine not in self.ENGINES:
+                raise ValueError("Unknown engine: " + str(engine))
+        if timeout is not None and (type(timeout) not in (int,float) or timeout < 0):
+            raise ValueError("timeout has to be a non-negative number")
+        self.timeout = timeout
+        self.wins = wins if wins is not None else {}
+        self.learn = learn
+        self.last_winner = None
+
+    def shape(self,f_list):
+        '''
+        A rough description of a formula, formulas with the same one tend to favour the same engine:
+        the number of variables and of nodes, each rounded to a power of two, like "v8-n64"
+        '''
+        variables = set()
+        nodes = 0
+        stack = [f_list]
+        while stack:
+            part = stack.pop()
+            nodes += 1
+            if type(part) == list:
+                stack.extend(part)
+            elif type(part) == str and part != '!' and part not in LogicToolkit.CONNECTIVES:
+                variables.add(part)
+        return "v" + str(2**len(variables).bit_length()) + "-n" + str(2**nodes.bit_length())
+
+    def predict(self,shape):
+        '''
+        Returns the engine that usually wins for a shape, or None if no engine does yet
+        '''
+        record = self.wins.get(shape,{})
+        races = sum(record.values())
+        if races < self.MIN_RACES:
+            return None
+        engine = max(sorted(record),key=lambda engine: record[engine])
+        if engine in self.engines and record[engine] >= self.DOMINANCE * races:
+            return engine
+        return None
+
+    def solve(self,f_list,timeout=None):
+        '''
+        Checks whether an f_list is satisfiable, returns (answer, engine that gave it)
+        Raises TimeoutError if no engine answers before the deadline (timeout, or self.timeout),
+        and RuntimeError if every engine failed without answering
+        '''
+
+        timeout = timeout if timeout is not None else self.timeout
+        deadline = None if timeout is None else perf_counter() + timeout
+        shape = self.shape(f_list)
+
+        predicted = self.predict(shape) if self.learn else None
+        if predicted is None:
+            answer = self.__race(self.engines,f_list,deadline,0)
+        else:
+            # the predicted engine gets a head start, at most half of the time left, then the rest join the race
+            head_start = self.HEAD_START if deadline is None else min(self.HEAD_START,(deadline - perf_counter()) / 2)
+            engines = [predicted] + [engine for engine in self.engines if engine != predicted]
+            answer = self.__race(engines,f_list,deadline,head_start)
+
+        record = self.wins.setdefault(shape,{})
+        record[answer[1]] = record.get(answer[1],0) + 1
+        self.last_winner = answer[1]
+        return answer
+
+    def __race(self,engines,f_list,deadline,head_start):
+        '''
+        Starts a process per engine, returns the first (answer, engine)
+        With a head start, the first engine runs alone until it's over (or the engine failed), then the others start
+        Raises TimeoutError when the deadline passes, RuntimeError when every engine ended without answering
+        The processes still running are terminated either way
+        '''
+
+        answers = multiprocessing.Queue()
+        waiting = list(engines)
+        processes = []
+        ended = 0 # processes that put their (engine, None) in the queue
+
+        def start(count):
+            for engine in waiting[:count]:
+                process = multiprocessing.Process(target=_race,args=(engine,f_list,answers),daemon=True)
+                process.start()
+                processes.append(process)
+            del waiting[:count]
+
+        start(1 if head_start > 0 else len(waiting))
+        joining = perf_counter() + head_start
+        try:
+            while True:
+                # all of them ended, also when killed by the system without putting anything in the queue
+                done = ended == len(processes) or (not any(process.is_alive() for process in processes)
+                    and answers.empty())
+                if waiting and (done or perf_counter() >= joining):
+                    start(len(waiting))
+                    continue
+                if done:
+                    raise RuntimeError("Every engine failed without answering")
+                if deadline is not None and perf_counter() >= deadline:
+                    raise TimeoutError("No engine answered before the deadline")
+                try:
+                    engine,answer = answers.get(timeout=self.POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if answer is not None:
+                    return answer,engine
+                ended += 1
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            for process in processes:
+                process.join()
+            answers.close()
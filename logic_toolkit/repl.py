@@ -0,0 +1,276 @@
+from .console import padded_print
+from .toolkit import LogicToolkit
+
+
+valid_commands = ["help","debugging","stats","is-tautology","is-contradiction","is-satisfiable",
+    "to-cnf","to-dnf","add-rule","get-rules-from","list-rules", "clear-rules","query","make-random", "quit"]
+command_descriptions = {
+    "help" : "Shows the list of valid commands, or info about a command, if called with the command's name",
+    "debugging" : "Call 'debugging on' or 'debugging off' to turn debugging messages on or off.\n" + 
+        "These are messages that describe the steps the program is currently going through",
+    "stats" : "Call 'stats on' or 'stats off' to start or stop collecting statistics about CNF / DNF conversions,\n" + 
+        "'stats' to see them (calls, rewrites, time and formula sizes for every pass), or 'stats reset' to clear them",
+    "is-tautology" : "Call 'is-tautology some-logic-formula' to check whether that formula is a tautology",
+    "is-contradiction" : "Call 'is-contradiction some-logic-formula' to check whether that formula is a contradiction",
+    "is-satisfiable" : "Call 'is-satisfiable some-logic-formula' to check whether that formula is satisfiable",
+    "to-cnf" : "Call 'to-cnf some-logic-formula' to turn it into its CNF form, and see the result",
+    "to-dnf" : "Call 'to-dnf some-logic-formula' to turn it into its DNF form, and see the result",
+    "add-rule" : "Call 'add-rule some-rule' to add a rule to the program's set of known rules.\n" + 
+        "This is used for making queries, which means asking if, given the rules, a given literal is definitely True.\n" + 
+        "Enter rules in this form: 'A', 'A->B', 'A,B->C', etc.\n" + 
+        "Rules about predicates work too: 'edge(a,b)', 'edge(X,Y)->reach(X,Y)', 'reach(X,Y),edge(Y,Z)->reach(X,Z)'",
+    "get-rules-from" : "Call 'add-rules-from some-logic-formula' to extract definite rules from the given formula",
+    "list-rules" : "Call 'list-rules' to see the program's known rules",
+    "clear-rules" : "Call 'clear-rules' to clear the program's known rules",
+    "query" : "Call 'query some-literal' to query the program about the given literal.\n" + 
+        "This means asking whether that given literal is definitely True, given the known rules\n"
+        "Only a single, uppercase letter is considered a valid input,\n" + 
+        "or a predicate like 'reach(a,Z)', which lists the values of Z that make it True",
+    "make-random" : "Call 'make-random' to generate a random logical formula"
+    
+}
+
+
+def print_valid_commands():
+    '''
+    Prints the list of valid commands to the console
+    '''
+
+    padded_print("Here is a list of available commands:")
+    print(valid_commands[0],end="")
+    for vc in valid_commands[1:]:
+        print(", "+vc,end="")
+
+
+def main():
+    '''
+    Runs the interactive command prompt
+    '''
+
+    ltk = LogicToolkit()
+
+    padded_print("Welcome to LogicToolkit, a toolkit for working with logical formulas by Tadeas Paule")
+    print()
+    padded_print("Use the following notation to write formulas:")
+    padded_print("Single, uppercase characters for literals, for example A, B")
+    padded_print("'a'  - conjunction, for example AaB, AaBaC")
+    padded_print("'v'  - disjunction, for example Av(BaC)")
+    padded_print("'!'  - negation, for example !A, !(AvB)")
+    padded_print("'x'  - exclusive or, for example AxB, AxBxC")
+    padded_print("'->' - implication, for example A->B, A->(BvC)")
+    padded_print("'<->' - biconditional, for example A<->B, A<->(BaC)")
+    print()
+    print_valid_commands()
+    print()
+    while True:
+        print()
+        input_words = input("  > ").split(" ")
+        if input_words[0] not in valid_commands:
+            padded_print("Command not recognised")
+            print_valid_commands()
+            print()
+        else:
+            if len(input_words) == 0:
+                continue
+            command = input_words[0].replace(" ","")
+            if len(input_words) > 1:
+                second = input_words[1].replace(" ","")
+            else:
+                second = None
+        
+
+            if command == "help":
+                if second is None:
+                    padded_print("LogicProgram is a toolkit for working with logical formulas")
+                    print_valid_commands()
+                    print()
+                    padded_print("If you want to know what a command does, enter 'help command-name', for example 'help to-cnf'")
+                else:
+                    padded_print(command_descriptions.get(second,second + " is not a valid command name"))
+        
+            elif command == "debugging":
+                if second is None or second not in ["on", "off"]:
+                    padded_print("You have to call either 'debugging on' or 'debugging off'")
+                elif second == "on":
+                    ltk._debugging = True
+                    padded_print("Debugging messages turned on")
+                else:
+                    ltk._debugging = False
+                    padded_print("Debugging messages turned off")
+
+            elif command == "stats":
+                if second == "on":
+                    ltk._collecting_stats = True
+                    padded_print("Collecting statistics turned on")
+                elif second == "off":
+                    ltk._collecting_stats = False
+                    padded_print("Collecting statistics turned off")
+                elif second == "reset":
+                    ltk.reset_stats()
+                    padded_print("Statistics cleared")
+                elif second is not None:
+                    padded_print("You have to call 'stats', 'stats on', 'stats off' or 'stats reset'")
+                elif len(ltk.stats()) == 0:
+                    padded_print("No statistics collected, call 'stats on' first")
+                else:
+                    for name,record in ltk.stats().items():
+                        if name == "satisfiability":
+                            # not a pass, it counts the engines that were picked instead
+                            engines = [engine + " " + str(count) for engine,count in record.items()
+                                if engine not in ("calls","seconds") and count > 0]
+                            padded_print(name + ": " + str(record["calls"]) + " calls, " + 
+                                "%.3f ms, " % (record["seconds"]*1000) + "engines: " + ", ".join(engines))
+                            continue
+                        padded_print(name + ": " + str(record["calls"]) + " calls, " + str(record["rewrites"]) + " rewrites, " + 
+                            "%.3f ms, " % (record["seconds"]*1000) + str(record["nodes_before"]) + " -> " + 
+                            str(record["nodes_after"]) + " nodes, largest " + str(record["max_nodes"]))
+        
+            elif command == "is-tautology":
+                if second is None:
+                    padded_print("You have to specify a logical formula")
+                else:
+                    is_valid = ltk._is_valid_formula(second)
+                
+                    if not is_valid:
+                        padded_print(second + " is not a valid logical formula")
+                    else:
+                        f_list = ltk.formula_to_list(second)
+                        is_tautology = ltk.is_tautology(f_list)
+                        msg = second + " is a tautology" if is_tautology else second + " is not a tautology"
+                        padded_print(msg)
+        
+            elif command == "is-contradiction":
+                if second is None:
+                    padded_print("You have to specify a logical formula")
+                else:
+                    is_valid = ltk._is_valid_formula(second)
+                
+                    if not is_valid:
+                        padded_print(second + " is not a valid logical formula")
+                    else:
+                        f_list = ltk.formula_to_list(second)
+                        is_contradiction = ltk.is_contradiction(f_list)
+                        msg = second + " is a contradiction" if is_contradiction else second + " is not a contradiction"
+                        padded_print(msg)
+        
+            elif command == "is-satisfiable":
+                if second is None:
+                    padded_print("You have to specify a logical formula")
+                else:
+                    is_valid = ltk._is_valid_formula(second)
+                
+                    if not is_valid:
+                        padded_print(second + " is not a valid logical formula")
+                    else:
+                        f_list = ltk.formula_to_list(second)
+                        is_satisfiable = ltk.is_satisfiable(f_list)
+                        msg = second + " is satisfiable" if is_satisfiable else second + " is not satisfiable"
+                        padded_print(msg)
+        
+            elif command == "to-cnf":
+                if second is None:
+                    padded_print("You have to specify a logical formula")
+                else:
+                    is_valid = ltk._is_valid_formula(second)
+                
+                    if not is_valid:
+                        padded_print(second + " is not a valid logical formula")
+                    else:
+                        f_list = ltk.formula_to_list(second)
+                        padded_print(ltk.to_cnf(f_list,return_string=True))
+        
+            elif command == "to-dnf":
+                if second is None:
+                    padded_print("You have to specify a logical formula")
+                else:
+                    is_valid = ltk._is_valid_formula(second)
+                
+                    if not is_valid:
+                        padded_print(second + " is not a valid logical formula")
+                    else:
+                        f_list = ltk.formula_to_list(second)
+                        padded_print(ltk.to_dnf(f_list,return_string=True))
+        
+            elif command == "add-rule":
+                if second is None:
+                    padded_print("You have to specify a rule")
+                else:
+                    is_valid = ltk._is_valid_rule(second)
+                    if is_valid:
+                        # a valid datalog rule can still clash with the others (arities, negation through a cycle)
+                        try:
+                            ltk.add_rule(second)
+                        except ValueError as e:
+                            padded_print(str(e))
+                        else:
+                            padded_print("Rule added")
+                    else:
+                        padded_print("Invalid rule entered")
+                        padded_print("Enter rules in this form: 'A', 'A->B', 'A,B->C', etc.")
+                    
+        
+            elif command == "get-rules-from":
+                if second is None:
+                    padded_print("You have to specify a logical formula")
+                else:
+                    is_valid = ltk._is_valid_formula(second)
+                
+                    if not is_valid:
+                        padded_print(second + " is not a valid logical formula")
+                    else:
+                        ltk.string_to_definite_rules(second)
+                        padded_print("The formula has been processed for definite rules")
+        
+            elif command == "list-rules":
+                for k,v in ltk._definite_rules.items():
+                    if type(v) == list:
+                        for option in ltk._definite_rules[k]:
+                            padded_print(option + " -> " + k)
+                    else:
+                        padded_print("-> " + k)
+                if ltk._datalog is not None:
+                    for rule in ltk._datalog.rules():
+                        padded_print(rule)
+        
+            elif command == "clear-rules":
+                ltk._definite_rules = {}
+                ltk._known_literals = set()
+                ltk._datalog = None
+                padded_print("The program's rules have been cleared")
+        
+            elif command == "query":
+                if second is None:
+                    padded_print("You have to specify a literal")
+                elif "(" in second:
+                    try:
+                        result = ltk.make_query(second)
+                    except ValueError as e:
+                        padded_print(str(e))
+                    else:
+                        if type(result) == bool:
+                            padded_print(second + " is definitely True" if result else second + " is not definitely True")
+                        elif len(result) == 0:
+                            padded_print("No answers")
+                        else:
+                            for answer in result:
+                                padded_print(", ".join(name + " = " + value for name,value in answer.items()))
+                elif type(second) != str or len(second) > 1 or not second.isupper():
+                    padded_print("Invalid input")
+                    padded_print("Only a single, uppercase letter is considered a valid input")
+                else:
+                    result = ltk.make_query(second)
+                    msg = second + " is definitely True" if result else second + " is not definitely True"
+                    padded_print(msg)
+
+            elif command == "make-random":
+                padded_print(ltk.make_random_formula())
+        
+        
+            elif command == "quit":
+                print()
+                padded_print("Thank you for trying LogicProgram.")
+                break
+        
+        
+            else:
+                padded_print(command + " is not a valid command")
@@ -0,0 +1,364 @@
+from .toolkit import LogicToolkit
+
+
+class SatSession:
+    '''
+    A satisfiability solver that keeps its state between questions, for asking many related ones
+
+    - Clauses (or whole formulas) are added incrementally, they're never parsed or converted again
+    - solve(assumptions) answers whether the clauses are satisfiable when the assumed literals are True,
+      without adding those literals as clauses
+    - push() opens a scope and pop() throws away every clause added since the matching push()
+    - What the solver learns while solving (learned clauses, which variables were involved in conflicts,
+      the last value of every variable) is kept for the following calls
+
+    It's a CDCL solver (conflict-driven clause learning): it assigns variables one by one,
+    propagates unit clauses using two watched literals per clause, and on a conflict learns a new clause
+    (the first unique implication point) and jumps back to the level where that clause becomes unit.
+    Variables that took part in recent conflicts are tried first, and the search restarts now and then.
+
+    Scopes work with a selector variable each: a clause added inside a scope gets the negated selector,
+    and the selector is assumed True while solving. pop() makes the selector False for good,
+    which switches its clauses off, together with any learned clause that came from them.
+    '''
+
+    # activities of variables are multiplied by this after every conflict (by growing the increment instead)
+    ACTIVITY_DECAY = 0.95
+    # conflicts before the first restart, and how much that number grows after each restart
+    RESTART_FIRST = 100
+    RESTART_GROWTH = 1.5
+
+    def __init__(self,toolkit=None):
+        '''
+        toolkit is the LogicToolkit used to turn formulas into clauses, a new one by default
+        '''
+        self._toolkit = toolkit if toolkit is not None else LogicToolkit()
+
+        self._names = [None] # variable number -> name, None for selectors (variable 0 isn't used)
+        self._numbers = {} # name -> variable number
+
+        # per variable: value (None if unassigned), decision level, the clause that implied it, activity,
+        # and the value it had last (tried first when it's picked again)
+        self._values = [None]
+        self._levels = [0]
+        self._reasons = [None]
+        self._activity = [0.0]
+        self._phases = [False]
+        self._increment = 1.0
+
+        self._watches = {} # literal -> clauses watching it, they're looked at when the literal becomes False
+        self._clauses = []
+        self._learned = []
+        self._trail = [] # assigned literals, in order
+        self._trail_limits = [] # where every decision level starts in the trail
+        self._head = 0 # the next literal in the trail to propagate
+
+        self._ok = True # False once the clauses are unsatisfiable with no assumptions at all
+        self._scopes = [] # selector variable of every open scope
+        self._model = None
+
+        self.stats = {"solves" : 0, "decisions" : 0, "propagations" : 0, "conflicts" : 0,
+            "learned" : 0, "restarts" : 0}
+
+    def __variable(self,name):
+        number = self._numbers.get(name)
+        if number is None:
+            number = self.__new_variable(name)
+            self._numbers[name] = number
+        return number
+
+    def __new_variable(self,name):
+        self._names.append(name)
+        self._values.append(None)
+        self._levels.append(0)
+        self._reasons.append(None)
+        self._activity.append(0.0)
+        self._phases.append(False)
+        return len(self._names) - 1
+
+    def __literal(self,literal):
+        '''
+        Turns a literal string like 'A' or '!A' into a signed variable number
+        '''
+        if type(literal) != str or literal in ("","!"):
+            raise ValueError("Invalid literal: " + repr(literal))
+        if literal.startswith("!"):
+            return -self.__variable(literal[1:])
+        return self.__variable(literal)
+
+    def __value(self,literal):
+        value = self._values[abs(literal)]
+        if value is None:
+            return None
+        return value if literal > 0 else not value
+
+    def add_clause(self,literals):
+        '''
+        Adds a clause, given as a list of literal strings, for example ['A','!B'] for Av!B
+        Inside a scope (see push), the clause is removed again by the matching pop
+        '''
+
+        clause = [self.__literal(literal) for literal in literals]
+        if self._scopes:
+            clause.append(-self._scopes[-1])
+        self.__cancel_until(0)
+        self.__add(clause)
+
+    def add_formula(self,formula):
+        '''
+        Adds a formula (string or f_list) by converting it to clauses, see LogicToolkit.to_clause_set
+        '''
+
+        clause_set = self._toolkit.to_clause_set(formula)
+        for clause in clause_set:
+            self.add_clause([clause_set.literal_name(literal) for literal in clause])
+
+    def __add(self,clause):
+        '''
+        Adds a clause of signed variable numbers, at decision level 0
+        Literals already False there are left out, and a clause that's already True isn't needed at all
+        '''
+
+        if not self._ok:
+            return
+        simplified = []
+        for literal in clause:
+            value = self.__value(literal)
+            if value is True or -literal in simplified:
+                return
+            if value is None and literal not in simplified:
+                simplified.append(literal)
+
+        if len(simplified) == 0:
+            self._ok = False
+        elif len(simplified) == 1:
+            self.__assign(simplified[0],None)
+            if self.__propagate() is not None:
+                self._ok = False
+        else:
+            self.__watch(simplified)
+            self._clauses.append(simplified)
+
+    def __watch(self,clause):
+        self._watches.setdefault(clause[0],[]).append(clause)
+        self._watches.setdefault(clause[1],[]).append(clause)
+
+    def push(self):
+        '''
+        Opens a scope, clauses added from now on are removed by the matching pop()
+        '''
+        self._scopes.append(self.__new_variable(None))
+
+    def pop(self):
+        '''
+        Closes the innermost scope, removing the clauses added in it
+        Learned clauses that don't depend on them are kept
+        '''
+        if not self._scopes:
+            raise ValueError("There is no scope to pop")
+        selector = self._scopes.pop()
+        self.__cancel_until(0)
+        self.__add([-selector])
+
+    def solve(self,assumptions=()):
+        '''
+        Checks whether the clauses are satisfiable with the given literals (strings like 'A', '!B') assumed True
+        Returns True / False, after True the satisfying interpretation can be read with model()
+        '''
+
+        self.stats["solves"] += 1
+        self._model = None
+        # the selectors of open scopes are assumed first, then the given literals
+        assumed = list(self._scopes) + [self.__literal(literal) for literal in assumptions]
+
+        self.__cancel_until(0)
+        if not self._ok:
+            return False
+        if self.__propagate() is not None:
+            self._ok = False
+            return False
+
+        restart_limit = self.RESTART_FIRST
+        conflicts = 0
+        while True:
+            conflict = self.__propagate()
+            if conflict is not None:
+                self.stats["conflicts"] += 1
+                conflicts += 1
+                if len(self._trail_limits) == 0:
+                    self._ok = False
+                    return False
+                learned,level = self.__analyze(conflict)
+                self.__cancel_until(level)
+                if len(learned) == 1:
+                    self.__assign(learned[0],None)
+                else:
+                    self.__watch(learned)
+                    self._learned.append(learned)
+                    self.__assign(learned[0],learned)
+                self.stats["learned"] += 1
+                self._increment /= self.ACTIVITY_DECAY
+                continue
+
+            if conflicts >= restart_limit:
+                self.stats["restarts"] += 1
+                conflicts = 0
+                restart_limit *= self.RESTART_GROWTH
+                self.__cancel_until(0)
+                continue
+
+            level = len(self._trail_limits)
+            if level < len(assumed):
+                # every assumption gets its own decision level, in order
+                literal = assumed[level]
+                value = self.__value(literal)
+                if value is False:
+                    self.__cancel_until(0)
+                    return False
+                self._trail_limits.append(len(self._trail))
+                if value is None:
+                    self.__assign(literal,None)
+                continue
+
+            variable = self.__pick_variable()
+            if variable is None:
+                self._model = {name : self._values[number] for name,number in self._numbers.items()}
+                self.__cancel_until(0)
+                return True
+            self.stats["decisions"] += 1
+            self._trail_limits.append(len(self._trail))
+            self.__assign(variable if self._phases[variable] else -variable,None)
+
+    def model(self):
+        '''
+        Returns the interpretation found by the last successful solve(), as a dict of name -> bool
+        None if the last solve() didn't find one
+        '''
+        return dict(self._model) if self._model is not None else None
+
+    def __assign(self,literal,reason):
+        variable = abs(literal)
+        self._values[variable] = literal > 0
+        self._levels[variable] = len(self._trail_limits)
+        self._reasons[variable] = reason
+        self._trail.append(literal)
+
+    def __propagate(self):
+        '''
+        Assigns the literals that clauses force, until nothing is left to propagate
+        Every clause watches two of its literals (the first two), and is only looked at when one of those
+        becomes False. Then it watches another literal that isn't False, or if there's none,
+        the other watched literal has to be True
+        Returns a clause with all of its literals False (a conflict), or None
+        '''
+
+        while self._head < len(self._trail):
+            false_literal = -self._trail[self._head]
+            self._head += 1
+            self.stats["propagations"] += 1
+
+            watching = self._watches.get(false_literal,[])
+            kept = []
+            conflict = None
+            i = 0
+            while i < len(watching):
+                clause = watching[i]
+                i += 1
+                if clause[0] == false_literal:
+                    clause[0],clause[1] = clause[1],clause[0]
+                if self.__value(clause[0]) is True:
+                    kept.append(clause)
+                    continue
+
+                for k in range(2,len(clause)):
+                    if self.__value(clause[k]) is not False:
+                        clause[1],clause[k] = clause[k],clause[1]
+                        self._watches.setdefault(clause[1],[]).append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if self.__value(clause[0]) is False:
+                        conflict = clause
+                        kept.extend(watching[i:])
+                        break
+                    self.__assign(clause[0],clause)
+
+            self._watches[false_literal] = kept
+            if conflict is not None:
+                return conflict
+        return None
+
+    def __analyze(self,conflict):
+        '''
+        Learns a clause from a conflict, by resolving it with the clauses that implied its literals,
+        going backwards through the trail until only one literal of the current decision level is left
+        Returns the learned clause, with that literal first, and the level to jump back to,
+        where the clause forces that literal
+        '''
+
+        level = len(self._trail_limits)
+        seen = set()
+        learned = [None]
+        pending = 0 # literals of the current level still to resolve away
+        index = len(self._trail) - 1
+        clause = conflict
+        literal = None
+
+        while True:
+            for other in (clause if literal is None else clause[1:]):
+                variable = abs(other)
+                if variable not in seen and self._levels[variable] > 0:
+                    seen.add(variable)
+                    self.__bump(variable)
+                    if self._levels[variable] == level:
+                        pending += 1
+                    else:
+                        learned.append(other)
+
+            while abs(self._trail[index]) not in seen:
+                index -= 1
+            literal = self._trail[index]
+            index -= 1
+            seen.discard(abs(literal))
+            pending -= 1
+            if pending == 0:
+                break
+            clause = self._reasons[abs(literal)]
+
+        learned[0] = -literal
+        if len(learned) == 1:
+            return learned,0
+        # the literal with the highest level is watched next to the first one
+        highest = max(range(1,len(learned)),key=lambda i: self._levels[abs(learned[i])])
+        learned[1],learned[highest] = learned[highest],learned[1]
+        return learned,self._levels[abs(learned[1])]
+
+    def __bump(self,variable):
+        self._activity[variable] += self._increment
+        if self._activity[variable] > 1e100:
+            # keeps the numbers in range, only their order matters
+            self._activity = [activity * 1e-100 for activity in self._activity]
+            self._increment *= 1e-100
+
+    def __pick_variable(self):
+        best = None
+        for variable in range(1,len(self._values)):
+            if self._values[variable] is None and (best is None or self._activity[variable] > self._activity[best]):
+                best = variable
+        return best
+
+    def __cancel_until(self,level):
+        '''
+        Undoes the assignments of every decision level above the given one
+        '''
+        if len(self._trail_limits) <= level:
+            return
+        start = self._trail_limits[level]
+        for literal in self._trail[start:]:
+            variable = abs(literal)
+            self._phases[variable] = self._values[variable]
+            self._values[variable] = None
+            self._reasons[variable] = None
+        del self._trail[start:]
+        del self._trail_limits[level:]
+        self._head = len(self._trail)
@@ -0,0 +1,258 @@
+import asyncio
+import inspect
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .console import padded_print
+from .toolkit import ConversionBudgetExceeded, LogicToolkit
+
+
+class LogicToolkitServer:
+    '''
+    Serves one long-lived LogicToolkit over JSON-RPC 2.0
+    Messages are JSON objects (or batches of them), one per line,
+    sent over a localhost TCP connection or a Unix socket
+
+    - Every request is handled in its own task, so clients can send many requests
+      without waiting for the answers (pipelining).
+      Responses carry the id of their request and can arrive in a different order
+    - Any number of clients can be connected at once, they all share the same toolkit,
+      so rules added by one client are visible to the others
+    - The actual work runs in a thread pool, so the event loop keeps accepting
+      connections and reading requests while a conversion is running
+    '''
+
+    # JSON-RPC method name -> whether the call reads or changes the known rules
+    # rule calls are serialized by a lock, the rest can run side by side
+    METHODS = {
+        "to_cnf" : False,
+        "to_dnf" : False,
+        "is_tautology" : False,
+        "is_contradiction" : False,
+        "is_satisfiable" : False,
+        "minimize" : False,
+        "make_random_formula" : False,
+        "add_rule" : True,
+        "make_query" : True
+    }
+
+    # standard JSON-RPC 2.0 error codes
+    PARSE_ERROR = -32700
+    INVALID_REQUEST = -32600
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS = -32602
+    INTERNAL_ERROR = -32603
+    # from the range JSON-RPC leaves to servers, a conversion went over its budget (see LogicToolkit.to_cnf)
+    BUDGET_EXCEEDED = -32001
+
+    # longest accepted message, in bytes
+    LINE_LIMIT = 2**24
+
+    def __init__(self,toolkit=None,*,workers=4):
+        self._toolkit = toolkit if toolkit is not None else LogicToolkit()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._rules_lock = threading.Lock()
+        self._client_tasks = set()
+
+    def _split_params(self,params):
+        '''
+        params can be a list (positional arguments) or a dict (keyword arguments)
+        Returns them as an (args, kwargs) pair
+        '''
+        if type(params) == dict:
+            return [],params
+        return params,{}
+
+    def _call(self,method,params):
+        '''
+        Runs a single method of the toolkit, this is what runs inside the thread pool
+        '''
+
+        function = getattr(self._toolkit,method)
+        args,kwargs = self._split_params(params)
+
+        if self.METHODS[method]:
+            with self._rules_lock:
+                return function(*args,**kwargs)
+        return function(*args,**kwargs)
+
+    def _error(self,request_id,code,message):
+        return {"jsonrpc" : "2.0", "id" : request_id, "error" : {"code" : code, "message" : message}}
+
+    async def _handle_request(self,request):
+        '''
+        Handles one decoded JSON-RPC request
+        Returns the response object, or None if the request was a notification
+        '''
+
+        if type(request) != dict or request.get("jsonrpc") != "2.0" or type(request.get("method")) != str:
+            return self._error(None,self.INVALID_REQUEST,"Invalid request")
+
+        request_id = request.get("id")
+        is_notification = "id" not in request
+        method = request["method"]
+        params = request.get("params",[])
+
+        if method not in self.METHODS:
+            response = self._error(request_id,self.METHOD_NOT_FOUND,"Method not found: " + method)
+        elif type(params) not in (list,dict):
+            response = self._error(request_id,self.INVALID_PARAMS,"params must be an array or an object")
+        else:
+            args,kwargs = self._split_params(params)
+            try:
+                # checks the arguments against the signature before running anything,
+                # so a wrong number or name of arguments isn't mistaken for a failure inside the toolkit
+                inspect.signature(getattr(self._toolkit,method)).bind(*args,**kwargs)
+            except TypeError as e:
+                response = self._error(request_id,self.INVALID_PARAMS,str(e))
+            else:
+                loop = asyncio.get_running_loop()
+                try:
+                    result = await loop.run_in_executor(self._executor,self._call,method,params)
+                    response = {"jsonrpc" : "2.0", "id" : request_id, "result" : result}
+                except ConversionBudgetExceeded as e:
+                    response = self._error(request_id,self.BUDGET_EXCEEDED,str(e))
+                except ValueError as e:
+                    # the toolkit raises ValueError for invalid formulas, rules and queries
+                    response = self._error(request_id,self.INVALID_PARAMS,str(e))
+                except Exception as e:
+                    response = self._error(request_id,self.INTERNAL_ERROR,type(e).__name__ + ": " + str(e))
+
+        if is_notification:
+            return None
+        return response
+
+    async def _handle_message(self,line):
+        '''
+        Handles one line sent by a client, which holds either a single request or a batch
+        Returns the response to send back (None if there is nothing to send)
+        '''
+
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return self._error(None,self.PARSE_ERROR,"Parse error")
+
+        if type(message) != list:
+            return await self._handle_request(message)
+
+        if len(message) == 0:
+            return self._error(None,self.INVALID_REQUEST,"Invalid request")
+        responses = await asyncio.gather(*[self._handle_request(request) for request in message])
+        responses = [response for response in responses if response is not None]
+        return responses if len(responses) > 0 else None
+
+    async def _handle_client(self,reader,writer):
+        '''
+        Reads requests from one client until it disconnects
+        Every line is handled in its own task, so slow requests don't hold up the ones after them
+        '''
+
+        self._client_tasks.add(asyncio.current_task())
+        write_lock = asyncio.Lock()
+        pending = set()
+
+        async def respond(line):
+            response = await self._handle_message(line)
+            if response is None:
+                return
+            data = (json.dumps(response) + "\n").encode()
+            async with write_lock:
+                writer.write(data)
+                await writer.drain()
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # the line was longer than LINE_LIMIT
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(respond(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            if pending:
+                await asyncio.gather(*pending,return_exceptions=True)
+        except ConnectionError:
+            pass
+        except asyncio.CancelledError:
+            # the server is shutting down, requests that are still running are dropped
+            for task in pending:
+                task.cancel()
+        finally:
+            self._client_tasks.discard(asyncio.current_task())
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError,asyncio.CancelledError):
+                pass
+
+    async def serve(self,*,host="127.0.0.1",port=8765,unix_path=None):
+        '''
+        Starts accepting clients and serves them until cancelled
+        If unix_path is given, listens on a Unix socket there instead of on TCP
+        '''
+
+        if unix_path is not None:
+            server = await asyncio.start_unix_server(self._handle_client,path=unix_path,limit=self.LINE_LIMIT)
+        else:
+            server = await asyncio.start_server(self._handle_client,host,port,limit=self.LINE_LIMIT)
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # closing the server doesn't stop the connections that are already open
+            for task in list(self._client_tasks):
+                task.cancel()
+            if self._client_tasks:
+                await asyncio.gather(*self._client_tasks,return_exceptions=True)
+
+    def close(self):
+        '''
+        Shuts down the thread pool
+        '''
+        self._executor.shutdown(wait=False,cancel_futures=True)
+
+
+def run_server(toolkit,args):
+    '''
+    Runs the JSON-RPC server, used when the script is started with --serve
+    Accepted arguments: --host HOST, --port PORT, --unix PATH, --workers N
+    '''
+
+    usage = "Usage: --serve [--host HOST] [--port PORT] [--unix PATH] [--workers N]"
+    options = {"--host" : "127.0.0.1", "--port" : "8765", "--unix" : None, "--workers" : "4"}
+    for i in range(0,len(args),2):
+        if args[i] not in options or i+1 == len(args):
+            padded_print(usage)
+            return
+        options[args[i]] = args[i+1]
+
+    if not options["--port"].isdigit() or not 0 < int(options["--port"]) < 65536:
+        padded_print("Invalid port: " + options["--port"])
+        padded_print(usage)
+        return
+    if not options["--workers"].isdigit() or int(options["--workers"]) < 1:
+        padded_print("Invalid number of workers: " + options["--workers"])
+        padded_print(usage)
+        return
+
+    server = LogicToolkitServer(toolkit,workers=int(options["--workers"]))
+    if options["--unix"] is not None:
+        padded_print("LogicToolkit JSON-RPC server listening on " + options["--unix"])
+    else:
+        padded_print("LogicToolkit JSON-RPC server listening on " + options["--host"] + ":" + options["--port"])
+
+    try:
+        asyncio.run(server.serve(host=options["--host"],port=int(options["--port"]),unix_path=options["--unix"]))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
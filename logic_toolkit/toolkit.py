@@ -0,0 +1,2128 @@
+import sys
+from time import perf_counter
+
+from .clauses import ClauseSet
+from .console import padded_print
+from .dag import FormulaDAG
+from .minimize import Minimizer
+
+# debugging messages also go to the 'logic_toolkit' logger, at the DEBUG level, see _debug_logger
+_logger = None
+
+
+def _debug_logger():
+    '''
+    Returns the 'logic_toolkit' logger if it's enabled for DEBUG, otherwise None
+    logging isn't imported here: if nothing else has imported it, no logger can have been set up,
+    and importing it (and threading with it) would slow down importing the package
+    '''
+    global _logger
+    if _logger is None:
+        logging = sys.modules.get("logging")
+        if logging is None:
+            return None
+        _logger = logging.getLogger("logic_toolkit")
+    return _logger if _logger.isEnabledFor(sys.modules["logging"].DEBUG) else None
+
+
+class ConversionBudgetExceeded(Exception):
+    '''
+    Raised by to_cnf / to_dnf when a conversion would go over one of its budgets
+    budget is the name of the budget ("max_clauses", "max_nodes" or "timeout"),
+    limit is its value, and size is the estimated size (or the seconds spent, for a timeout)
+    '''
+
+    def __init__(self,budget,limit,size):
+        super().__init__("The conversion would exceed " + budget + " (" + str(size) + " > " + str(limit) + ")")
+        self.budget = budget
+        self.limit = limit
+        self.size = size
+
+
+def _normalize_part(arguments):
+    '''
+    Runs in a worker process of a parallel conversion, normalizes one part of an f_list in NNF
+    '''
+    part,to_cnf = arguments
+    return LogicToolkit()._normalize_nnf(part,to_cnf)
+
+
+class LogicToolkit:
+    '''
+    Holds functionality for working with logic formulas:
+    - Convert formula to CNF or DNF form
+    - Check if a formula is a tautology / contradiction / satisfiable
+    - Get True interpretations
+    - Get definite rules from formula
+    - Make queries
+    - Generate random logical formulas
+    '''
+
+    # !Q   - negation
+    # QvP  - disjunction
+    # QaP  - conjunction
+    # QxP  - exclusive or
+    # Q->P - implication
+    # Q<->P - biconditional
+
+    # f_list is used in the code below often. It refers to the logic formula in its list form
+
+    # connectives, from the one binding tightest to the loosest ('!' binds tighter than all of them):
+    # conjunction, exclusive or, disjunction, implication, biconditional
+    CONNECTIVES = ('a','x','v','->','<->')
+
+    def __init__(self):
+        self._definite_rules = {}
+        self._known_literals = set()
+        self._debugging = False
+
+        # rules over predicates, like reach(X,Y),edge(Y,Z)->reach(X,Z), see datalog.py
+        # created when the first one is added
+        self._datalog = None
+
+        # per-pass statistics of the CNF / DNF conversion, only collected while _collecting_stats is True
+        self._collecting_stats = False
+        self._stats = {}
+        self._stats_callback = None
+
+        # receives structured tracing events (dicts), see set_trace_sink
+        self._trace_sink = None
+
+        # the last formula given to condition, with its occurrence index, so it isn't built again
+        self._condition_cache = None
+
+        # results kept on disk across restarts, see use_cache
+        self._cache = None
+
+        # (number of workers, ProcessPoolExecutor) for parallel conversions, see to_cnf
+        self._process_pool = None
+
+        # races satisfiability engines in processes, see use_portfolio
+        self._portfolio = None
+
+        # definite rules are stored in a dictionary form, to make queries easy
+        # for example, T->S is stored as definite_rules[S] = T
+        # for example, ->T is stored as definite_rules[T] = True, meaning success
+        # if you meet a dead end, the default .get is False, so if there is no T, returns False, meaning failure
+
+    def __tracing(self):
+        '''
+        Returns True if debugging messages or tracing events go anywhere:
+        - self._debugging is True (messages are printed, used by the 'debugging on' command)
+        - the 'logic_toolkit' logger is enabled for DEBUG
+        - a trace sink is set
+        Callers check this before doing any work that's only needed for tracing
+        '''
+        return self._debugging or self._trace_sink is not None or _debug_logger() is not None
+
+    def __trace(self,message,*args):
+        '''
+        Prints a debugging message if self._debugging is True, and logs it to the 'logic_toolkit' logger
+        The message is a %-format string, it's only formatted with args if it actually goes somewhere,
+        so passing a large f_list as an argument costs nothing while debugging is off
+        '''
+        if self._debugging:
+            padded_print(message % args if args else message)
+        logger = _debug_logger()
+        if logger is not None:
+            logger.debug(message,*args)
+
+    def __emit(self,event,**fields):
+        '''
+        Sends a structured tracing event to the trace sink, if there is one
+        The event is a dict like {"event" : "pass", "pass" : "normalize", "seconds" : ...}
+        '''
+        if self._trace_sink is not None:
+            fields["event"] = event
+            self._trace_sink(fields)
+
+    def set_trace_sink(self,sink):
+        '''
+        Sets a function that receives structured tracing events as dicts, or None to stop
+        Every event has an "event" key saying what it is:
+        - "pass": one pass of the CNF / DNF conversion (pass, changed, seconds, nodes_before, nodes_after)
+        - "conversion": a finished to_cnf / to_dnf call (form, nodes_before, nodes_after, seconds)
+        - "interpretations": the truth table of a formula was checked (literals, true_interpretations)
+        - "query": one step of make_query, with the literal or list of literals being queried (query)
+        '''
+        self._trace_sink = sink
+   
+    def __is_disjunction(self,f_list):
+        '''
+        Checks whether a given f_list is a disjunction
+        Returns False if given a literal
+        QvT is a disjunction
+        (QaV)v(TaX) is a disjunction
+        (QvT)a(TvP) is not a disjunction
+        '''
+        if type(f_list) != list or len(f_list) == 2:
+            # if it was given a literal, return False
+            # the len == 2 checks whether a negated literal was given
+            return False
+        
+        # goes through the given f_list
+        # if it finds anything other than 'v', stuff in brackets, or literals, return False
+        for c in f_list:
+            if not (c == 'v' or type(c) == list or type(c) == bool or c.isupper()):
+                return False
+
+        return True
+    
+    def __is_conjunction(self,f_list):
+        '''
+        Checks whether a given f_list is a conjunction
+        Returns False if given a literal
+        QaT is a conjunction
+        (QvV)a(TvX) is a conjunction
+        (QaT)v(TaP) is not a conjunction
+        '''
+        if type(f_list) != list or len(f_list) == 2:
+            # if it was given a literal, return False
+            # the len == 2 checks whether a negated literal was given
+            return False
+        
+        # goes through the given f_list
+        # if it finds anything other than 'a', stuff in brackets, or literals, return False
+        for c in f_list:
+            if not (c == 'a' or type(c) == list or type(c) == bool or c.isupper()):
+                return False
+
+        return True
+    
+    def __to_nnf(self,f_list,negated=False,memo=None,*,conjunctive=False):
+        '''
+        Converts an f_list to negation normal form (NNF) in a single pass:
+        - implications are removed: Q->T becomes !QvT
+        - negations are moved all the way in: !(QvT) becomes !Qa!T, !(QaT) becomes !Qv!T
+        - double negations disappear: !!Q becomes Q
+        - exclusive ors and biconditionals are written out: QxT becomes (Qa!T)v(!QaT), Q<->T becomes (QaT)v(!Qa!T)
+          With conjunctive, they're written the other way around, as conjunctions: QxT becomes (QvT)a(!Qv!T),
+          Q<->T becomes (Qv!T)a(!QvT). That's the shape to_cnf needs: a chain of n variables then
+          distributes into exactly its 2**(n-1) parity clauses, instead of 4**(n-1) mostly tautological ones
+        negated says whether the f_list is under an odd number of negations.
+        It is carried downwards, so every part of the formula is visited and written out exactly once,
+        instead of rescanning the list after every rewrite.
+
+        Connectives without brackets around them are grouped by precedence, from tightest to loosest:
+        '!', then 'a', then 'x', then 'v', then '->', then '<->' (see CONNECTIVES).
+        Implications group from the right, so A->B->C is A->(B->C), the rest from the left
+        For example, AaB->CvD is read as (AaB)->(CvD)
+
+        Writing out QxT needs both Q and !Q, so every bracket is converted at most once per polarity,
+        and the results are reused (memo): a chain like AxBxCxD gives an NNF whose size grows linearly,
+        as long as the parts used twice are kept shared (the same list object), see __share_subformulas
+
+        Returns a literal ('Q'), a negated literal (['!','Q']), a boolean,
+        or a list of parts joined by one connective, like ['Q','v',['!','T']]
+        '''
+
+        if type(f_list) != list:
+            # a literal or a boolean value
+            if type(f_list) == bool:
+                return f_list != negated
+            return ['!',f_list] if negated else f_list
+
+        if len(f_list) == 2 and f_list[0] == '!':
+            # a negated literal or formula, for example ['!','Q'] or ['!',['Q','v','T']]
+            return self.__to_nnf(f_list[1],not negated,memo,conjunctive=conjunctive)
+
+        if memo is None:
+            memo = {}
+        key = (id(f_list),negated)
+        if key in memo:
+            return memo[key][1]
+
+        # splits the list into its operands and the connectives between them
+        # a '!' in front of an operand (as in ['Q','a','!',['Q','v','T']]) flips its polarity
+        operands = [] # (operand, whether it's negated an odd number of times)
+        connectives = []
+        negations = 0
+        for part in f_list:
+            if part == '!':
+                negations += 1
+            elif part in self.CONNECTIVES:
+                connectives.append(part)
+            else:
+                operands.append((part,negations % 2 == 1))
+                negations = 0
+
+        result = self.__group_to_nnf(operands,connectives,len(self.CONNECTIVES) - 1,negated,memo,conjunctive)
+        memo[key] = (f_list,result)
+        return result
+
+    def __group_to_nnf(self,operands,connectives,level,negated,memo,conjunctive):
+        '''
+        Helper for __to_nnf, converts a sequence of operands and the connectives between them
+        Splits it at the loosest connective in it, starting from CONNECTIVES[level], and converts every piece
+        '''
+
+        if len(operands) == 1:
+            part,flipped = operands[0]
+            return self.__to_nnf(part,negated != flipped,memo,conjunctive=conjunctive)
+        while self.CONNECTIVES[level] not in connectives:
+            level -= 1
+        connective = self.CONNECTIVES[level]
+
+        # the pieces between the connective, each a (operands, connectives) pair with only tighter connectives
+        pieces = [([operands[0]],[])]
+        for i,other in enumerate(connectives):
+            if other == connective:
+                pieces.append(([operands[i+1]],[]))
+            else:
+                pieces[-1][0].append(operands[i+1])
+                pieces[-1][1].append(other)
+
+        def convert(piece,negated):
+            return self.__group_to_nnf(piece[0],piece[1],level - 1,negated,memo,conjunctive)
+
+        if connective == 'a' or connective == 'v':
+            # De Morgan: a negated conjunction is a disjunction of the negated parts, and the other way around
+            joined = connective if not negated else ('v' if connective == 'a' else 'a')
+            return self.__join_parts([convert(piece,negated) for piece in pieces],joined)
+
+        if connective == '->':
+            # A->B->C is A->(B->C), so the implication is built from the right:
+            # when not negated, L->R becomes !LvR, when negated, !(L->R) becomes La!R
+            result = convert(pieces[-1],negated)
+            for piece in reversed(pieces[:-1]):
+                if negated:
+                    result = self.__join_parts([convert(piece,False),result],'a')
+                else:
+                    result = self.__join_parts([convert(piece,True),result],'v')
+            return result
+
+        # exclusive or / biconditional, grouped from the left: both polarities of the part so far are kept,
+        # since the next step uses both of them, and only the one asked for is returned at the end
+        inner,outer = ('v','a') if conjunctive else ('a','v')
+        positive,negative = convert(pieces[0],False),convert(pieces[0],True)
+        for piece in pieces[1:]:
+            other_positive,other_negative = convert(piece,False),convert(piece,True)
+            if conjunctive:
+                # the same value: (PvQ')a(P'vQ), different values: (PvQ)a(P'vQ'), with P' the negation of P
+                same_pairs = ((positive,other_negative),(negative,other_positive))
+                different_pairs = ((positive,other_positive),(negative,other_negative))
+            else:
+                # the same value: (PaQ)v(P'aQ'), different values: (PaQ')v(P'aQ)
+                same_pairs = ((positive,other_positive),(negative,other_negative))
+                different_pairs = ((positive,other_negative),(negative,other_positive))
+            same = self.__join_parts([self.__join_parts(list(pair),inner) for pair in same_pairs],outer)
+            different = self.__join_parts([self.__join_parts(list(pair),inner) for pair in different_pairs],outer)
+            positive,negative = (different,same) if connective == 'x' else (same,different)
+        return negative if negated else positive
+
+    def __join_parts(self,parts,connective):
+        '''
+        Helper for __to_nnf, joins NNF parts with a connective: [A,B,C] and 'v' become ['A','v','B','v','C']
+        A single part is returned as it is
+        '''
+
+        if len(parts) == 1:
+            return parts[0]
+        f_list = [parts[0]]
+        for part in parts[1:]:
+            f_list.append(connective)
+            f_list.append(part)
+        return f_list
+
+    def __nnf_front_end(self,f_list,conjunctive=False):
+        '''
+        The first step of to_cnf and to_dnf, converts the f_list to NNF (see __to_nnf)
+        The given f_list isn't modified
+        '''
+
+        if self._collecting_stats or self._trace_sink is not None:
+            f_list,_ = self.__run_measured_pass("to_nnf",lambda f_list: self.__to_nnf_list(f_list,conjunctive),f_list)
+        else:
+            f_list = self.__to_nnf_list(f_list,conjunctive)
+        self.__trace("Converted to negation normal form\nNew f_list:  %s",f_list)
+        return self.__share_subformulas(f_list)
+
+    def __share_subformulas(self,nnf):
+        '''
+        Makes every subformula that appears more than once in an f_list in NNF the same list object,
+        by going through a FormulaDAG (see dag.py). Everything after this memoizes by identity,
+        so in (AvB)a(C->(AvB)) the clauses of AvB are computed once and reused, instead of copied
+        '''
+
+        dag = FormulaDAG()
+        root = dag.add(nnf)
+        shared = dag.to_f_list(root)
+        if type(shared) != list or (len(shared) == 2 and shared[0] == '!'):
+            shared = [shared]
+        if self._trace_sink is not None:
+            self.__emit("share",**dag.size(root))
+        return shared
+
+    def __to_nnf_list(self,f_list,conjunctive=False):
+        '''
+        Like __to_nnf, but always returns a list, since the rest of the conversion works on lists
+        For example, a single literal Q is returned as ['Q']
+        '''
+
+        f_list = self.__to_nnf(f_list,conjunctive=conjunctive)
+        if type(f_list) != list or (len(f_list) == 2 and f_list[0] == '!'):
+            f_list = [f_list]
+        return f_list
+
+    def __normalize(self,nnf,*,to_cnf,budget=None):
+        '''
+        Converts an f_list in NNF (see __to_nnf) to either CNF or DNF
+        Returns the result as a list of clauses (CNF) or terms (DNF), each a tuple of literals like ('A','!B')
+
+        Works bottom-up in a single post-order traversal, every subformula is normalized exactly once:
+        - a literal becomes a single clause / term with just that literal
+        - for CNF, a conjunction joins the clauses of its parts,
+          and a disjunction distributes: (AaB)vC becomes (AvC)a(BvC)
+        - for DNF it's the other way around, a disjunction joins the terms of its parts,
+          and a conjunction distributes: (AvB)aC becomes (AaC)v(BaC)
+        - duplicate literals in a clause and duplicate clauses are removed along the way: AvA becomes A
+        Results are memoized by node identity, so a subformula that appears in several places
+        (the same list object) is only normalized once
+        If a budget is given (see __make_budget), its deadline is checked after every subformula
+        and while distributing
+        '''
+
+        # for CNF, 'a' joins and 'v' distributes, for DNF the other way around
+        joining,distributing = ('a','v') if to_cnf else ('v','a')
+
+        memo = {} # id(node) -> (node, result), the node is kept so its id can't be reused
+        stack = [(nnf,False)]
+        while stack:
+            node,children_done = stack.pop()
+            if id(node) in memo:
+                continue
+
+            if type(node) != list or (len(node) == 2 and node[0] == '!'):
+                memo[id(node)] = (node,self.__normalize_literal(node,to_cnf))
+                continue
+
+            parts = [part for part in node if part != joining and part != distributing]
+            if not children_done:
+                stack.append((node,True))
+                for part in parts:
+                    if id(part) not in memo:
+                        stack.append((part,False))
+                continue
+
+            results = [memo[id(part)][1] for part in parts]
+            if len(node) == 1 or node[1] == joining:
+                memo[id(node)] = (node,self.__join_clauses(results))
+            else:
+                memo[id(node)] = (node,self.__distribute_clauses(results,budget))
+            if budget is not None:
+                self.__check_deadline(budget)
+
+        return memo[id(nnf)][1]
+
+    def __normalize_in_parallel(self,nnf,*,to_cnf,budget,workers):
+        '''
+        Like __normalize, but the parts of the top-level connective are normalized in a process pool:
+        - for CNF, the parts of a top-level conjunction are independent, their clauses are only joined
+        - the parts of a top-level disjunction are independent too, they're normalized in parallel
+          and then distributed over each other here
+        Joining leaves out clauses that are duplicates of clauses from any other part
+        The pool is started the first time it's needed and kept, see close
+        '''
+
+        from concurrent.futures import TimeoutError
+
+        if len(nnf) < 3:
+            return self.__normalize(nnf,to_cnf=to_cnf,budget=budget)
+        parts = nnf[::2]
+
+        pool = self.__process_pool(workers)
+        # small parts are sent in batches, a few per worker, so the processes aren't kept waiting on messages
+        chunksize = max(1,len(parts) // (workers * 4))
+        timeout = None
+        if budget is not None and budget["deadline"] is not None:
+            timeout = max(0.0,budget["deadline"] - perf_counter())
+        try:
+            results = list(pool.map(_normalize_part,[(part,to_cnf) for part in parts],
+                timeout=timeout,chunksize=chunksize))
+        except TimeoutError:
+            raise ConversionBudgetExceeded("timeout",budget["timeout"],round(perf_counter() - budget["start"],3))
+        self.__trace("Normalized %d parts in %d processes",len(parts),workers)
+
+        joining = 'a' if to_cnf else 'v'
+        if nnf[1] == joining:
+            return self.__join_clauses(results)
+        return self.__distribute_clauses(results,budget)
+
+    def __process_pool(self,workers):
+        if self._process_pool is None or self._process_pool[0] != workers:
+            from concurrent.futures import ProcessPoolExecutor
+            self.close()
+            self._process_pool = (workers,ProcessPoolExecutor(max_workers=workers))
+        return self._process_pool[1]
+
+    def close(self):
+        '''
+        Stops the worker processes of parallel conversions (see to_cnf), if any were started
+        '''
+        if self._process_pool is not None:
+            self._process_pool[1].shutdown()
+            self._process_pool = None
+
+    def _normalize_nnf(self,nnf,to_cnf):
+        # for _normalize_part, which runs outside the class
+        return self.__normalize(nnf,to_cnf=to_cnf)
+
+    def __normalize_literal(self,literal,to_cnf):
+        '''
+        Helper for __normalize, returns the clauses / terms of a single (possibly negated) literal or boolean
+        '''
+
+        if type(literal) == bool:
+            # an empty clause is False and an empty term is True,
+            # an empty list of clauses is True and an empty list of terms is False
+            if literal == to_cnf:
+                return []
+            return [()]
+        if type(literal) == list:
+            return [("!" + literal[1],)]
+        return [(literal,)]
+
+    def __join_clauses(self,results):
+        '''
+        Helper for __normalize, joins lists of clauses (or terms), leaving out duplicates
+        Two clauses are duplicates if they have the same literals, in any order
+        '''
+
+        joined = {}
+        for clauses in results:
+            for clause in clauses:
+                joined.setdefault(frozenset(clause),clause)
+        return list(joined.values())
+
+    def __distribute_clauses(self,results,budget=None):
+        '''
+        Helper for __normalize, distributes lists of clauses (or terms) over each other
+        For CNF, (AaB)v(CaD) becomes (AvC)a(AvD)a(BvC)a(BvD), one new clause for every combination
+        Combinations with a literal and its negation are left out, a clause like Av!A is always True
+        (and a term like Aa!A always False), so it doesn't change the result
+        '''
+
+        distributed = [()]
+        for clauses in results:
+            combined = {}
+            for first in distributed:
+                if budget is not None:
+                    self.__check_deadline(budget)
+                for second in clauses:
+                    if any(self.__negate_literal(literal) in first for literal in second):
+                        continue
+                    clause = first + tuple(literal for literal in second if literal not in first)
+                    combined.setdefault(frozenset(clause),clause)
+            distributed = list(combined.values())
+        return distributed
+
+    def __make_budget(self,max_clauses,max_nodes,timeout):
+        '''
+        Collects the budgets of a conversion into a dict, None if there aren't any
+        The timeout (in seconds) is turned into a deadline on the perf_counter clock
+        '''
+
+        for name,value in (("max_clauses",max_clauses),("max_nodes",max_nodes),("timeout",timeout)):
+            if value is not None and (type(value) not in (int,float) or value < 0):
+                raise ValueError(name + " has to be a non-negative number")
+        if max_clauses is None and max_nodes is None and timeout is None:
+            return None
+        start = perf_counter()
+        return {"max_clauses" : max_clauses, "max_nodes" : max_nodes, "timeout" : timeout,
+            "start" : start, "deadline" : None if timeout is None else start + timeout}
+
+    def __check_deadline(self,budget):
+        if budget["deadline"] is not None and perf_counter() > budget["deadline"]:
+            raise ConversionBudgetExceeded("timeout",budget["timeout"],round(perf_counter() - budget["start"],3))
+
+    def __estimate_size(self,nnf,to_cnf):
+        '''
+        Estimates how big the CNF (or DNF) of an f_list in NNF gets, without distributing anything
+        Returns (clauses, literals), the largest counts reached by any subformula on the way
+        For CNF, a conjunction has the clauses of all its parts, and a disjunction one clause for
+        every combination of its parts' clauses, so the counts are added up or multiplied
+        The estimate is an upper bound, duplicates removed while converting can only make the result smaller
+        Counts stop growing at 2**64, no budget is that big, and chains of exclusive ors
+        would otherwise need numbers with millions of digits
+        '''
+
+        joining,distributing = ('a','v') if to_cnf else ('v','a')
+        cap = 2**64
+        sizes = {} # id(node) -> (node, clauses, literals)
+        largest = [0,0]
+        stack = [(nnf,False)]
+        while stack:
+            node,children_done = stack.pop()
+            if id(node) in sizes:
+                continue
+
+            if type(node) != list or (len(node) == 2 and node[0] == '!'):
+                clauses = len(self.__normalize_literal(node,to_cnf))
+                sizes[id(node)] = (node,clauses,clauses)
+                continue
+
+            parts = [part for part in node if part != joining and part != distributing]
+            if not children_done:
+                stack.append((node,True))
+                for part in parts:
+                    if id(part) not in sizes:
+                        stack.append((part,False))
+                continue
+
+            counts = [sizes[id(part)][1:] for part in parts]
+            if len(node) == 1 or node[1] == joining:
+                clauses = sum(count[0] for count in counts)
+                literals = sum(count[1] for count in counts)
+            else:
+                # every combined clause takes one clause from each part,
+                # so a part's literals show up once for every combination of the other parts' clauses
+                clauses = 1
+                for count in counts:
+                    clauses *= count[0]
+                literals = 0
+                for count in counts:
+                    if count[0] > 0:
+                        literals += count[1] * (clauses // count[0])
+            if clauses >= cap:
+                clauses,literals = cap,cap
+            literals = min(literals,cap)
+            sizes[id(node)] = (node,clauses,literals)
+            largest = [max(largest[0],clauses),max(largest[1],literals)]
+
+        _,clauses,literals = sizes[id(nnf)]
+        return max(largest[0],clauses),max(largest[1],literals)
+
+    def __check_estimate(self,nnf,to_cnf,budget):
+        '''
+        Fails fast, before distributing anything, if the estimated size goes over the budget
+        A clause of k literals takes about 2k nodes in an f_list (the literals, the connectives between them
+        and the brackets), so the node count is estimated from the literal and clause counts
+        '''
+
+        clauses,literals = self.__estimate_size(nnf,to_cnf)
+        if budget["max_clauses"] is not None and clauses > budget["max_clauses"]:
+            raise ConversionBudgetExceeded("max_clauses",budget["max_clauses"],clauses)
+        nodes = 2 * literals + 2 * clauses
+        if budget["max_nodes"] is not None and nodes > budget["max_nodes"]:
+            raise ConversionBudgetExceeded("max_nodes",budget["max_nodes"],nodes)
+
+    def __tseitin(self,nnf):
+        '''
+        Encodes an f_list in NNF as a CNF that's satisfiable exactly when the f_list is,
+        with one clause per connective instead of distributing (the Tseitin encoding)
+        Every conjunction and disjunction gets a new variable, named _1, _2, ...,
+        which has to be True only if the subformula is:
+        - for a conjunction X of parts P1, P2, ...: the clauses !XvP1, !XvP2, ...
+        - for a disjunction X of parts P1, P2, ...: the clause !XvP1vP2v...
+        Since the formula is in NNF, the other direction isn't needed
+        Returns a list of clauses, like __normalize
+        '''
+
+        clauses = []
+        names = {} # id(node) -> (node, literal standing for it)
+        new_variables = 0
+        stack = [(nnf,False)]
+        while stack:
+            node,children_done = stack.pop()
+            if id(node) in names:
+                continue
+
+            if type(node) != list or (len(node) == 2 and node[0] == '!'):
+                normalized = self.__normalize_literal(node,True)
+                if normalized == [()] or normalized == []:
+                    # True and False become variables too, ones that always have that value
+                    new_variables += 1
+                    name = "_" + str(new_variables)
+                    clauses.append((name,) if normalized == [] else ("!" + name,))
+                else:
+                    name = normalized[0][0]
+                names[id(node)] = (node,name)
+                continue
+
+            parts = [part for part in node if part != 'a' and part != 'v']
+            if not children_done:
+                stack.append((node,True))
+                for part in parts:
+                    if id(part) not in names:
+                        stack.append((part,False))
+                continue
+
+            literals = [names[id(part)][1] for part in parts]
+            if len(parts) == 1:
+                names[id(node)] = (node,literals[0])
+                continue
+            new_variables += 1
+            name = "_" + str(new_variables)
+            if node[1] == 'a':
+                for literal in literals:
+                    clauses.append(("!" + name,literal))
+            else:
+                clauses.append(tuple(["!" + name] + literals))
+            names[id(node)] = (node,name)
+
+        clauses.append((names[id(nnf)][1],))
+        return clauses
+
+    def __clauses_to_list(self,clauses,*,to_cnf):
+        '''
+        Turns a list of clauses (or terms), as returned by __normalize, back into an f_list
+        For example, [('A','!B'),('C',)] becomes [['A','v',['!','B']],'a','C'] for CNF
+        A single clause is returned as a plain disjunction (or conjunction for DNF): ['A','v',['!','B']]
+        An always true formula is returned as [True], an always false one as [False]
+        '''
+
+        joining,inner = ('a','v') if to_cnf else ('v','a')
+        if len(clauses) == 0:
+            return [to_cnf]
+        if () in clauses:
+            return [not to_cnf]
+
+        def literal_to_list(literal):
+            return ['!',literal[1:]] if literal[0] == '!' else literal
+
+        if len(clauses) == 1:
+            return self.__join_parts([literal_to_list(literal) for literal in clauses[0]],inner) \
+                if len(clauses[0]) > 1 else [literal_to_list(clauses[0][0])]
+
+        f_list = []
+        for clause in clauses:
+            if len(clause) == 1:
+                f_list.append(literal_to_list(clause[0]))
+            else:
+                f_list.append(self.__join_parts([literal_to_list(literal) for literal in clause],inner))
+            f_list.append(joining)
+        return f_list[:-1]
+
+    def to_cnf(self,f_list,return_string=False,*,max_clauses=None,max_nodes=None,timeout=None,fallback=False,
+            workers=None):
+        '''
+        Converts a given f_list (or formula string) to its CNF form
+        If specified, returns in string form
+
+        Distributing can make the CNF exponentially bigger than the formula, so budgets can be given:
+        - max_clauses / max_nodes: the size of the result is estimated from the formula before distributing,
+          and the conversion stops right away if it would be too big
+        - timeout: seconds the conversion may take
+        Going over a budget raises ConversionBudgetExceeded, unless fallback is True.
+        Then the Tseitin encoding is returned instead (see __tseitin): it's only satisfiable
+        when the formula is, rather than equivalent to it, and uses extra variables named _1, _2, ...
+
+        With workers (a number of processes), the parts of the top-level conjunction (or disjunction)
+        are converted in parallel, see __normalize_in_parallel. The result is the same as without
+        '''
+
+        if workers is not None and (type(workers) != int or workers < 1):
+            raise ValueError("workers has to be a positive integer")
+
+        budget = self.__make_budget(max_clauses,max_nodes,timeout)
+
+        # if given a formula still in string form, converts to f_list form first
+        if type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            f_list = self.formula_to_list(f_list)
+        
+        def convert(f_list):
+            # removes implications and moves negations inwards (necessary prerequisite for making a CNF)
+            nnf = self.__nnf_front_end(f_list,conjunctive=True)
+
+            # cleans the f_list, eventually making it into a CNF form
+            try:
+                return self.__clean_list(nnf,to_cnf=True,budget=budget,workers=workers)
+            except ConversionBudgetExceeded as e:
+                if not fallback:
+                    raise
+                self.__trace("%s, using the Tseitin encoding instead",e)
+                self.__emit("fallback",budget=e.budget,limit=e.limit,size=e.size)
+                return self.__clauses_to_list(self.__tseitin(nnf),to_cnf=True)
+
+        # with a budget the result can be a fallback encoding, so only unlimited conversions are cached
+        f_list = self.__cached("to_cnf",f_list,convert) if budget is None else convert(f_list)
+
+        if return_string:
+            return self.__list_to_formula(f_list)
+        else:
+            return f_list
+    
+    def to_dnf(self,f_list,return_string=False,*,max_clauses=None,max_nodes=None,timeout=None):
+        '''
+        Converts a given f_list (or formula string) to its DNF form
+        If specified, returns in string form
+        Takes the same budgets as to_cnf (max_clauses counts the terms of the DNF),
+        there's no fallback encoding for a DNF, so going over one always raises ConversionBudgetExceeded
+        '''
+
+        budget = self.__make_budget(max_clauses,max_nodes,timeout)
+
+        # if given a formula still in string form, converts to f_list form first
+        if type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            f_list = self.formula_to_list(f_list)
+        
+        def convert(f_list):
+            # removes implications and moves negations inwards (necessary prerequisite for making a DNF)
+            f_list = self.__nnf_front_end(f_list)
+
+            # cleans the f_list, eventually making it into a DNF form
+            return self.__clean_list(f_list,to_cnf=False,budget=budget)
+
+        f_list = self.__cached("to_dnf",f_list,convert) if budget is None else convert(f_list)
+
+        if return_string:
+            return self.__list_to_formula(f_list)
+        else:
+            return f_list
+    
+    def iter_cnf_clauses(self,f_list,*,skip_tautologies=True,skip_duplicates=False):
+        '''
+        Yields the clauses of the CNF of a given f_list (or formula string) one at a time,
+        each as a tuple of literals like ('A','!B'), without building the whole CNF
+        For writing the clauses of a big conversion to a file or a SatSession as they come
+
+        Clauses are made by walking the distribution as nested generators: a conjunction yields the clauses
+        of its parts one after another, a disjunction yields one clause for every combination of its parts' clauses,
+        taking them from the parts' generators again for every combination instead of keeping them.
+        So only one clause per level of the formula is held at a time, at the price of regenerating them
+        - skip_tautologies leaves out clauses with a literal and its negation, like Av!AvB,
+          and stops combining as soon as a partial clause is one
+        - skip_duplicates leaves out clauses with the same literals as an earlier one,
+          which needs every clause seen so far to be remembered, so it's off by default
+        The formula False yields the empty clause (), the formula True yields nothing
+        '''
+
+        if type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            f_list = self.formula_to_list(f_list)
+        nnf = self.__to_nnf(f_list,conjunctive=True)
+
+        def clauses(node):
+            if type(node) != list or (len(node) == 2 and node[0] == '!'):
+                yield from self.__normalize_literal(node,True)
+            elif len(node) == 1 or node[1] == 'a':
+                for part in node[::2]:
+                    yield from clauses(part)
+            else:
+                yield from combine(node[::2],())
+
+        def combine(parts,prefix):
+            if not parts:
+                yield prefix
+                return
+            for clause in clauses(parts[0]):
+                combined = prefix + tuple(literal for literal in clause if literal not in prefix)
+                if skip_tautologies and any(self.__negate_literal(literal) in combined for literal in clause):
+                    continue
+                yield from combine(parts[1:],combined)
+
+        seen = set()
+        for clause in clauses(nnf):
+            if skip_duplicates:
+                key = frozenset(clause)
+                if key in seen:
+                    continue
+                seen.add(key)
+            yield clause
+
+    def __negate_literal(self,literal):
+        return literal[1:] if literal.startswith("!") else "!" + literal
+
+    def minimize(self,f_list,*,form="dnf",return_string=False,exact_limit=8):
+        '''
+        Returns a minimal (or close to minimal) DNF or CNF of a given f_list (or formula string),
+        as a tuple: (the result, a report of how much smaller it is than what to_dnf / to_cnf gives)
+        form is "dnf" (sum of products) or "cnf" (product of sums)
+
+        With at most exact_limit variables, the result is exactly minimal (Quine-McCluskey and Petrick's method),
+        with more an Espresso-style heuristic is used, which never builds the truth table (see minimize.py)
+        A CNF is found as the negation of a minimal DNF of the negated formula
+
+        The report is a dict: {method, terms_before, terms_after, literals_before, literals_after}
+        '''
+
+        if form != "dnf" and form != "cnf":
+            raise ValueError("The form has to be either 'dnf' or 'cnf'")
+        if type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            f_list = self.formula_to_list(f_list)
+
+        to_cnf = form == "cnf"
+        f_list = self.__nnf_front_end(f_list)
+        variables = sorted(self.__variables_in_order(f_list))
+        clauses = self.__normalize(f_list,to_cnf=True)
+        terms = self.__normalize(f_list,to_cnf=False)
+
+        def to_cube(literals,negated):
+            # a term (or a negated clause) as a cube, None if it has a literal and its negation
+            cube = ["-"] * len(variables)
+            for literal in literals:
+                i = variables.index(literal.lstrip("!"))
+                value = "0" if literal.startswith("!") != negated else "1"
+                if cube[i] != "-" and cube[i] != value:
+                    return None
+                cube[i] = value
+            return "".join(cube)
+
+        # the true points of the formula are covered by the terms of its DNF,
+        # the false ones by the negated clauses of its CNF
+        # for a CNF, the negated formula is minimized, so the two are swapped
+        on_cubes = [cube for cube in (to_cube(term,False) for term in terms) if cube is not None]
+        off_cubes = [cube for cube in (to_cube(clause,True) for clause in clauses) if cube is not None]
+        if to_cnf:
+            on_cubes,off_cubes = off_cubes,on_cubes
+
+        minimizer = Minimizer(variables)
+        if len(variables) <= exact_limit:
+            def is_true(values):
+                return any(all(c == "-" or (c == "1") == value for c,value in zip(cube,values)) for cube in on_cubes)
+            cubes,greedy = minimizer.exact(minimizer.minterms(is_true))
+            method = "quine-mccluskey" + (" (greedy cover)" if greedy else "")
+        else:
+            cubes = minimizer.heuristic(on_cubes,off_cubes)
+            method = "espresso"
+
+        # cubes back to terms, or for a CNF, negated into clauses
+        minimized = []
+        for cube in cubes:
+            minimized.append(tuple(("!" if (c == "0") != to_cnf else "") + variable
+                for c,variable in zip(cube,variables) if c != "-"))
+
+        before = clauses if to_cnf else terms
+        report = {"method" : method,
+            "terms_before" : len(before), "terms_after" : len(minimized),
+            "literals_before" : sum(len(clause) for clause in before),
+            "literals_after" : sum(len(clause) for clause in minimized)}
+        self.__trace("Minimized to %s with %s: %d -> %d terms, %d -> %d literals",form.upper(),method,
+            report["terms_before"],report["terms_after"],report["literals_before"],report["literals_after"])
+
+        f_list = self.__clauses_to_list(minimized,to_cnf=to_cnf)
+        if return_string:
+            return self.__list_to_formula(f_list),report
+        return f_list,report
+
+    def condition(self,f_list,values,return_string=False):
+        '''
+        Fixes the values of some literals in a given f_list (or formula string), and simplifies the result
+        values is a dict like {'A' : True, '!B' : True}, the second one meaning B is False
+        Returns the residual formula, for example Aa(BvC) with A True and B False becomes C
+        If everything is decided, the result is [True] or [False]
+
+        Constants are folded at every depth, in one pass, following the usual precedence (see __to_nnf):
+        - AaFalse is False, AaTrue is A, AvTrue is True, AvFalse is A
+        - False->A and A->True are True, True->A is A, A->False is !A
+
+        Only the brackets that contain one of the given literals are rebuilt, the rest of the result
+        is shared with the given f_list, which isn't modified. To find those brackets,
+        an occurrence index (literal -> brackets it's in) is built. For a formula string it's kept,
+        so conditioning the same string again skips that step. An f_list is indexed every time,
+        since it can change between calls, and checking that it didn't costs as much as indexing it
+        '''
+
+        fixed = {}
+        for literal,value in values.items():
+            if type(value) != bool or type(literal) != str or literal in ("","!"):
+                raise ValueError("values has to map literals like 'A' or '!A' to True / False")
+            if literal.startswith("!"):
+                fixed[literal[1:]] = not value
+            else:
+                fixed[literal] = value
+
+        cache = self._condition_cache
+        if type(f_list) == str and cache is not None and cache[0] == f_list:
+            f_list,occurrences,parents = cache[1:]
+        elif type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            formula = f_list
+            f_list = self.formula_to_list(formula)
+            occurrences,parents = self.__occurrence_index(f_list)
+            # the parsed f_list is only used here, so the ids in the index stay valid
+            self._condition_cache = (formula,f_list,occurrences,parents)
+        else:
+            occurrences,parents = self.__occurrence_index(f_list)
+
+        # every bracket that contains a fixed literal, at any depth, has to be rebuilt
+        touched = set()
+        stack = [bracket for literal in fixed for bracket in occurrences.get(literal,())]
+        while stack:
+            bracket = stack.pop()
+            if bracket not in touched:
+                touched.add(bracket)
+                stack.extend(parents[bracket])
+        self.__trace("Conditioning on %s rebuilds %d of %d brackets",fixed,len(touched),len(parents))
+
+        if id(f_list) in touched:
+            result = self.__condition_bracket(f_list,fixed,touched)
+        else:
+            result = f_list
+        if type(result) != list or (len(result) == 2 and result[0] == '!' and type(result[1]) != list):
+            result = [result]
+
+        if return_string:
+            return self.__list_to_formula(result)
+        return result
+
+    def __occurrence_index(self,f_list):
+        '''
+        Helper for condition, goes through an f_list once and returns:
+        - literal -> ids of the brackets (lists) the literal is directly in
+        - id of a bracket -> ids of the brackets it's directly in (more than one if the same list is used twice)
+        The brackets themselves are kept in the second dict's keys' owners, see condition
+        '''
+
+        occurrences = {}
+        parents = {id(f_list) : []}
+        stack = [f_list]
+        while stack:
+            bracket = stack.pop()
+            for part in bracket:
+                if type(part) == list:
+                    if id(part) not in parents:
+                        parents[id(part)] = []
+                        stack.append(part)
+                    parents[id(part)].append(id(bracket))
+                elif type(part) == str and part != '!' and part not in self.CONNECTIVES:
+                    occurrences.setdefault(part,[]).append(id(bracket))
+        return occurrences,parents
+
+    def __condition_bracket(self,f_list,fixed,touched):
+        '''
+        Helper for condition, rebuilds one bracket that contains a fixed literal
+        Returns a boolean, a literal, a negation (['!',X]) or a list
+        '''
+
+        def condition_part(part):
+            if type(part) == str:
+                return fixed.get(part,part)
+            if type(part) == list and id(part) in touched:
+                return self.__condition_bracket(part,fixed,touched)
+            return part
+
+        def negate(part):
+            if type(part) == bool:
+                return not part
+            if type(part) == list and len(part) == 2 and part[0] == '!':
+                return part[1]
+            return ['!',part]
+
+        if len(f_list) == 2 and f_list[0] == '!':
+            return negate(condition_part(f_list[1]))
+
+        # operands and connectives, like in __to_nnf
+        operands = []
+        connectives = []
+        negations = 0
+        for part in f_list:
+            if part == '!':
+                negations += 1
+            elif part in self.CONNECTIVES:
+                connectives.append(part)
+            else:
+                operand = condition_part(part)
+                operands.append(negate(operand) if negations % 2 == 1 else operand)
+                negations = 0
+        if len(operands) == 1:
+            return operands[0]
+
+        def fold(operands,connectives,level):
+            # splits at the loosest connective, like __group_to_nnf, and folds the constants of every piece
+            # every nested list in the result is a bracket, so the rebuilt parts keep their meaning
+            # whatever they're put next to
+            if len(operands) == 1:
+                return operands[0]
+            while self.CONNECTIVES[level] not in connectives:
+                level -= 1
+            connective = self.CONNECTIVES[level]
+            pieces = [([operands[0]],[])]
+            for i,other in enumerate(connectives):
+                if other == connective:
+                    pieces.append(([operands[i+1]],[]))
+                else:
+                    pieces[-1][0].append(operands[i+1])
+                    pieces[-1][1].append(other)
+            parts = [fold(piece[0],piece[1],level - 1) for piece in pieces]
+            constants = [part for part in parts if type(part) == bool]
+            rest = [part for part in parts if type(part) != bool]
+
+            if connective == 'a' or connective == 'v':
+                # False decides a conjunction and True a disjunction, the other one can be left out
+                deciding = connective == 'v'
+                if deciding in constants:
+                    return deciding
+                return self.__join_parts(rest,connective) if rest else not deciding
+
+            if connective == '->':
+                result = parts[-1]
+                for left in reversed(parts[:-1]):
+                    if left == False and type(left) == bool or result == True and type(result) == bool:
+                        result = True
+                    elif type(left) == bool:
+                        pass # True->X is X
+                    elif result == False and type(result) == bool:
+                        result = negate(left)
+                    else:
+                        result = [left,'->',result]
+                return result
+
+            # for 'x' a True flips the rest (Xx True is !X), for '<->' a False does (X<->False is !X)
+            flips = sum(1 for constant in constants if constant == (connective == 'x')) % 2 == 1
+            if not rest:
+                # the constants' parity, and a chain of n biconditionals flips it n-1 times
+                value = sum(constants) % 2 == 1
+                return value != (connective == '<->' and len(constants) % 2 == 0)
+            result = self.__join_parts(rest,connective)
+            return negate(result) if flips else result
+
+        return fold(operands,connectives,len(self.CONNECTIVES) - 1)
+
+    def export_truth_table(self,f_list,path,variables=None,*,chunk_bits=1 << 23):
+        '''
+        Writes the full truth table of a given f_list (or formula string) to a file, one bit per interpretation,
+        and returns it opened as a TruthTableFile (see truthtable.py for the layout), which looks up
+        any interpretation through a memory map, without reading the whole file
+        variables sets the order of the variables, by default it's the order they first appear in the formula
+        The table is filled chunk by chunk, evaluating chunk_bits interpretations at once bit-parallel,
+        so tables of 30+ variables (gigabytes) are written without holding them in memory
+        '''
+
+        from .truthtable import TruthTableFile, write_truth_table
+
+        if type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            f_list = self.formula_to_list(f_list)
+        used = self.__variables_in_order(f_list)
+        variables = used if variables is None else list(variables)
+        if not set(used) <= set(variables):
+            raise ValueError("The formula uses variables that aren't given: " + ", ".join(sorted(set(used) - set(variables))))
+        if type(chunk_bits) != int or chunk_bits < 8:
+            raise ValueError("chunk_bits has to be an integer of at least 8")
+
+        start = perf_counter()
+        chunks = write_truth_table(path,variables,self.__share_subformulas(self.__to_nnf_list(f_list)),chunk_bits)
+        self.__trace("Wrote the truth table of %d variables to %s in %d chunks",len(variables),path,chunks)
+        if self._trace_sink is not None:
+            self.__emit("truth_table",variables=len(variables),chunks=chunks,seconds=perf_counter()-start)
+        return TruthTableFile(path)
+
+    def formula_size(self,f_list):
+        '''
+        Reports the size of a given f_list (or formula string) in NNF, with and without sharing
+        the subformulas that appear more than once, as a dict (see FormulaDAG.size):
+        {nodes, bytes, tree_nodes, tree_bytes}
+        Useful on the result of a conversion too, to see how much of it repeats
+        '''
+
+        if type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            f_list = self.formula_to_list(f_list)
+        dag = FormulaDAG()
+        return dag.size(dag.add(self.__to_nnf(f_list)))
+
+    def to_clause_set(self,f_list):
+        '''
+        Converts a given f_list (or formula string) to CNF, returned as a ClauseSet (see clauses.py)
+        Literals are signed integers there, and tautologies, duplicate and subsumed clauses are left out,
+        so (AvB)a(Av!A)aA becomes just A
+        '''
+
+        if type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            f_list = self.formula_to_list(f_list)
+
+        f_list = self.__nnf_front_end(f_list,conjunctive=True)
+        # variables are registered in the order they appear in the formula
+        clause_set = ClauseSet(variables=self.__variables_in_order(f_list))
+        for clause in self.__normalize(f_list,to_cnf=True):
+            clause_set.add_clause(clause)
+        return clause_set
+
+    def compile(self,f_list):
+        '''
+        Compiles a given f_list (or formula string) into decision-DNNF, returns a CompiledFormula (see ddnnf.py)
+        Compiling can take a while, but the result answers satisfiability, model counts, entailment
+        and conditioning on some of the variables in time linear in its size, however many questions are asked
+        '''
+
+        from .ddnnf import compile_clause_set
+
+        clause_set = self.to_clause_set(f_list)
+        start = perf_counter()
+        compiled,cache_hits = compile_clause_set(clause_set)
+        self.__trace("Compiled into %d d-DNNF nodes (%d cache hits)",len(compiled),cache_hits)
+        if self._trace_sink is not None:
+            self.__emit("compile",clauses=len(clause_set),nodes=len(compiled),cache_hits=cache_hits,
+                seconds=perf_counter()-start)
+        return compiled
+
+    def evaluate_batch(self,f_list,assignments,variables=None):
+        '''
+        Evaluates a given f_list (or formula string) on many interpretations at once, needs NumPy
+        assignments has one row per interpretation and one column per variable, either:
+        - a 2-D NumPy array of bools
+        - packed bytes, as made by numpy.packbits(array,axis=1): every row takes (number of variables + 7) // 8 bytes,
+          and the first variable is the highest bit of the row's first byte
+        variables names the columns, by default they're the variables in the order they first appear in the formula
+        Returns a NumPy vector of bools, one per row
+
+        The formula is converted to NNF once, then every connective is applied to whole columns
+        (numpy.logical_and / logical_or over its operands, ~ for negated literals), so the work per row
+        is a few vectorized operations per node, instead of rewriting the f_list for every interpretation
+        '''
+
+        import numpy
+
+        if type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            f_list = self.formula_to_list(f_list)
+        if variables is None:
+            variables = self.__variables_in_order(f_list)
+        variables = list(variables)
+
+        if type(assignments) in (bytes,bytearray,memoryview):
+            row_bytes = (len(variables) + 7) // 8
+            packed = numpy.frombuffer(assignments,dtype=numpy.uint8)
+            if row_bytes == 0 or len(packed) % row_bytes != 0:
+                raise ValueError("Packed assignments have to take " + str(row_bytes) + " bytes per row")
+            assignments = numpy.unpackbits(packed.reshape(-1,row_bytes),axis=1,count=len(variables)).astype(bool)
+        else:
+            assignments = numpy.asarray(assignments)
+            if assignments.ndim != 2 or assignments.dtype != bool:
+                raise ValueError("Assignments have to be a 2-D array of bools or packed bytes")
+        if assignments.shape[1] != len(variables):
+            raise ValueError("Assignments have " + str(assignments.shape[1]) + " columns for "
+                + str(len(variables)) + " variables")
+
+        columns = {name : assignments[:,i] for i,name in enumerate(variables)}
+        rows = assignments.shape[0]
+        computed = {} # id(part) -> (part, its column), parts used in several places are computed once
+
+        def column(part):
+            # part is an NNF part: a literal, a negated literal, a boolean, or a list joined by one connective
+            if type(part) == bool:
+                return numpy.full(rows,part)
+            if type(part) == str:
+                if part not in columns:
+                    raise ValueError("No column for variable " + part)
+                return columns[part]
+            if len(part) == 2 and part[0] == '!':
+                return ~column(part[1])
+            if id(part) not in computed:
+                operands = [column(operand) for operand in part[::2]]
+                combine = numpy.logical_and if len(part) > 1 and part[1] == 'a' else numpy.logical_or
+                computed[id(part)] = (part,combine.reduce(operands))
+            return computed[id(part)][1]
+
+        start = perf_counter()
+        result = numpy.array(column(self.__to_nnf(f_list)),dtype=bool)
+        self.__trace("Evaluated %d interpretations",rows)
+        if self._trace_sink is not None:
+            self.__emit("evaluate_batch",rows=rows,variables=len(variables),seconds=perf_counter()-start)
+        return result
+
+    def __variables_in_order(self,f_list):
+        '''
+        Returns the variables of an f_list in the order they first appear, without duplicates
+        '''
+        variables = {}
+        stack = [f_list]
+        while stack:
+            part = stack.pop()
+            if type(part) == list:
+                stack.extend(reversed(part))
+            elif type(part) == str and part != '!' and part not in self.CONNECTIVES:
+                variables.setdefault(part)
+        return list(variables)
+
+    def __get_true_interpretations(self,f_list):
+        '''
+        Returns a tuple: (list of literals, list of true interpretations)
+        For example:
+        (['Q','T'],[[True,True],[True,False]]) means that:
+        - the literals in the formula are Q and T
+        - the formula is True of both are True, or when Q is True and T is False
+        (the order used is the same, so when Q is first in the list of literals, the first bool value corresponds to Q)
+        Interpretations come in Gray-code order, see ClauseSet.models
+
+        Extras:
+        It's possible to get back a tuple like this ([A,B,C],[])
+        This means that there are no true interpretations of the formula, == it's a contradiction
+        '''
+
+        # the formula is turned into a clause set first (see to_clause_set),
+        # so redundant clauses aren't evaluated again for every interpretation
+        clause_set = f_list if type(f_list) == ClauseSet else self.to_clause_set(f_list)
+        literals = list(clause_set.variables)
+
+        # goes through every possible truth value combination, one variable flipping at a time (see ClauseSet.models)
+        # for example, with literals A and B they are [True,True], [True,False], [False,False], and [False,True]
+        true_interpretations = [list(pos) for pos in clause_set.models()]
+
+        if self._trace_sink is not None:
+            self.__emit("interpretations",literals=len(literals),true_interpretations=len(true_interpretations),
+                clauses=len(clause_set),removed_clauses=sum(clause_set.removed.values()))
+        return (literals,true_interpretations)
+    
+    def is_tautology(self,f_list):
+        '''
+        Checks whether a given f_list is a tautology
+        It uses the internal method get_true_interpretations,
+        which returns a tuple of (literals, list of true interpretations).
+        A tautology is always True, so the list of true interpretations should hold all of them
+        Since every literal can have 2 states,
+        that means 2**(number of literals) is total number of possible interpretations
+        '''
+
+        def check(f_list):
+            if self._portfolio is not None:
+                # a tautology is a formula whose negation can't be satisfied
+                if type(f_list) == str:
+                    f_list = self.formula_to_list(f_list)
+                return not self.__satisfiable(['!',f_list])
+            literals, true_interpretations = self.__get_true_interpretations(f_list)
+            return len(true_interpretations) == 2**len(literals)
+
+        return self.__cached("is_tautology",f_list,check)
+    
+    def is_contradiction(self,f_list):
+        '''
+        Checks whether a given f_list is a contradiction
+        It uses the internal method get_true_interpretations,
+        which returns a tuple of (literals, list of true interpretations).
+        A contradiction is always False, so the list of true interpretations has to be empty
+        That's the same as not being satisfiable, so it's checked the same way, see __satisfiable
+        '''
+
+        return not self.__satisfiable(f_list)
+
+    def is_satisfiable(self,f_list):
+        '''
+        Checks whether a given f_list is satisfiable
+        It uses the internal method get_true_interpretations,
+        which returns a tuple of (literals, list of true interpretations).
+        A satisfiable formula should have at least 1 true interpretations, so that is checked
+        2-CNF and Horn formulas are solved in linear time instead, see __satisfiable
+        '''
+
+        return self.__satisfiable(f_list,trace_interpretations=True)
+
+    def __satisfiable(self,f_list,trace_interpretations=False):
+        '''
+        Helper for is_satisfiable and is_contradiction, picks the engine from the shape of the formula:
+        - gauss: a conjunction with exclusive ors and biconditionals among its parts, solved by Gaussian elimination
+          before any conversion, since their CNF can be exponential (see __solve_with_parity)
+        - 2sat: every clause has at most two literals, solved with the implication graph (see fragments.py)
+        - horn: every clause has at most one positive literal, solved by marking the forced variables
+        - truth_table: anything else, every interpretation is evaluated (see __get_true_interpretations)
+        - portfolio:<engine>: anything else, when a Portfolio is used (see use_portfolio), with the engine that won
+        2sat and horn take linear time, gauss polynomial time, the engine used is counted in stats under "satisfiability"
+        '''
+        return self.__cached("is_satisfiable",f_list,
+            lambda f_list: self.__solve_satisfiability(f_list,trace_interpretations))
+
+    def __split_parity(self,f_list):
+        '''
+        Splits the top-level conjunction of an f_list into parity constraints, made of only exclusive ors,
+        biconditionals, negations, variables and constants, and the rest of its parts
+        Returns (constraints, rest), the constraints in the form fragments.solve_parity takes
+        and the rest as f_lists, or None if there's no exclusive or / biconditional among the constraints
+        Both connectives are linear over GF(2), AxB is A+B and A<->B is A+B+1, so however a
+        constraint is grouped it's the sum of its variables, plus a constant
+        '''
+
+        parity_found = False
+
+        def split(part):
+            # the operands of a bracket, each with whether it's negated, and its connectives
+            operands,connectives = [],[]
+            negated = False
+            for token in part:
+                if token == '!':
+                    negated = not negated
+                elif type(token) == str and token in self.CONNECTIVES:
+                    connectives.append(token)
+                else:
+                    operands.append((token,negated))
+                    negated = False
+            return operands,connectives
+
+        def linear(part):
+            # (variables with an odd number of occurrences, constant), or None
+            nonlocal parity_found
+            if type(part) == bool:
+                return set(),part
+            if type(part) == str:
+                return {part},False
+            operands,connectives = split(part)
+            if any(connective != 'x' and connective != '<->' for connective in connectives):
+                return None
+            parity_found = parity_found or len(connectives) > 0
+            variables = set()
+            constant = connectives.count('<->') % 2 == 1
+            for operand,negated in operands:
+                result = linear(operand)
+                if result is None:
+                    return None
+                variables ^= result[0]
+                constant ^= result[1] ^ negated
+            return variables,constant
+
+        constraints = []
+        rest = []
+        stack = [(f_list,False)]
+        while stack:
+            part,negated = stack.pop()
+            if type(part) == list and not negated:
+                operands,connectives = split(part)
+                if all(connective == 'a' for connective in connectives):
+                    stack.extend(reversed(operands))
+                    continue
+            result = linear(part)
+            if result is None:
+                rest.append(['!',part] if negated else part)
+            else:
+                # the constraint holds when the sum is 1
+                constraints.append((result[0],result[1] == negated))
+        return (constraints,rest) if parity_found else None
+
+    def __solve_with_parity(self,constraints,rest):
+        '''
+        Helper for __solve_satisfiability, checks parity constraints together with the other parts
+        of a conjunction (see __split_parity). The constraints are solved by Gaussian elimination first,
+        then, if there are other parts, the models of their CNF are enumerated (see ClauseSet.models)
+        until one leaves the constraints solvable, with the variables they share fixed
+        Only the shared variables matter to the constraints, so every combination of them is checked once
+        '''
+
+        from . import fragments
+
+        variables = sorted({name for names,_ in constraints for name in names})
+        if fragments.solve_parity(constraints,variables) is None:
+            return False
+        if not rest:
+            return True
+
+        clause_set = self.to_clause_set(self.__join_parts(rest,'a'))
+        shared = [i for i,name in enumerate(clause_set.variables) if name in variables]
+        checked = set()
+        for model in clause_set.models():
+            values = tuple(model[i] for i in shared)
+            if values in checked:
+                continue
+            checked.add(values)
+            fixed = [({clause_set.variables[i]},value) for i,value in zip(shared,values)]
+            if fragments.solve_parity(constraints + fixed,variables) is not None:
+                return True
+        return False
+
+    def __solve_satisfiability(self,f_list,trace_interpretations):
+        from . import fragments
+
+        start = perf_counter()
+        if type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            f_list = self.formula_to_list(f_list)
+
+        # parity constraints would blow up in CNF, so they're split off before converting
+        parity = self.__split_parity(f_list)
+        clause_set = self.to_clause_set(f_list) if parity is None else None
+        if parity is not None:
+            engine,satisfiable = "gauss",self.__solve_with_parity(*parity)
+        elif fragments.is_2cnf(clause_set):
+            engine,satisfiable = "2sat",fragments.solve_2sat(clause_set) is not None
+        elif fragments.is_horn(clause_set):
+            engine,satisfiable = "horn",fragments.solve_horn(clause_set) is not None
+        elif self._portfolio is not None:
+            satisfiable,winner = self._portfolio.solve(f_list)
+            engine = "portfolio:" + winner
+        else:
+            literals, true_interpretations = self.__get_true_interpretations(clause_set)
+            if trace_interpretations and self.__tracing():
+                self.__trace("List of literals: %s",literals)
+                for pos in true_interpretations:
+                    self.__trace("Possible True interpretation: %s",pos)
+            engine,satisfiable = "truth_table",len(true_interpretations) > 0
+        seconds = perf_counter() - start
+
+        self.__trace("Solved with the %s engine: %s",engine,"satisfiable" if satisfiable else "unsatisfiable")
+        if self._collecting_stats:
+            record = self._stats.setdefault("satisfiability",{"calls" : 0, "seconds" : 0.0,
+                "2sat" : 0, "horn" : 0, "truth_table" : 0})
+            record["calls"] += 1
+            record["seconds"] += seconds
+            record[engine] = record.get(engine,0) + 1
+        if self._trace_sink is not None:
+            # parity constraints and other parts count as the clauses of the gauss engine
+            clauses = sum(len(parts) for parts in parity) if clause_set is None else len(clause_set)
+            self.__emit("satisfiability",engine=engine,satisfiable=satisfiable,clauses=clauses,
+                seconds=seconds)
+        return satisfiable
+
+    def string_to_definite_rules(self,string):
+        '''
+        1. Accepts a string of a logical formula
+        2. Converts it into CNF
+        3. Processes the definite clauses of the CNF into rules
+        '''
+
+        # turns the string into an f_list representation of the formula
+        f_list = self.formula_to_list(string)
+
+        f_list = self.to_cnf(f_list)
+
+        
+        if self.__tracing():
+            self.__trace("CNF form of the given formula:\n%s",self.__list_to_formula(f_list))
+
+        # takes the CNF formula, extracts rules from it
+        self.__make_definite_rules(f_list)
+
+    def __make_definite_rules(self,f_list):
+        '''
+        Accepts an f_list in CNF form
+        Extracts rules from it
+        Adds the rules to this LogicProgram object's dict of rules
+
+        Basic explanation:
+        - a clause like (Qv!T) makes a T -> Q rule
+        - a clause like (Qv!Tv!W) makes a T,W -> Q rule
+        - a clause like Q makes a -> Q rule
+        - these rules are used for making queries
+        - check the make_query method for an explanation on queries
+        '''
+
+        if (self.__is_disjunction(f_list)):
+            # in the case of 'QvT', puts it in brackets
+            # this is because it iterates over clauses, and QvT is one clause
+            f_list = [f_list]
+        
+        def count_positives(clause):
+            '''
+            Counts the positive literals in a given clause
+            '''
+
+            positive_count = 0
+            for literal in clause:
+                if type(literal) != list and literal != 'v':
+                    positive_count += 1
+            return positive_count
+        
+        def get_positive(clause):
+            '''
+            Returns the positive literal of a given clause
+            Should only be used after it's certain there's only one
+            '''
+
+            for literal in clause:
+                if type(literal) != list and literal.isupper():
+                    return literal
+            raise ValueError
+        
+        def get_turned_negatives(clause):
+            '''
+            Makes a list of all negated literals in a clause
+            Removes the negations and returns the list
+            '''
+
+            negatives = []
+            for literal in clause:
+                if type(literal) == list and len(literal) == 2:
+                    negatives.append(literal[1])  # removing the negation
+            if len(negatives) == 1:
+                return negatives[0]
+            return negatives
+        
+        for clause in f_list:
+            
+            # cycling through the clauses of the CNF
+            # looking for definite clauses (1 positive literal, rest is negative)
+            if clause != 'a':
+                if type(clause) != list:
+                    # rule in the form ->S
+                    self._definite_rules[clause] = True
+                    self._known_literals.add(clause)
+                else:
+                    # for-loop used for keeping track of all literals the program has encountered
+                    for symbol in clause:
+                        if type(symbol) == list and len(symbol) == 2:
+                            self._known_literals.add(symbol[1]) # was a negation, adding only the symbol
+                        elif type(symbol) != list and symbol != 'v':
+                            self._known_literals.add(symbol)
+                    
+                    if count_positives(clause) == 1:
+                        # this is a definite clause, can extract a rule from it
+                        positive = get_positive(clause)
+                        turned_negatives = get_turned_negatives(clause)
+                        already_there = self._definite_rules.get(positive,None)
+                        if already_there != None and already_there != True:
+                            self._definite_rules[positive].append(turned_negatives)
+                        elif already_there == None: # we don't want to overwrite a True
+                            self._definite_rules[positive] = [turned_negatives]
+
+    def __datalog_program(self):
+        if self._datalog is None:
+            from .datalog import DatalogProgram
+            self._datalog = DatalogProgram()
+        return self._datalog
+
+    def make_query(self,query):
+        '''
+        Making a query means asking if, with the known rules, a given literal is definitely true
+        For example, the rules are A->B, ->A
+        Querying for B returns True, because A is true, and A->B is True, so B must be True as well
+        However, querying for X returns False, because we don't know anything about X, it can be True or False
+        Raises ValueError if given an invalid input
+
+        Example of a query process:
+            1. you query for the literal 'S'
+            2. the program tries to find a rule in the form of 'something'->S
+            3. if there is no such rule, returns False (S is not definitely true)
+            4. if it finds a rule in the form of '-> S', returns True
+            5. otherwise, replaces S with the 'something' it found
+            6. makes a new query with the 'something'
+            7. this is repeated until the program has a definite True or False answer
+            
+            Extra:
+            - sometimes, a query becomes a list of literals
+            - for example, you have a rule A,B->C and are querying for C
+            - now, your query becomes A,B
+            - next, you query elements of your 'query list' from left to right
+                until you've reached some result (either success or failure)
+
+        Queries about predicates (see add_rule) look like 'reach(a,Z)'
+        They return the list of answers, one dict per answer from the variables to their values,
+        for example [{'Z' : 'b'}, {'Z' : 'c'}]. A query without variables, like 'reach(a,c)', returns True / False
+        '''
+
+        if type(query) == str and "(" in query:
+            if self._trace_sink is not None:
+                self.__emit("query",query=query)
+            program = self.__datalog_program()
+            answers = program.query(query)
+            if program.is_ground(query):
+                return len(answers) > 0
+            return answers
+
+        if type(query) != list and (type(query) != str or len(query) > 1 or not query.isupper()):
+            raise ValueError("Invalid input. Queries should be single-character, uppercase strings")
+
+        if type(query) == list and len(query) == 1:
+            query = query[0]
+
+        if self._trace_sink is not None:
+            self.__emit("query",query=query)
+        
+        if type(query) != list:
+            # looking for a single literal, for example 'S'
+            result = self._definite_rules.get(query,False)
+            if type(result) == bool:
+                return result # returns True if it found an end to the query, false if it is a dead end
+            
+            branching_results = []
+            for possible_direction in result:
+                # it is stored in one big [], so that rules that lead to the same literal don't conflict
+                # for example S->T and QaR->T are stored as [S,[Q,R]]
+                branching_results.append(self.make_query(possible_direction))
+            return True in branching_results
+        elif len(query) == 0:
+            return True
+        else:
+            new_query = []
+            for q in query:
+                if type(q) == list:
+                    new_query = q + new_query
+                else:
+                    new_query.append(q)
+            query = new_query
+            result = self._definite_rules.get(query[0],False)
+            if result == False:
+                return False
+            if result == True:
+                return self.make_query(query[1:])
+            
+            branching_results = []
+            for possible_direction in result:
+                branching_results.append(self.make_query([possible_direction] + query[1:]))
+            
+            return True in branching_results
+    
+    def make_shortcuts(self):
+        '''
+        Goes through the program's known literals, and makes a query for each
+        If a query for X returns True, replaces the ruleset to get X with True
+        
+        Basically it means: If we know that X can reach True eventually, let it reach True immediately
+        This makes further queries faster because it doesn't have to 'take the same path' many times
+        This is not default behaviour, so call it after making a query if you want to use it
+        '''
+
+        for symbol in self._known_literals:
+            if self._definite_rules.get(symbol,None) != True:
+                query_result = self.make_query(symbol)
+                if query_result == True:
+                    self._definite_rules[symbol] = True
+
+    def _is_valid_rule(self,rule_string):
+        '''
+        Checks whether a given rule is in the valid format
+        Valid format looks like this: 'A', 'A->B', 'A,B->C'
+        or for rules over predicates: 'edge(a,b)', 'edge(X,Y)->reach(X,Y)'
+        '''
+
+        if "(" in rule_string:
+            return self.__datalog_program().is_valid_rule(rule_string)
+
+        if "->" not in rule_string:
+            return len(rule_string) == 1 and rule_string[0].isupper()
+        
+        if rule_string.count("-") != 1 or rule_string.count(">") != 1:
+            return False
+        
+        pre_arrow = rule_string[:rule_string.index("-")].split(",")
+        post_arrow = rule_string[rule_string.index(">")+1:]
+        if len(post_arrow) > 1 or not post_arrow.isupper():
+            return False
+        
+        for pa in pre_arrow:
+            if len(pa) > 1 or not pa.isupper():
+                return False
+        
+        return True
+           
+    def add_rule(self,rule_string):
+        '''
+        Adds a definite rule to the logic program's ruleset
+        Correct rule forms: 'A','A->B','A,B->C'
+        Simply call add_rule(rule) to add a certain rule
+        Raises ValueError if given an invalid input
+
+        Use single, uppercase letters for literals
+
+        Rules can also be about predicates with arguments (Datalog), for example:
+        'edge(a,b)', 'edge(X,Y)->reach(X,Y)', 'reach(X,Y),edge(Y,Z)->reach(X,Z)', 'node(X),!reach(a,X)->far(X)'
+        Variables start with an uppercase letter, constants with a lowercase one, see datalog.py
+        '''
+        
+        rule_string = rule_string.replace(" ","")
+        if "(" in rule_string:
+            self.__datalog_program().add_rule(rule_string)
+            return
+        if not self._is_valid_rule(rule_string):
+            raise ValueError("Invalid rule\nCorrect rule forms: 'A','A->B','A,B->C',etc.")
+        if len(rule_string) == 1:
+            result = rule_string
+            needed = None
+        else:
+            result = rule_string[-1]
+            needed = rule_string[:rule_string.index("-")].split(",")
+
+        self._known_literals.add(result)
+            
+        if needed == None:
+            self._definite_rules[result] = True
+        else:
+            for n in needed:
+                self._known_literals.add(n)
+            if self._definite_rules.get(result,None) == None:
+                self._definite_rules[result] = [needed]
+            elif self._definite_rules.get(result) != True:
+                self._definite_rules[result].append(needed)
+    
+    def __clean_list(self,f_list,*,to_cnf,budget=None,workers=None):
+        '''
+        Converts the given f_list, which has to be in NNF already (see __to_nnf), to either CNF or DNF
+        The conversion itself is done by __normalize in a single bottom-up pass,
+        this measures it (see stats) and turns the resulting clauses back into an f_list
+        With a budget, the size of the result is estimated first, and ConversionBudgetExceeded
+        is raised before distributing if it's too big
+        '''
+
+        if budget is not None:
+            self.__check_estimate(f_list,to_cnf,budget)
+
+        if self._trace_sink is not None:
+            start,nodes_before = perf_counter(),self.__count_nodes(f_list)
+
+        def normalize(nnf):
+            if workers is not None and workers > 1:
+                clauses = self.__normalize_in_parallel(nnf,to_cnf=to_cnf,budget=budget,workers=workers)
+            else:
+                clauses = self.__normalize(nnf,to_cnf=to_cnf,budget=budget)
+            return self.__clauses_to_list(clauses,to_cnf=to_cnf)
+
+        if self._collecting_stats or self._trace_sink is not None:
+            f_list,_ = self.__run_measured_pass("normalize",normalize,f_list)
+        else:
+            f_list = normalize(f_list)
+        self.__trace("Normalized to %s\nNew f_list:  %s","CNF" if to_cnf else "DNF",f_list)
+
+        if self._trace_sink is not None:
+            self.__emit("conversion",form="cnf" if to_cnf else "dnf",nodes_before=nodes_before,
+                nodes_after=self.__count_nodes(f_list),seconds=perf_counter()-start)
+        return f_list
+
+    def use_cache(self,cache,*,max_bytes=64 * 2**20):
+        '''
+        Keeps the results of to_cnf, to_dnf (without budgets) and the is_* checks in a SQLite file,
+        so they're reused across restarts and by other processes using the same file (see cache.py)
+        cache is the path of the file, a NormalizationCache, or None to stop using one
+        max_bytes limits the stored results, the least recently used ones are evicted past it
+        '''
+
+        from .cache import NormalizationCache
+
+        if cache is None or isinstance(cache,NormalizationCache):
+            self._cache = cache
+        else:
+            self._cache = NormalizationCache(cache,max_bytes=max_bytes)
+        return self._cache
+
+    def use_portfolio(self,portfolio=True,**options):
+        '''
+        Makes is_satisfiable, is_contradiction and is_tautology race several engines in separate processes
+        for formulas that aren't 2-CNF or Horn, see portfolio.py
+        portfolio is a Portfolio, True to make one from the options (engines, timeout, wins, learn),
+        or None to stop using one. The engine that won is counted in stats, as "portfolio:<engine>"
+        '''
+
+        from .portfolio import Portfolio
+
+        if portfolio is True:
+            portfolio = Portfolio(**options)
+        elif portfolio is not None and not isinstance(portfolio,Portfolio):
+            raise ValueError("portfolio has to be a Portfolio, True or None")
+        self._portfolio = portfolio
+        return portfolio
+
+    def __cached(self,operation,f_list,compute):
+        '''
+        Returns compute(f_list), looked up in the cache first if there is one (see use_cache)
+        The key is the f_list written out as a string, so equal formulas share an entry however they're given
+        '''
+
+        if self._cache is None:
+            return compute(f_list)
+        if type(f_list) == str:
+            if not self._is_valid_formula(f_list):
+                raise ValueError("The formula provided is not valid")
+            f_list = self.formula_to_list(f_list)
+
+        key = self._cache.key(operation,self.__list_to_formula(f_list))
+        result = self._cache.get(key)
+        hit = result is not None
+        if not hit:
+            result = compute(f_list)
+            self._cache.put(key,result)
+        self.__trace("Cache %s for %s",("hit" if hit else "miss"),operation)
+        if self._trace_sink is not None:
+            self.__emit("cache",operation=operation,hit=hit)
+        return result
+
+    def __run_measured_pass(self,name,function,f_list):
+        '''
+        Runs one pass of __clean_list, records its statistics and sends it as a tracing event
+        Returns the pass's result and whether it changed anything
+        '''
+
+        # the size is taken before running the pass, in case it modifies nested lists in place
+        nodes_before = self.__count_nodes(f_list)
+        start = perf_counter()
+        f_modified = function(f_list)
+        seconds = perf_counter() - start
+        changed = f_modified != f_list
+        nodes_after = self.__count_nodes(f_modified)
+
+        if self._collecting_stats:
+            record = self._stats.setdefault(name,{"calls" : 0, "rewrites" : 0, "seconds" : 0.0,
+                "nodes_before" : 0, "nodes_after" : 0, "max_nodes" : 0})
+            record["calls"] += 1
+            record["rewrites"] += int(changed)
+            record["seconds"] += seconds
+            record["nodes_before"] += nodes_before
+            record["nodes_after"] += nodes_after
+            record["max_nodes"] = max(record["max_nodes"],nodes_after)
+
+            if self._stats_callback is not None:
+                self._stats_callback({"pass" : name, "changed" : changed, "seconds" : seconds,
+                    "nodes_before" : nodes_before, "nodes_after" : nodes_after})
+
+        self.__emit("pass",**{"pass" : name, "changed" : changed, "seconds" : seconds,
+            "nodes_before" : nodes_before, "nodes_after" : nodes_after})
+        return f_modified,changed
+
+    def __count_nodes(self,f_list):
+        '''
+        Counts the elements of an f_list, at every depth: literals, connectives, and brackets (nested lists)
+        '''
+        count = 0
+        stack = [f_list]
+        while stack:
+            part = stack.pop()
+            count += 1
+            if type(part) == list:
+                stack.extend(part)
+        return count
+
+    def stats(self):
+        '''
+        Returns the statistics collected for the passes of the CNF / DNF conversion, as a dict:
+        pass name -> {calls, rewrites, seconds, nodes_before, nodes_after, max_nodes}
+        - calls: how many times the pass ran
+        - rewrites: how many of those runs changed the formula
+        - seconds: total time spent in the pass
+        - nodes_before / nodes_after: total size of the formula going in / coming out (see __count_nodes)
+        - max_nodes: the largest formula the pass produced, useful for spotting blow-ups
+        Satisfiability checks are counted under "satisfiability": {calls, seconds, 2sat, horn, truth_table, ...},
+        the others being how many times each engine was picked (see __satisfiable)
+        Statistics are only collected while _collecting_stats is True (or a callback is set)
+        '''
+        return {name : dict(record) for name,record in self._stats.items()}
+
+    def reset_stats(self):
+        '''
+        Clears the collected statistics
+        '''
+        self._stats = {}
+
+    def set_stats_callback(self,callback):
+        '''
+        Sets a function that's called after every pass of the CNF / DNF conversion,
+        with a dict of {pass, changed, seconds, nodes_before, nodes_after}
+        Setting a callback turns on collecting statistics, setting None turns it back off
+        '''
+        self._stats_callback = callback
+        self._collecting_stats = callback is not None
+
+    def _is_valid_formula(self,formula):
+        '''
+        Checks whether a given formula string is valid, returns True / False
+        If debugging is turned on, also prints out the reason why it is invalid
+        '''
+        if formula.count("(") != formula.count(")") or formula.count("-") != formula.count(">"):
+            self.__trace("Invalid formula: Invalid use of brackets or implication signs")
+            return False
+        for char in formula:
+            if not char.isupper() and char not in "!avx<->()":
+                self.__trace("Invalid formula: Invalid character: '%s'",char)
+                return False
+        if ")(" in formula or "()" in formula:
+            self.__trace("Invalid formula: Invalid use of brackets")
+            return False
+        bracket_count = 0
+        for i,f in enumerate(formula):
+            if f == "-" and (i+1==len(formula) or formula[i+1] != ">" or i == 0 or not (formula[i-1].isupper() or formula[i-1] in ")<")):
+                self.__trace("Invalid formula: Invalid use of implication signs")
+                return False
+            if f == "<" and (i+1==len(formula) or formula[i+1] != "-" or i == 0 or not (formula[i-1].isupper() or formula[i-1] == ")")):
+                self.__trace("Invalid formula: Invalid use of biconditional signs")
+                return False
+            if f == ">" and (i == 0 or formula[i-1] != "-" or i+1==len(formula) or not (formula[i+1].isupper() or formula[i+1] in "(!")):
+                self.__trace("Invalid formula: Invalid use of implication signs")
+                return False
+            if f == "(":
+                bracket_count += 1
+            elif f == ")":
+                bracket_count -= 1
+                if bracket_count < 0:
+                    self.__trace("Invalid formula: Invalid use of brackets")
+                    return False
+            elif f == "!" and (i+1==len(formula) or (not formula[i+1].isupper() and formula[i+1] != "(")):
+                self.__trace("Invalid formula: Invalid use of negations")
+                return False
+            elif f in "avx":
+                if i == 0 or not (formula[i-1].isupper() or formula[i-1] == ")"):
+                    self.__trace("Invalid formula: '%s' connective doesn't have valid left-side element",f)
+                    return False
+                elif i+1==len(formula) or not (formula[i+1].isupper() or formula[i+1] == "(" or formula[i+1] == "!"):
+                    self.__trace("Invalid formula: '%s' connective doesn't have valid right-side element",f)
+                    return False
+            elif f.isupper():
+                if i+1<len(formula) and (formula[i+1].isupper() or formula[i+1] not in "avx)-<"):
+                    self.__trace("Invalid formula: '%s' literal doesn't have valid right-side element",f)
+                    return False
+                if i > 0 and formula[i-1] not in "avx(!>":
+                    self.__trace("Invalid formula: '%s' connective doesn't have valid left-side element",f)
+                    return False
+        
+        return True
+
+    def formula_to_list(self,formula):
+        '''
+        Turns a string formula into a list representation
+        
+        Notation to be used:
+        - single uppercase letters for literals: A,B
+        - 'a' for conjunctions: AaB, Aa(BaC)
+        - 'v' for disjunctions: AvB, Av(BaC)
+        - 'x' for exclusive ors: AxB, true when exactly one of A and B is
+        - '->' for implications: A->B
+        - '<->' for biconditionals: A<->B, true when A and B are equal
+        - '!' for negation: !S, !(AvB)
+
+        This list representation is necessary for all other LogicProgram functionality
+        '''
+          
+
+        # first, to prevent possible problems down the road, uses the !(!Q) == Q equivalence
+        while "!!" in formula:
+            formula = formula.replace("!!","")
+
+        f_list = [""]
+        if '(' in formula:
+            start_i,end_i,left_bracket_count = formula.index('('),-1, 0
+            for i,ch in enumerate(formula):
+                if ch == '(':
+                    left_bracket_count += 1
+                if ch == ')':
+                    left_bracket_count -= 1
+                    if left_bracket_count == 0:
+                        end_i = i
+                        break
+            if start_i > 0 and formula[start_i-1] == '!':
+                return self.formula_to_list(formula[:start_i-1]) + ['!',self.formula_to_list(formula[start_i+1:end_i])] + self.formula_to_list(formula[end_i+1:])
+            return self.formula_to_list(formula[:start_i]) + [self.formula_to_list(formula[start_i+1:end_i])] + self.formula_to_list(formula[end_i+1:])
+        else:
+            for ch in formula:
+                if ch.isupper() or ch == '!':
+                    f_list.append(ch)
+                    f_list.append("")
+                else:
+                    f_list[-1] += ch
+            while '' in f_list:
+                f_list.remove('')
+            changed = True
+            while changed:
+                changed = False
+                for i,ch in enumerate(f_list):
+                    if ch == '!':
+                        if i < len(f_list)-1:
+                            f_list[i] = ['!',f_list[i+1]]
+                            f_list = f_list[:i+1] + f_list[i+2:]
+                            changed = True
+                            break
+                        elif i + 1 == len(f_list):
+                            f_list[i] = ['!',f_list[i+1]]
+                            f_list = f_list[:i+1]
+                            changed = True
+                            break
+            return f_list
+        
+    def __list_to_formula(self,f_list):
+        '''
+        Returns the string form of a given f_list
+        '''
+
+        result = ""
+        for piece in f_list:
+            if type(piece) == list and len(piece) != 2:
+                # a bracket, one with a single part too, like (A) in A->(A)
+                result += "(" + self.__list_to_formula(piece) + ")"
+            elif type(piece) == list and len(piece) == 2 and type(piece[1]) == list:
+                result += "!(" + self.__list_to_formula(piece[1]) + ")"
+            elif type(piece) == list and len(piece) == 2:
+                result += "!" + piece[1]
+            elif type(piece) == bool:
+                # an always true / always false formula
+                result += str(piece)
+            else:
+                result += piece
+        
+        return result
+
+    def make_random_formula(self,*,minimum_length=15,n_of_literals=3,seed=None):
+        '''
+        Generates a random formula in string form
+        Use keyword arguments to set the minimum length (in characters), and the number of literals
+        If a seed is given, the same seed always gives the same formula
+        '''
+
+        if type(minimum_length) != int or type(n_of_literals) != int:
+            raise TypeError("Invalid argument types")
+
+        if n_of_literals > 26:
+            # can't have more literals than letters in the alphabet
+            n_of_literals = 26
+        elif n_of_literals < 0:
+            # can't have a negative number of literals
+            n_of_literals = 3
+        
+        if minimum_length < 0:
+            # can't have a negative length
+            minimum_length = 15
+        
+        # imported here, random is only needed for this and it slows down importing the package
+        import random
+        if seed is not None:
+            randrange = random.Random(seed).randrange
+        else:
+            randrange = random.randrange
+
+        # chooses the literals (characters) that will be used
+        possible_literals = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        literals = set()
+        while len(literals) < n_of_literals:
+            literals.add(possible_literals[randrange(26)])
+        
+        # sorted, because the order of a set of strings changes between runs
+        literals = sorted(literals)
+        CONNECTIVES = ["a","v","->"]
+
+        # elements will store the possible building blocks for the formula
+        # at first, this means the literals and their negations
+        elements = literals.copy()
+        elements += ["!"+literal for literal in literals]
+        
+        # adding some combinations to the elements list
+        while len(elements) < n_of_literals*4:
+            # two random existing elements are picked
+            pick1,pick2 = elements[randrange(len(elements))],elements[randrange(len(elements))]
+            while pick1 == pick2:
+                # we make sure they're not the same
+                pick1,pick2 = elements[randrange(len(elements))],elements[randrange(len(elements))]
+            
+            # a random connective is picked
+            connective = CONNECTIVES[randrange(3)]
+
+            # there's an approx. 25% chance of adding a negated element instead of making a new one
+            if randrange(4) == 0 and pick1[0] != "!" and len(pick1) > 1 and ("!(" + pick1 + ")") not in elements:
+                # instead, add a negated element
+                elements.append("!(" + pick1 + ")")
+            else:
+                elements.append("(" + pick1 + connective + pick2 + ")")
+
+
+        # finally, we start building the formula
+        # we start with a single random element
+        result = elements[randrange(len(elements))]
+
+        # until we meet the target size, we gradually add elements to it
+        while len(result) < minimum_length:
+            # a random element to be added to the formula is picked
+            addition = elements[randrange(len(elements))]
+            # a random connective is picked
+            connective = CONNECTIVES[randrange(3)]
+
+            if randrange(2) == 0:
+                # adding on the right
+                result = "(" + result + ")" + connective + addition
+            else:
+                # adding on the left
+                result = addition + connective + "(" + result + ")"
+        
+        
+        # making sure all literals are included
+        for literal in literals:
+            if literal not in result:
+                for i, ch in enumerate(result):
+                    if ch.isupper() and result.count(ch) > 1:
+                        result = result[:i] + literal + result[i+1:]
+                        break
+        
+        return result
+
@@ -0,0 +1,176 @@
+import mmap
+import struct
+
+# the start of every truth table file: magic bytes, layout version, number of variables, length of the names
+HEADER = struct.Struct("<8sIII")
+MAGIC = b"LTKTRUTH"
+FORMAT_VERSION = 1
+
+
+class TruthTableFile:
+    '''
+    A truth table stored on disk, one bit per interpretation, read through a memory map
+    so only the pages that are looked at are ever loaded (see LogicToolkit.export_truth_table)
+
+    File layout (all numbers little-endian):
+    - 20 bytes of header: the magic bytes b"LTKTRUTH", the layout version (uint32),
+      the number of variables n (uint32) and the length of the names in bytes (uint32)
+    - the variable names, UTF-8, separated by newlines
+    - zero bytes up to the next multiple of 8, where the table starts
+    - the table: 2**n bits, rounded up to whole bytes. Interpretation number i is bit i % 8
+      (the lowest bit first) of byte i // 8, and it's 1 if the formula is True for it
+    The interpretation number has the first variable as its highest bit and the last one as its lowest,
+    with 1 for True: over A,B,C, A=True, B=False, C=True is number 0b101 = 5
+    '''
+
+    def __init__(self,path):
+        self.path = path
+        with open(path,"rb") as file:
+            magic,version,n,names_length = HEADER.unpack(file.read(HEADER.size))
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(str(path) + " isn't a truth table file of version " + str(FORMAT_VERSION))
+            names = file.read(names_length).decode("utf-8")
+            self.variables = names.split("\n") if n > 0 else []
+            self._offset = table_offset(names_length)
+            self._map = mmap.mmap(file.fileno(),0,access=mmap.ACCESS_READ)
+        if len(self._map) < self._offset + table_bytes(n):
+            self._map.close()
+            raise ValueError(str(path) + " is shorter than its table")
+
+    def __len__(self):
+        return 2**len(self.variables)
+
+    def __getitem__(self,number):
+        '''
+        The value of the formula for interpretation number (see the class docstring)
+        '''
+        if type(number) != int or not 0 <= number < len(self):
+            raise IndexError("Interpretation " + str(number) + " is out of range")
+        return (self._map[self._offset + (number >> 3)] >> (number & 7)) & 1 == 1
+
+    def lookup(self,values):
+        '''
+        The value of the formula for one interpretation, given as a dict of name -> bool
+        or as a sequence of bools in the order of self.variables
+        '''
+        if type(values) == dict:
+            if set(values) != set(self.variables):
+                raise ValueError("Values are needed for exactly these variables: " + ", ".join(self.variables))
+            values = [values[name] for name in self.variables]
+        if len(values) != len(self.variables):
+            raise ValueError("Values are needed for " + str(len(self.variables)) + " variables")
+        number = 0
+        for value in values:
+            number = (number << 1) | bool(value)
+        return self[number]
+
+    def count(self,chunk_bytes=1 << 20):
+        '''
+        Counts the interpretations where the formula is True, reading the table a chunk at a time
+        '''
+        end = self._offset + table_bytes(len(self.variables))
+        total = 0
+        for start in range(self._offset,end,chunk_bytes):
+            total += int.from_bytes(self._map[start:min(start + chunk_bytes,end)],"little").bit_count()
+        return total
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exception):
+        self.close()
+
+
+def table_offset(names_length):
+    return (HEADER.size + names_length + 7) // 8 * 8
+
+
+def table_bytes(n):
+    return (2**n + 7) // 8
+
+
+def write_truth_table(path,variables,nnf,chunk_bits=1 << 23):
+    '''
+    Writes the truth table of an f_list in NNF (see LogicToolkit.__to_nnf) over the given variables
+    to path, in the layout described in TruthTableFile. Returns the number of chunks written
+
+    The table is filled a chunk of 2**c interpretations at a time, with c the number of the last variables
+    (at most log2(chunk_bits) of them). Inside a chunk only those variables change, so the chunk
+    is evaluated bit-parallel: every variable is a Python integer with one bit per interpretation
+    (a repeating pattern for the last c variables, all 0s or all 1s for the rest),
+    and every connective of the formula is a single &, | or ^ on those integers
+    '''
+
+    n = len(variables)
+    names = "\n".join(variables).encode("utf-8")
+    offset = table_offset(len(names))
+    low = min(n,max(chunk_bits.bit_length() - 1,3))
+    size = 2**low # interpretations in a chunk
+    full = (1 << size) - 1
+
+    # the patterns of the variables that change inside a chunk: the variable at bit p of the
+    # interpretation number is 0 for 2**p interpretations, then 1 for 2**p, and so on
+    patterns = {}
+    for p in range(low):
+        pattern = ((1 << 2**p) - 1) << 2**p
+        width = 2**(p + 1)
+        while width < size:
+            # doubling, big integers divide slowly
+            pattern |= pattern << width
+            width *= 2
+        patterns[p] = pattern
+    position = {name : n - 1 - i for i,name in enumerate(variables)}
+
+    with open(path,"w+b") as file:
+        file.write(HEADER.pack(MAGIC,FORMAT_VERSION,n,len(names)) + names)
+        file.truncate(offset + table_bytes(n))
+        file.flush()
+        with mmap.mmap(file.fileno(),0) as table:
+            for chunk in range(2**(n - low)):
+                start = chunk * size
+
+                def column(name):
+                    p = position.get(name)
+                    if p is None:
+                        raise ValueError("The formula uses " + name + ", which isn't one of the variables")
+                    if p < low:
+                        return patterns[p]
+                    return full if (start >> p) & 1 else 0
+
+                bits = evaluate_bits(nnf,column,full).to_bytes(max(size // 8,1),"little")
+                table[offset + start // 8:offset + start // 8 + len(bits)] = bits
+            table.flush()
+    return 2**(n - low)
+
+
+def evaluate_bits(nnf,column,full):
+    '''
+    Evaluates an f_list in NNF on integers used as bit vectors, column(name) gives a variable's bits
+    Subformulas that are the same list object are evaluated once
+    '''
+
+    results = {} # id(part) -> (part, bits), the part is kept so its id can't be reused
+    stack = [(nnf,False)]
+    while stack:
+        part,children_done = stack.pop()
+        if id(part) in results:
+            continue
+        if type(part) == bool:
+            results[id(part)] = (part,full if part else 0)
+        elif type(part) == str:
+            results[id(part)] = (part,column(part))
+        elif len(part) == 2 and part[0] == '!':
+            results[id(part)] = (part,column(part[1]) ^ full)
+        elif not children_done:
+            stack.append((part,True))
+            stack.extend((child,False) for child in part[::2] if id(child) not in results)
+        else:
+            bits = [results[id(child)][1] for child in part[::2]]
+            value = bits[0]
+            for other in bits[1:]:
+                value = value & other if part[1] == 'a' else value | other
+            results[id(part)] = (part,value)
+    return results[id(nnf)][1]
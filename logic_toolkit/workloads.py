@@ -0,0 +1,199 @@
+import random
+
+LITERALS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# clause/variable ratios at which random k-CNF formulas go from mostly satisfiable to mostly unsatisfiable
+# formulas generated around these ratios are the hardest ones for satisfiability checks
+PHASE_TRANSITION_RATIOS = {2 : 1.0, 3 : 4.26, 4 : 9.93, 5 : 21.12}
+
+
+class WorkloadGenerator:
+    '''
+    Generates random, structured workloads for stress-testing the toolkit:
+    - random k-CNF formulas with a chosen clause/variable ratio
+    - random Horn rule bases for add_rule
+    - deeply nested formulas of a given depth
+    - random formulas with a given number of connectives
+
+    All randomness comes from one random.Random instance, so the same seed gives the same workloads.
+    Formulas are returned either as strings or directly as f_lists (the list form used by LogicToolkit),
+    and are built in time linear in their size.
+
+    Literals are single uppercase letters, so at most 26 variables can be used
+    '''
+
+    def __init__(self,seed=None,*,rng=None):
+        '''
+        Either give a seed, or an existing random.Random instance to draw from
+        '''
+        self._rng = rng if rng is not None else random.Random(seed)
+
+    def __variables(self,n_variables):
+        if type(n_variables) != int or not 1 <= n_variables <= 26:
+            raise ValueError("The number of variables has to be between 1 and 26")
+        return LITERALS[:n_variables]
+
+    def random_kcnf(self,n_variables,*,k=3,ratio=None,n_clauses=None,as_string=True):
+        '''
+        Generates a random k-CNF formula over the first n_variables letters
+        Every clause has k different variables, each negated with probability 1/2
+        The number of clauses is n_clauses if given, otherwise round(ratio * n_variables),
+        where ratio defaults to the phase transition ratio for k (4.26 for k=3), the hard region
+        '''
+
+        variables = self.__variables(n_variables)
+        if type(k) != int or not 1 <= k <= n_variables:
+            raise ValueError("k has to be between 1 and the number of variables")
+        if n_clauses is None:
+            if ratio is None:
+                ratio = PHASE_TRANSITION_RATIOS.get(k,2.0**k * 0.69) # 2^k*ln(2) approximates the threshold for larger k
+            n_clauses = max(1,round(ratio * n_variables))
+
+        clauses = []
+        for _ in range(n_clauses):
+            clause = []
+            for variable in self._rng.sample(variables,k):
+                clause.append(['!',variable] if self._rng.random() < 0.5 else variable)
+            clauses.append(clause)
+
+        if as_string:
+            parts = []
+            for clause in clauses:
+                literals = ["!" + l[1] if type(l) == list else l for l in clause]
+                parts.append("(" + "v".join(literals) + ")" if k > 1 else literals[0])
+            return "a".join(parts)
+
+        f_list = []
+        for clause in clauses:
+            if k > 1:
+                f_list.append(self.__join(clause,'v'))
+            else:
+                f_list.append(clause[0])
+            f_list.append('a')
+        return f_list[:-1]
+
+    def random_horn_rules(self,n_rules,*,n_literals=26,max_body=3,n_facts=3):
+        '''
+        Generates a random Horn rule base, as a list of rule strings for add_rule ('A', 'A,B->C', ...)
+        The first n_facts literals are facts, the rest of the rules have 1 to max_body literals in their body
+        Bodies only use literals that come before the head in the alphabet,
+        so the rules never form a cycle (make_query would not terminate on a cycle)
+        '''
+
+        literals = self.__variables(n_literals)
+        n_facts = max(1,min(n_facts,n_literals,n_rules))
+        rules = list(literals[:n_facts])
+        if n_literals == n_facts and len(rules) < n_rules:
+            raise ValueError("There have to be more literals than facts to make rules")
+
+        while len(rules) < n_rules:
+            head = self._rng.randrange(n_facts,n_literals)
+            body_size = min(self._rng.randint(1,max_body),head)
+            body = [literals[i] for i in self._rng.sample(range(head),body_size)]
+            rules.append(",".join(body) + "->" + literals[head])
+        return rules
+
+    def deep_formula(self,depth,*,n_variables=3,as_string=True):
+        '''
+        Generates a formula nested depth levels deep
+        Every level wraps the formula so far in brackets and either negates it,
+        or joins it with a random literal using a random connective ('a', 'v' or '->'), on a random side
+        The size grows linearly with depth, for example depth 3 could give (!((A->B)vC))aA
+
+        Note that LogicToolkit works recursively, so depths in the hundreds may hit Python's recursion limit
+        '''
+
+        variables = self.__variables(n_variables)
+        connectives = ['a','v','->']
+
+        # starting literal, then one wrapping step per level
+        # for strings, prefixes and suffixes are collected and joined once at the end
+        first = self.__random_literal(variables)
+        prefixes, suffixes = [], []
+        f_list = first
+
+        for _ in range(depth):
+            if self._rng.random() < 0.2:
+                prefixes.append("!(")
+                suffixes.append(")")
+                f_list = ['!',f_list]
+                continue
+
+            literal = self.__random_literal(variables)
+            connective = connectives[self._rng.randrange(3)]
+            literal_text = "!" + literal[1] if type(literal) == list else literal
+            if self._rng.random() < 0.5:
+                prefixes.append("(")
+                suffixes.append(")" + connective + literal_text)
+                f_list = [f_list,connective,literal]
+            else:
+                prefixes.append(literal_text + connective + "(")
+                suffixes.append(")")
+                f_list = [literal,connective,f_list]
+
+        if as_string:
+            first_text = "!" + first[1] if type(first) == list else first
+            return "".join(reversed(prefixes)) + first_text + "".join(suffixes)
+        if type(f_list) != list or len(f_list) == 2:
+            # a single (possibly negated) literal is still returned as a list, like formula_to_list does
+            f_list = [f_list]
+        return f_list
+
+    def random_formula(self,n_connectives,*,n_variables=3,as_string=True):
+        '''
+        Generates a random formula with the given number of binary connectives
+        The shape of the tree is random, every literal is negated with probability 1/3
+        Unlike LogicToolkit.make_random_formula, the size is exact and the formula is built in linear time
+        '''
+
+        variables = self.__variables(n_variables)
+        connectives = ['a','v','->']
+
+        # builds the tree bottom-up: start with n_connectives+1 leaves,
+        # then repeatedly join two random neighbours until a single tree is left
+        nodes = [self.__random_literal(variables) for _ in range(n_connectives + 1)]
+        while len(nodes) > 1:
+            i = self._rng.randrange(len(nodes) - 1)
+            nodes[i] = [nodes[i],connectives[self._rng.randrange(3)],nodes[i+1]]
+            # swapping with the last one so the removal is O(1), the order of leaves doesn't matter
+            nodes[i+1] = nodes[-1]
+            nodes.pop()
+
+        f_list = nodes[0] if type(nodes[0]) == list and len(nodes[0]) == 3 else [nodes[0]]
+        if as_string:
+            return self.__to_string(f_list)
+        return f_list
+
+    def __random_literal(self,variables):
+        variable = variables[self._rng.randrange(len(variables))]
+        return ['!',variable] if self._rng.random() < 1/3 else variable
+
+    def __join(self,parts,connective):
+        f_list = []
+        for part in parts:
+            f_list.append(part)
+            f_list.append(connective)
+        return f_list[:-1]
+
+    def __to_string(self,f_list):
+        '''
+        Writes an f_list made of [left, connective, right] nodes as a string
+        Works with an explicit stack and a single join, so it's linear in the size of the formula
+        '''
+
+        parts = []
+        stack = [(f_list,True)]
+        while stack:
+            node,top = stack.pop()
+            if type(node) == str:
+                parts.append(node)
+            elif len(node) == 2:
+                parts.append("!" + node[1])
+            elif len(node) == 1:
+                stack.append((node[0],top))
+            elif top:
+                stack.extend([(node[2],False),(node[1],False),(node[0],False)])
+            else:
+                # closing bracket goes on first, since the stack is processed backwards
+                stack.extend([(")",False),(node[2],False),(node[1],False),(node[0],False),("(",False)])
+        return "".join(parts)
@@ -0,0 +1,74 @@
+from logic_toolkit import LogicToolkit, NormalizationCache
+
+
+def test_results_survive_a_restart(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    ltk = LogicToolkit()
+    cache = ltk.use_cache(path)
+    cnf = ltk.to_cnf("(AaB)v(CaD)")
+    assert ltk.is_satisfiable("Aa!A") is False
+    assert cache.stats == {"hits" : 0, "misses" : 2, "stores" : 2, "evictions" : 0}
+
+    # a new toolkit (as after a restart) finds the results, for the formula given in any form
+    restarted = LogicToolkit()
+    cache = restarted.use_cache(path)
+    assert restarted.to_cnf(restarted.formula_to_list("(AaB)v(CaD)")) == cnf
+    assert restarted.is_contradiction("Aa!A") is True
+    assert restarted.to_cnf("(AaB)v(CaD)",return_string=True) == ltk.to_cnf("(AaB)v(CaD)",return_string=True)
+    assert cache.stats["hits"] == 3 and cache.stats["misses"] == 0
+
+    # conversions with a budget aren't cached
+    restarted.to_cnf("(AaB)v(CaD)",max_clauses=10)
+    assert cache.stats["hits"] == 3
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = NormalizationCache(tmp_path / "cache.sqlite")
+    keys = [cache.key("to_cnf",str(i)) for i in range(3)]
+    cache.put(keys[0],keys)
+    # room for two entries of the same size
+    cache.max_bytes = cache.size()[1] * 5 // 2
+    for key in keys[1:]:
+        cache.get(keys[0]) # keeps the first one in use
+        cache.put(key,keys)
+    assert cache.get(keys[0]) == keys
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) == keys
+    assert cache.stats["evictions"] == 1 and cache.size()[1] <= cache.max_bytes
+
+    # another connection, as from another process, sees the same entries
+    other = NormalizationCache(tmp_path / "cache.sqlite")
+    assert other.get(keys[0]) == keys
+    other.close()
+    cache.close()
+
+
+def test_redundant_brackets_are_cached(tmp_path):
+    ltk = LogicToolkit()
+    cache = ltk.use_cache(tmp_path / "cache.sqlite")
+    plain = LogicToolkit()
+    for formula in ["(A)","((AvB))","A->(B)","!((A))a(B)"]:
+        assert ltk.to_cnf(formula) == plain.to_cnf(formula)
+        assert ltk.to_cnf(formula) == plain.to_cnf(formula)
+        assert ltk.is_satisfiable(formula) == plain.is_satisfiable(formula)
+    assert cache.stats["hits"] == 4
+
+
+def test_hits_do_not_wait_for_a_writer(tmp_path):
+    import sqlite3
+    import time
+
+    path = tmp_path / "cache.sqlite"
+    cache = NormalizationCache(path)
+    key = cache.key("to_cnf","A")
+    cache.put(key,[["A"]])
+    writer = sqlite3.connect(str(path),isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE") # holds the write lock, as another process's put would
+    try:
+        start = time.perf_counter()
+        assert cache.get(key) == [["A"]]
+        assert time.perf_counter() - start < 1
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+    cache.close()
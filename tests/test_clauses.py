@@ -0,0 +1,79 @@
+from itertools import product
+
+from logic_toolkit import ClauseSet, LogicToolkit, WorkloadGenerator
+
+
+def test_literals_are_signed_integers():
+    clause_set = ClauseSet([["A","!B"],["!C"]])
+    assert clause_set.variables == ["A","B","C"]
+    assert sorted(clause_set.clauses()) == [(-3,),(-2,1)]
+    assert clause_set.literal_name(-2) == "!B"
+
+
+def test_redundant_clauses_are_left_out():
+    clause_set = ClauseSet()
+    assert clause_set.add_clause(["A","B"])
+    assert not clause_set.add_clause(["A","!A"]) # tautology
+    assert not clause_set.add_clause(["B","A"]) # duplicate
+    assert not clause_set.add_clause(["A","B","C"]) # subsumed by AvB
+    assert clause_set.add_clause(["A"]) # subsumes AvB, which is removed
+    assert clause_set.clauses() == [(1,)]
+    assert clause_set.removed == {"tautologies" : 1, "duplicates" : 1, "subsumed" : 2}
+
+
+def test_empty_clause_is_a_contradiction():
+    clause_set = ClauseSet([["A"],["!A","B"]])
+    clause_set.add_clause([])
+    assert clause_set.has_empty_clause() and len(clause_set) == 1
+    assert not clause_set.add_clause(["C"])
+    assert clause_set.to_f_list() == [False]
+    assert ClauseSet().to_f_list() == [True]
+
+
+def test_occurrence_lists_follow_removals():
+    clause_set = ClauseSet([["A","B"],["A","C"],["!A","C"]])
+    assert sorted(clause_set.occurrences("A")) == [(1,2),(1,3)]
+    clause_set.add_clause(["A"])
+    assert clause_set.occurrences("A") == [(1,)]
+    assert clause_set.occurrences("B") == []
+
+
+def test_clause_set_keeps_the_truth_table():
+    ltk = LogicToolkit()
+    for seed in range(40):
+        formula = WorkloadGenerator(seed).random_formula(8,n_variables=4)
+        clause_set = ltk.to_clause_set(formula)
+        # the DNF terms are a reference: the formula is true when one of them is
+        dnf = ltk.to_dnf(formula,return_string=True)
+        # True and False are written out when the DNF has an empty term / no terms
+        constants = {"True" : [[]], "False" : []}
+        terms = constants[dnf] if dnf in constants else [term.strip("()").split("a") for term in dnf.split("v")]
+        for values in product([True,False],repeat=len(clause_set.variables)):
+            value_of = dict(zip(clause_set.variables,values))
+            expected = any(all(not value_of[l[1:]] if l.startswith("!") else value_of[l] for l in term)
+                for term in terms)
+            assert clause_set.evaluate(values) == expected
+
+
+def test_is_methods_on_constant_clause_sets():
+    ltk = LogicToolkit()
+    assert ltk.is_tautology("Av!A")
+    assert ltk.is_contradiction("Aa!A")
+    assert ltk.is_satisfiable("(AvB)a(Av!A)aA")
+    assert ltk.to_clause_set("(AvB)a(Av!A)aA").to_f_list() == ["A"]
+
+
+def test_models_are_visited_in_gray_code_order():
+    ltk = LogicToolkit()
+    for seed in range(30):
+        clause_set = ltk.to_clause_set(WorkloadGenerator(seed).random_formula(10,n_variables=5))
+        n = len(clause_set.variables)
+        expected = [values for values in product([True,False],repeat=n) if clause_set.evaluate(values)]
+        models = list(clause_set.models())
+        assert sorted(models) == sorted(expected)
+
+    # with no clauses every interpretation is a model, each one differing from the last in one variable
+    models = list(ClauseSet(variables="ABC").models())
+    assert len(models) == 8 and models[0] == (True,True,True)
+    assert all(sum(a != b for a,b in zip(first,second)) == 1 for first,second in zip(models,models[1:]))
+    assert list(ClauseSet([[]],variables="AB").models()) == []
@@ -0,0 +1,39 @@
+from logic_toolkit import FormulaDAG, LogicToolkit
+
+
+def test_equal_subformulas_are_stored_once():
+    ltk = LogicToolkit()
+    dag = FormulaDAG()
+    root = dag.add(ltk.formula_to_list("(AvB)a(Cv(AvB))a!D"))
+    # A, B, AvB, C, Cv(AvB), !D and the root
+    assert len(dag) == 7
+    f_list = dag.to_f_list(root)
+    assert f_list[2][2] is f_list[0]
+    assert f_list == [['A','v','B'],'a',['C','v',['A','v','B']],'a',['!','D']]
+
+
+def test_nodes_are_removed_with_their_last_reference():
+    ltk = LogicToolkit()
+    dag = FormulaDAG()
+    first = dag.add(ltk.formula_to_list("(AvB)aC"))
+    second = dag.add(ltk.formula_to_list("(AvB)aD"))
+    shared = dag.to_f_list(first)[0]
+    assert len(dag) == 7
+    dag.release(first)
+    # C and the first root are gone, AvB is still used by the second formula
+    assert len(dag) == 5
+    assert dag.to_f_list(second) == [shared,'a','D']
+    dag.release(second)
+    assert len(dag) == 0
+
+
+def test_size_reports_the_savings():
+    ltk = LogicToolkit()
+    size = ltk.formula_size("((AvB)aC)v((AvB)aC)v((AvB)aC)")
+    assert size["nodes"] == 6 and size["tree_nodes"] == 16
+    assert size["bytes"] < size["tree_bytes"]
+    events = []
+    ltk.set_trace_sink(events.append)
+    ltk.to_cnf("((AvB)aC)v((AvB)aC)")
+    share = [event for event in events if event["event"] == "share"][0]
+    assert share["nodes"] < share["tree_nodes"]
@@ -0,0 +1,69 @@
+import pytest
+
+from logic_toolkit import LogicToolkit
+from logic_toolkit.datalog import DatalogProgram
+
+
+def reachability(n_nodes):
+    program = DatalogProgram()
+    for i in range(n_nodes - 1):
+        program.add_rule("edge(n%d,n%d)" % (i,i + 1))
+    program.add_rule("edge(X,Y)->reach(X,Y)")
+    program.add_rule("reach(X,Y),edge(Y,Z)->reach(X,Z)")
+    return program
+
+
+def test_transitive_closure():
+    program = reachability(30)
+    assert len(program.query("reach(n0,Z)")) == 29
+    assert program.query("reach(n3,n5)") == [{}]
+    assert program.query("reach(n5,n3)") == []
+    assert program.query("reach(X,n2)") == [{"X" : "n0"},{"X" : "n1"}]
+    # semi-naive: every pair is derived once
+    assert program.stats["derived"] == 29 * 30 // 2
+
+
+def test_repeated_variables_and_constants():
+    program = DatalogProgram()
+    for rule in ["edge(a,b)","edge(b,a)","edge(b,c)","edge(X,Y)->reach(X,Y)","reach(X,Y),reach(Y,Z)->reach(X,Z)"]:
+        program.add_rule(rule)
+    assert program.query("reach(X,X)") == [{"X" : "a"},{"X" : "b"}]
+    program.add_rule("reach(X,X)->loop(X)")
+    assert program.query("loop(c)") == []
+
+
+def test_stratified_negation():
+    program = reachability(4)
+    for node in ["n0","n1","n2","n3","n9"]:
+        program.add_rule("node(" + node + ")")
+    program.add_rule("node(X),!reach(n0,X)->far(X)")
+    assert program.query("far(X)") == [{"X" : "n0"},{"X" : "n9"}]
+
+    with pytest.raises(ValueError):
+        program.add_rule("node(X),!win(X)->win(X)")
+    # the rejected rule isn't kept
+    assert program.query("far(n9)") == [{}]
+
+
+def test_invalid_rules():
+    program = DatalogProgram()
+    for rule in ["reach(X,Y)->path(Z)","edge(X)","Edge(a)","edge(a,b)->!edge(b,a)","edge(a,)"]:
+        with pytest.raises(ValueError):
+            program.add_rule(rule)
+    program.add_rule("edge(a,b)")
+    with pytest.raises(ValueError):
+        program.add_rule("edge(a)")
+
+
+def test_toolkit_queries():
+    ltk = LogicToolkit()
+    ltk.add_rule("A")
+    ltk.add_rule("parent(ann,bob)")
+    ltk.add_rule("parent(bob,cid)")
+    ltk.add_rule("parent(X,Y),parent(Y,Z)->grandparent(X,Z)")
+    assert ltk._is_valid_rule("parent(X,Y)->ancestor(X,Y)")
+    assert not ltk._is_valid_rule("parent(X,Y)->ancestor(Z)")
+    assert ltk.make_query("grandparent(ann,Z)") == [{"Z" : "cid"}]
+    assert ltk.make_query("grandparent(ann,cid)") is True
+    assert ltk.make_query("grandparent(bob,cid)") is False
+    assert ltk.make_query("A")
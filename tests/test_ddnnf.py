@@ -0,0 +1,54 @@
+import pytest
+
+from logic_toolkit import CompiledFormula, LogicToolkit, WorkloadGenerator
+
+
+def models(ltk,formula):
+    literals,true_interpretations = ltk._LogicToolkit__get_true_interpretations(formula)
+    return [dict(zip(literals,values)) for values in true_interpretations]
+
+
+def test_model_counts_match_the_truth_table():
+    ltk = LogicToolkit()
+    for seed in range(40):
+        generator = WorkloadGenerator(seed)
+        formula = generator.random_kcnf(6,ratio=3.0) if seed % 2 else generator.random_formula(9,n_variables=5)
+        compiled = ltk.compile(formula)
+        expected = models(ltk,formula)
+        assert compiled.model_count() == len(expected)
+        assert compiled.is_satisfiable() == (len(expected) > 0)
+
+        conditioned = compiled.condition({"A" : False}) if "A" in compiled.variables else compiled
+        assert conditioned.model_count() == sum(1 for model in expected if not model.get("A",False))
+
+
+def test_entailment():
+    ltk = LogicToolkit()
+    compiled = ltk.compile("(A->B)a(B->C)aA")
+    assert compiled.entails("C") and not compiled.entails("!C")
+    assert compiled.implied_literals() == ["A","B","C"]
+
+    compiled = ltk.compile("(A->B)a(B->C)")
+    assert compiled.model_count() == 4
+    assert compiled.condition({"A" : True}).implied_literals() == ["B","C"]
+    assert compiled.condition({"C" : False}).implied_literals() == ["!A","!B"]
+    with pytest.raises(ValueError):
+        compiled.condition({"Z" : True})
+
+
+def test_contradictions_and_tautologies():
+    ltk = LogicToolkit()
+    assert not ltk.compile("Aa!A").is_satisfiable()
+    assert ltk.compile("Aa!A").model_count() == 0
+    assert ltk.compile("Av!A").model_count() == 2
+
+
+def test_serialization_round_trip():
+    ltk = LogicToolkit()
+    compiled = ltk.compile(WorkloadGenerator(7).random_kcnf(10,ratio=2.5)).condition({"B" : True})
+    loaded = CompiledFormula.loads(compiled.dumps())
+    assert loaded.model_count() == compiled.model_count()
+    assert loaded.assigned == {"B" : True}
+    assert len(loaded) == len(compiled)
+    with pytest.raises(ValueError):
+        CompiledFormula.loads('{"format" : "d-dnnf", "version" : 0}')
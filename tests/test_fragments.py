@@ -0,0 +1,58 @@
+from itertools import product
+
+from logic_toolkit import ClauseSet, LogicToolkit, WorkloadGenerator
+from logic_toolkit import fragments
+
+
+def brute_force(clause_set):
+    return any(clause_set.evaluate(values) for values in product([True,False],repeat=len(clause_set.variables)))
+
+
+def random_clause_set(seed,width,horn):
+    import random
+    generator = random.Random(seed)
+    clause_set = ClauseSet(variables="ABCDEF")
+    for _ in range(generator.randint(1,14)):
+        variables = generator.sample("ABCDEF",generator.randint(1,width))
+        positive = generator.randrange(len(variables) + 1)
+        clause = []
+        for i,variable in enumerate(variables):
+            negated = i != positive if horn else generator.random() < 0.5
+            clause.append("!" + variable if negated else variable)
+        clause_set.add_clause(clause)
+    return clause_set
+
+
+def test_2sat_matches_brute_force():
+    for seed in range(200):
+        clause_set = random_clause_set(seed,2,False)
+        assert fragments.is_2cnf(clause_set)
+        values = fragments.solve_2sat(clause_set)
+        assert (values is not None) == brute_force(clause_set)
+        if values is not None:
+            assert clause_set.evaluate(values)
+
+
+def test_horn_matches_brute_force():
+    for seed in range(200):
+        clause_set = random_clause_set(seed,4,True)
+        assert fragments.is_horn(clause_set)
+        values = fragments.solve_horn(clause_set)
+        assert (values is not None) == brute_force(clause_set)
+        if values is not None:
+            assert clause_set.evaluate(values)
+
+
+def test_engine_is_picked_from_the_shape():
+    ltk = LogicToolkit()
+    ltk._collecting_stats = True
+    assert ltk.is_satisfiable("(AvB)a(!AvC)a(!Bv!C)")
+    assert ltk.is_contradiction("Aa(A->B)a(BaC->D)aCa!D")
+    assert ltk.is_satisfiable("(AvBvC)a(!Av!BvC)")
+    stats = ltk.stats()["satisfiability"]
+    assert (stats["calls"],stats["2sat"],stats["horn"],stats["truth_table"]) == (3,1,1,1)
+
+    for seed in range(30):
+        formula = WorkloadGenerator(seed).random_formula(8,n_variables=4)
+        clause_set = ltk.to_clause_set(formula)
+        assert ltk.is_satisfiable(formula) == brute_force(clause_set)
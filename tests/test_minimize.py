@@ -0,0 +1,48 @@
+from itertools import product
+
+from logic_toolkit import LogicToolkit, WorkloadGenerator
+from logic_toolkit.minimize import Minimizer
+
+
+def test_quine_mccluskey_finds_the_minimal_cover():
+    minimizer = Minimizer(["A", "B", "C"])
+    # the classic cyclic example, every minterm is covered by two prime implicants
+    minterms = [values for values in product([True, False], repeat=3)
+        if values not in [(True, True, True), (False, False, False)]]
+    cubes, greedy = minimizer.exact(minterms)
+    assert len(cubes) == 3 and not greedy
+    assert minimizer.exact([]) == ([], False)
+
+
+def test_minimized_dnf_and_cnf():
+    ltk = LogicToolkit()
+    result, report = ltk.minimize("(AaB)v(Aa!B)v(!AaB)", return_string=True)
+    assert result == "AvB"
+    assert report == {"method": "quine-mccluskey", "terms_before": 3, "terms_after": 2,
+        "literals_before": 6, "literals_after": 2}
+
+    result, report = ltk.minimize("(A->B)a(B->C)a(C->A)", form="cnf", return_string=True)
+    assert report["terms_after"] == 3 and report["literals_after"] == 6
+    assert ltk.minimize("Av!A", return_string=True)[0] == "True"
+    assert ltk.minimize("Aa!A", form="cnf", return_string=True)[0] == "False"
+
+
+def test_minimized_forms_keep_the_truth_table():
+    ltk = LogicToolkit()
+    for seed in range(25):
+        formula = WorkloadGenerator(seed).random_formula(7, n_variables=4)
+        for form in ("dnf", "cnf"):
+            exact, exact_report = ltk.minimize(formula, form=form, return_string=True)
+            heuristic, heuristic_report = ltk.minimize(formula, form=form, return_string=True, exact_limit=0)
+            assert heuristic_report["method"] == "espresso"
+            for result, report in ((exact, exact_report), (heuristic, heuristic_report)):
+                if result in ("True", "False"):
+                    assert ltk.is_tautology(formula) == (result == "True")
+                    assert ltk.is_contradiction(formula) == (result == "False")
+                    continue
+                assert ltk.is_tautology("(" + formula + ")->(" + result + ")")
+                assert ltk.is_tautology("(" + result + ")->(" + formula + ")")
+                assert report["terms_after"] <= report["terms_before"]
+            # the heuristic can't beat the exact minimum
+            assert (exact_report["terms_after"], exact_report["literals_after"]) <= \
+                (heuristic_report["terms_after"], heuristic_report["literals_after"])
@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from logic_toolkit import LogicToolkit, Portfolio, WorkloadGenerator
+
+
+def slow_engine(f_list):
+    time.sleep(60)
+
+
+def failing_engine(f_list):
+    raise ValueError("can't solve this")
+
+
+def test_portfolio_agrees_with_the_truth_table():
+    ltk = LogicToolkit()
+    racing = LogicToolkit()
+    portfolio = racing.use_portfolio(timeout=30)
+    racing._collecting_stats = True
+    for seed in range(6):
+        formula = WorkloadGenerator(seed).random_kcnf(5,ratio=4.5)
+        assert racing.is_satisfiable(formula) == ltk.is_satisfiable(formula)
+        assert portfolio.last_winner in Portfolio.ENGINES
+    assert racing.is_tautology("(A->B)v(B->C)v(CaDaE)") and not racing.is_tautology("(AvBvC)a(!Av!BvD)")
+    stats = racing.stats()["satisfiability"]
+    assert sum(count for engine,count in stats.items() if engine.startswith("portfolio:")) >= 6
+
+
+def test_dominant_engine_is_tried_first():
+    portfolio = Portfolio(["truth_table","search"],timeout=30)
+    shape = portfolio.shape(["A","v","B"])
+    assert portfolio.predict(shape) is None
+    portfolio.wins[shape] = {"search" : 5, "truth_table" : 1}
+    assert portfolio.predict(shape) == "search"
+    assert portfolio.solve(["A","v","B"]) == (True,"search")
+    assert portfolio.wins[shape]["search"] == 6
+
+
+def test_deadline_and_unknown_engines():
+    with pytest.raises(ValueError):
+        Portfolio(["guessing"])
+    with pytest.raises(TimeoutError):
+        Portfolio(timeout=0).solve(["A"])
+
+
+def test_wrong_prediction_still_answers_in_time(monkeypatch):
+    monkeypatch.setitem(Portfolio.ENGINES,"slow",slow_engine)
+    for timeout in (2,None):
+        portfolio = Portfolio(["slow","search"],timeout=timeout)
+        shape = portfolio.shape(["A","v","B"])
+        portfolio.wins[shape] = {"slow" : 5}
+        start = time.perf_counter()
+        assert portfolio.solve(["A","v","B"]) == (True,"search")
+        assert time.perf_counter() - start < Portfolio.HEAD_START + 1.5
+
+
+def test_engines_that_all_fail_are_not_a_timeout(monkeypatch):
+    monkeypatch.setitem(Portfolio.ENGINES,"failing",failing_engine)
+    with pytest.raises(RuntimeError):
+        Portfolio(["failing"],timeout=30).solve(["A"])
+    portfolio = Portfolio(["failing","search"],timeout=30)
+    portfolio.wins[portfolio.shape(["A"])] = {"failing" : 5}
+    assert portfolio.solve(["A"]) == (True,"search")
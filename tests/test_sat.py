@@ -0,0 +1,63 @@
+from logic_toolkit import LogicToolkit, SatSession, WorkloadGenerator
+
+
+def test_agrees_with_is_satisfiable():
+    ltk = LogicToolkit()
+    for seed in range(60):
+        formula = WorkloadGenerator(seed).random_kcnf(3 + seed % 6)
+        session = SatSession(ltk)
+        session.add_formula(formula)
+        satisfiable = session.solve()
+        assert satisfiable == ltk.is_satisfiable(formula)
+        if satisfiable:
+            clause_set = ltk.to_clause_set(formula)
+            model = session.model()
+            assert clause_set.evaluate([model[name] for name in clause_set.variables])
+        else:
+            assert session.model() is None
+
+
+def test_assumptions_are_not_kept():
+    session = SatSession()
+    session.add_formula("(A->B)a(B->C)")
+    assert not session.solve(["A","!C"])
+    assert session.solve(["!C"])
+    assert session.model()["A"] is False
+    assert session.solve(["A"]) and session.model()["C"] is True
+
+
+def test_push_and_pop():
+    session = SatSession()
+    session.add_clause(["A","B"])
+    session.push()
+    session.add_clause(["!A"])
+    session.push()
+    session.add_clause(["!B"])
+    assert not session.solve()
+    session.pop()
+    assert session.solve() and session.model() == {"A" : False, "B" : True}
+    session.pop()
+    assert session.solve(["!B"])
+    try:
+        session.pop()
+        assert False
+    except ValueError:
+        pass
+
+
+def test_learned_clauses_carry_over():
+    # 6 pigeons don't fit in 5 holes, the solver can only show it by learning
+    session = SatSession()
+    for pigeon in range(6):
+        session.add_clause(["p%d_%d" % (pigeon,hole) for hole in range(5)])
+    for hole in range(5):
+        for first in range(6):
+            for second in range(first + 1,6):
+                session.add_clause(["!p%d_%d" % (first,hole),"!p%d_%d" % (second,hole)])
+    assert not session.solve()
+    learned = session.stats["learned"]
+    assert learned > 0
+    # once it's shown at level 0, asking again costs nothing
+    conflicts = session.stats["conflicts"]
+    assert not session.solve(["p0_0"])
+    assert session.stats["conflicts"] == conflicts
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import threading
+
+from logic_toolkit import LogicToolkit
+from logic_toolkit.server import LogicToolkitServer
+
+
+class ControlledToolkit(LogicToolkit):
+    '''
+    A toolkit whose to_cnf can be held up, so tests can decide the order in which requests finish
+    '''
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def to_cnf(self,f_list,return_string=False,**budgets):
+        if f_list == "wait":
+            self.release.wait(5)
+            return "released"
+        if f_list == "crash":
+            raise TypeError("internal failure")
+        return super().to_cnf(f_list,return_string,**budgets)
+
+
+async def start_server(tmp_path,toolkit=None):
+    '''
+    Starts a server on a Unix socket in tmp_path
+    Returns (server, serving task, socket path) once it accepts connections
+    '''
+    server = LogicToolkitServer(toolkit)
+    path = str(tmp_path / "ltk.sock")
+    task = asyncio.create_task(server.serve(unix_path=path))
+    for _ in range(200):
+        try:
+            _, writer = await asyncio.open_unix_connection(path)
+        except (FileNotFoundError,ConnectionRefusedError):
+            await asyncio.sleep(0.01)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return server,task,path
+    raise RuntimeError("server didn't start")
+
+
+async def stop_server(server,task):
+    task.cancel()
+    await asyncio.gather(task,return_exceptions=True)
+    server.close()
+
+
+async def send(writer,message):
+    writer.write((json.dumps(message) + "\n").encode())
+    await writer.drain()
+
+
+async def receive(reader):
+    return json.loads(await asyncio.wait_for(reader.readline(),5))
+
+
+def request(request_id,method,params=None):
+    message = {"jsonrpc" : "2.0", "id" : request_id, "method" : method}
+    if params is not None:
+        message["params"] = params
+    return message
+
+
+def test_pipelined_responses_come_back_as_they_finish(tmp_path):
+    async def run():
+        toolkit = ControlledToolkit()
+        server,task,path = await start_server(tmp_path,toolkit)
+        reader,writer = await asyncio.open_unix_connection(path)
+
+        # the first request is held up, the second one is sent without waiting for the first answer
+        await send(writer,request(1,"to_cnf",["wait"]))
+        await send(writer,request(2,"to_cnf",["A->(BaC)",True]))
+
+        first = await receive(reader)
+        assert first == {"jsonrpc" : "2.0", "id" : 2, "result" : "(!AvB)a(!AvC)"}
+        toolkit.release.set()
+        second = await receive(reader)
+        assert second == {"jsonrpc" : "2.0", "id" : 1, "result" : "released"}
+
+        writer.close()
+        await stop_server(server,task)
+
+    asyncio.run(run())
+
+
+def test_batch_skips_notifications(tmp_path):
+    async def run():
+        server,task,path = await start_server(tmp_path)
+        reader,writer = await asyncio.open_unix_connection(path)
+
+        notification = {"jsonrpc" : "2.0", "method" : "make_random_formula"}
+        await send(writer,[request(1,"is_tautology",["Av!A"]),notification,request(2,"is_satisfiable",["Aa!A"])])
+        responses = await receive(reader)
+        assert sorted(responses,key=lambda r: r["id"]) == [
+            {"jsonrpc" : "2.0", "id" : 1, "result" : True},
+            {"jsonrpc" : "2.0", "id" : 2, "result" : False}
+        ]
+
+        writer.close()
+        await stop_server(server,task)
+
+    asyncio.run(run())
+
+
+def test_error_codes(tmp_path):
+    async def run():
+        server,task,path = await start_server(tmp_path,ControlledToolkit())
+        reader,writer = await asyncio.open_unix_connection(path)
+
+        writer.write(b"this is not json\n")
+        assert (await receive(reader))["error"]["code"] == LogicToolkitServer.PARSE_ERROR
+
+        await send(writer,[])
+        assert (await receive(reader))["error"]["code"] == LogicToolkitServer.INVALID_REQUEST
+
+        await send(writer,{"id" : 1, "method" : "to_cnf"})
+        assert (await receive(reader))["error"]["code"] == LogicToolkitServer.INVALID_REQUEST
+
+        await send(writer,request(2,"formula_to_list",["AvB"]))
+        assert (await receive(reader))["error"]["code"] == LogicToolkitServer.METHOD_NOT_FOUND
+
+        # invalid formula: the toolkit raises ValueError
+        await send(writer,request(3,"to_cnf",["A-"]))
+        assert (await receive(reader))["error"]["code"] == LogicToolkitServer.INVALID_PARAMS
+
+        # arguments that don't match the method's signature
+        await send(writer,request(4,"to_cnf",{"formula" : "AvB"}))
+        assert (await receive(reader))["error"]["code"] == LogicToolkitServer.INVALID_PARAMS
+
+        await send(writer,request(5,"to_cnf","AvB"))
+        assert (await receive(reader))["error"]["code"] == LogicToolkitServer.INVALID_PARAMS
+
+        # a failure inside the toolkit isn't the client's fault
+        await send(writer,request(6,"to_cnf",["crash"]))
+        assert (await receive(reader))["error"]["code"] == LogicToolkitServer.INTERNAL_ERROR
+
+        # a conversion over its budget
+        await send(writer,request(7,"to_dnf",{"f_list" : "(AvB)a(CvD)a(EvF)", "max_clauses" : 4}))
+        response = await receive(reader)
+        assert response["error"]["code"] == LogicToolkitServer.BUDGET_EXCEEDED
+        assert "max_clauses" in response["error"]["message"]
+
+        writer.close()
+        await stop_server(server,task)
+
+    asyncio.run(run())
+
+
+def test_clients_share_rules(tmp_path):
+    async def run():
+        server,task,path = await start_server(tmp_path)
+        reader1,writer1 = await asyncio.open_unix_connection(path)
+        reader2,writer2 = await asyncio.open_unix_connection(path)
+
+        await send(writer2,request(1,"make_query",["B"]))
+        assert (await receive(reader2))["result"] == False
+
+        await send(writer1,request(1,"add_rule",["A"]))
+        await receive(reader1)
+        await send(writer1,request(2,"add_rule",["A->B"]))
+        await receive(reader1)
+
+        await send(writer2,request(2,"make_query",["B"]))
+        assert (await receive(reader2))["result"] == True
+
+        writer1.close()
+        writer2.close()
+        await stop_server(server,task)
+
+    asyncio.run(run())
+
+
+def test_shutdown_with_open_connection_is_clean(tmp_path):
+    async def run():
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop,context: errors.append(context))
+
+        server,task,path = await start_server(tmp_path)
+        reader,writer = await asyncio.open_unix_connection(path)
+        await send(writer,request(1,"to_cnf",["AvB",True]))
+        await receive(reader)
+
+        await stop_server(server,task)
+        assert await asyncio.wait_for(reader.read(),5) == b"" # the server closed the connection
+        writer.close()
+        await asyncio.sleep(0.05)
+        assert errors == []
+
+    asyncio.run(run())
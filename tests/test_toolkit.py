@@ -0,0 +1,411 @@
+import itertools
+
+import pytest
+
+from logic_toolkit import ConversionBudgetExceeded, LogicToolkit, SatSession
+from logic_toolkit.workloads import WorkloadGenerator
+
+
+def evaluate(formula,values):
+    '''
+    Reference evaluator for formula strings, written independently of the toolkit
+    Precedence from tightest to loosest: '!', 'a', 'x', 'v', '->' (grouping from the right), '<->'
+    '''
+    position = 0
+
+    def biconditional():
+        nonlocal position
+        value = implication()
+        while formula.startswith("<->",position):
+            position += 3
+            value = implication() == value
+        return value
+
+    def implication():
+        nonlocal position
+        left = disjunction()
+        if formula.startswith("->",position):
+            position += 2
+            right = implication()
+            return (not left) or right
+        return left
+
+    def disjunction():
+        nonlocal position
+        value = exclusive()
+        while position < len(formula) and formula[position] == "v":
+            position += 1
+            value = exclusive() or value
+        return value
+
+    def exclusive():
+        nonlocal position
+        value = conjunction()
+        while position < len(formula) and formula[position] == "x":
+            position += 1
+            value = conjunction() != value
+        return value
+
+    def conjunction():
+        nonlocal position
+        value = negation()
+        while position < len(formula) and formula[position] == "a":
+            position += 1
+            value = negation() and value
+        return value
+
+    def negation():
+        nonlocal position
+        for constant in ("True","False"):
+            if formula.startswith(constant,position):
+                position += len(constant)
+                return constant == "True"
+        if formula[position] == "!":
+            position += 1
+            return not negation()
+        if formula[position] == "(":
+            position += 1
+            value = biconditional()
+            position += 1 # the closing bracket
+            return value
+        position += 1
+        return values[formula[position-1]]
+
+    return biconditional()
+
+
+def assert_equivalent(first,second):
+    '''
+    Checks that two formula strings have the same truth table
+    '''
+    text = (first + second).replace("True","").replace("False","")
+    letters = sorted(set(c for c in text if c.isupper()))
+    for bits in itertools.product([True,False],repeat=len(letters)):
+        values = dict(zip(letters,bits))
+        assert evaluate(first,values) == evaluate(second,values), (first,second,values)
+
+
+def clause_set(cnf_string):
+    '''
+    Reads a CNF string like '(!AvB)aC' into a set of clauses (frozensets of literals),
+    so results can be compared regardless of the order of clauses and literals
+    '''
+    clauses = set()
+    for clause in cnf_string.split("a"):
+        literals = clause.strip("()").split("v")
+        clauses.add(frozenset(literals))
+    return clauses
+
+
+def test_negation_after_implication_is_valid():
+    # make_random_formula writes formulas like this, for example 'A->!B'
+    ltk = LogicToolkit()
+    assert ltk._is_valid_formula("A->!B")
+    assert ltk._is_valid_formula("A->!(BaC)")
+    assert not ltk._is_valid_formula("A->!")
+
+
+def test_negation_after_implication_converts():
+    ltk = LogicToolkit()
+    assert clause_set(ltk.to_cnf("A->!B",return_string=True)) == {frozenset(["!A","!B"])}
+    assert clause_set(ltk.to_cnf("A->!(BaC)",return_string=True)) == {frozenset(["!A","!B","!C"])}
+
+
+def test_stats_per_pass():
+    ltk = LogicToolkit()
+    ltk.to_cnf("Av(BaC)")
+    assert ltk.stats() == {} # not collected unless turned on
+
+    events = []
+    ltk.set_stats_callback(events.append)
+    ltk.to_cnf("Av(BaC)")
+    stats = ltk.stats()
+    assert stats["normalize"]["calls"] == 1 and stats["normalize"]["rewrites"] == 1
+    assert stats["normalize"]["nodes_after"] > stats["normalize"]["nodes_before"]
+    assert sum(record["calls"] for record in stats.values()) == len(events)
+
+    ltk.reset_stats()
+    assert ltk.stats() == {}
+
+
+def test_trace_sink_events():
+    ltk = LogicToolkit()
+    events = []
+    ltk.set_trace_sink(events.append)
+    ltk.to_cnf("Av(BaC)")
+    ltk.add_rule("A")
+    ltk.make_query("A")
+
+    kinds = [event["event"] for event in events]
+    assert "pass" in kinds and "query" in kinds
+    conversion = [event for event in events if event["event"] == "conversion"][0]
+    assert conversion["form"] == "cnf" and conversion["nodes_after"] > conversion["nodes_before"]
+
+
+def test_debugging_messages_go_to_logging(caplog):
+    import logging
+    ltk = LogicToolkit()
+    with caplog.at_level(logging.DEBUG,logger="logic_toolkit"):
+        ltk._is_valid_formula("A%B")
+    assert "Invalid character: '%'" in caplog.text
+
+
+def test_mixed_connectives_follow_precedence():
+    ltk = LogicToolkit()
+    # 'a' binds tighter than 'v', which binds tighter than '->'
+    assert clause_set(ltk.to_cnf("AaBvC",return_string=True)) == {frozenset(["A","C"]),frozenset(["B","C"])}
+    assert clause_set(ltk.to_cnf("AaB->C",return_string=True)) == {frozenset(["!A","!B","C"])}
+    assert clause_set(ltk.to_cnf("A->B->C",return_string=True)) == {frozenset(["!A","!B","C"])}
+
+
+def test_negation_normal_form_keeps_the_truth_table():
+    ltk = LogicToolkit()
+    formulas = [WorkloadGenerator(seed).random_formula(7,n_variables=4) for seed in range(40)]
+    formulas += [WorkloadGenerator(seed).deep_formula(10,n_variables=4) for seed in range(20)]
+    for formula in formulas:
+        nnf = ltk._LogicToolkit__to_nnf_list(ltk.formula_to_list(formula))
+        nnf_string = ltk._LogicToolkit__list_to_formula(nnf)
+        assert "->" not in nnf_string and "!(" not in nnf_string
+        assert_equivalent(formula,nnf_string)
+
+
+def test_conversions_keep_the_truth_table():
+    ltk = LogicToolkit()
+    for formula in ["!(AvB)","Ca!(AvB)","!(!(AaB))","A->!(BvC)","!(A->B)","!((A->B)a!(CvD))","AvBaC->!D"]:
+        assert_equivalent(formula,ltk.to_cnf(formula,return_string=True))
+        assert_equivalent(formula,ltk.to_dnf(formula,return_string=True))
+
+
+def test_conversions_of_generated_formulas_keep_the_truth_table():
+    ltk = LogicToolkit()
+    formulas = [WorkloadGenerator(seed).random_formula(9,n_variables=4) for seed in range(60)]
+    formulas += [WorkloadGenerator(seed).deep_formula(12,n_variables=4) for seed in range(30)]
+    for formula in formulas:
+        cnf = ltk.to_cnf(formula,return_string=True)
+        dnf = ltk.to_dnf(formula,return_string=True)
+        assert_equivalent(formula,cnf)
+        assert_equivalent(formula,dnf)
+        # no brackets are left inside the clauses of the CNF or the terms of the DNF
+        assert all("(" not in clause.strip("()") for clause in cnf.split("a"))
+        assert all("(" not in term.strip("()") for term in dnf.split("v"))
+
+
+def test_repeated_subformulas_convert():
+    ltk = LogicToolkit()
+    shared = ['A','v','B']
+    f_list = [shared,'a',[shared,'a','C']]
+    assert clause_set(ltk.to_cnf(f_list,return_string=True)) == {frozenset(["A","B"]),frozenset(["C"])}
+
+
+def test_conversion_does_not_modify_its_input():
+    ltk = LogicToolkit()
+    f_list = ltk.formula_to_list("!(AvB)->(CaD)")
+    ltk.to_cnf(f_list)
+    assert f_list == ltk.formula_to_list("!(AvB)->(CaD)")
+
+
+def test_budget_is_checked_before_distributing():
+    ltk = LogicToolkit()
+    formula = "(AaB)v(CaD)v(EaF)v(GaH)v(IaJ)" # 2^5 clauses in CNF
+    assert len(clause_set(ltk.to_cnf(formula,return_string=True,max_clauses=32))) == 32
+    with pytest.raises(ConversionBudgetExceeded) as error:
+        ltk.to_cnf(formula,max_clauses=31)
+    assert (error.value.budget,error.value.limit,error.value.size) == ("max_clauses",31,32)
+    with pytest.raises(ConversionBudgetExceeded) as error:
+        ltk.to_dnf("(AvB)a(CvD)a(EvF)",max_nodes=20)
+    assert error.value.budget == "max_nodes"
+    with pytest.raises(ConversionBudgetExceeded) as error:
+        ltk.to_cnf(formula,timeout=0)
+    assert error.value.budget == "timeout"
+    with pytest.raises(ValueError):
+        ltk.to_cnf(formula,max_clauses=-1)
+
+
+def test_budget_fallback_is_equisatisfiable():
+    ltk = LogicToolkit()
+    for seed in range(30):
+        formula = WorkloadGenerator(seed).random_formula(8,n_variables=4)
+        encoded = ltk.to_cnf(formula,max_clauses=1,fallback=True)
+        assert ltk.is_satisfiable(encoded) == ltk.is_satisfiable(formula)
+    assert ltk.is_contradiction(ltk.to_cnf("Aa!A",max_clauses=0,fallback=True))
+
+
+def test_condition_keeps_the_truth_table():
+    ltk = LogicToolkit()
+    for seed in range(40):
+        formula = WorkloadGenerator(seed).random_formula(10,n_variables=4)
+        fixed = {"A" : seed % 2 == 0, "!C" : seed % 3 == 0}
+        residual = ltk.condition(formula,fixed)
+        residual_string = ltk.condition(formula,fixed,return_string=True)
+        for bits in itertools.product([True,False],repeat=4):
+            values = dict(zip("ABCD",bits))
+            values["A"],values["C"] = fixed["A"],not fixed["!C"]
+            if type(residual[0]) == bool and len(residual) == 1:
+                assert residual[0] == evaluate(formula,values)
+            else:
+                assert evaluate(residual_string,values) == evaluate(formula,values), (formula,residual_string)
+
+
+def test_condition_folds_constants_at_any_depth():
+    ltk = LogicToolkit()
+    assert ltk.condition("((((AaB)vC)->D)aE)",{"A" : True,"C" : False},return_string=True) == "(B->D)aE"
+    assert ltk.condition("!((AvB)aC)",{"B" : True}) == [['!','C']]
+    assert ltk.condition("Av(Ba(C->D))",{"!A" : True,"D" : False},return_string=True) == "Ba!C"
+    assert ltk.condition("(AaB)->C",{"A" : True,"B" : True,"C" : False}) == [False]
+    assert ltk.condition("A->(BvC)",{"B" : True}) == [True]
+    with pytest.raises(ValueError):
+        ltk.condition("AvB",{"A" : 1})
+
+
+def test_condition_only_rebuilds_affected_brackets():
+    ltk = LogicToolkit()
+    f_list = ltk.formula_to_list("(Ba(CvD))v(Aa(BvC))")
+    copy = ltk.formula_to_list("(Ba(CvD))v(Aa(BvC))")
+    residual = ltk.condition(f_list,{"A" : True})
+    assert residual[0] is f_list[0]
+    assert f_list == copy
+
+
+def test_condition_sees_changes_to_the_same_list():
+    ltk = LogicToolkit()
+    f_list = ltk.formula_to_list("(AaB)vC")
+    assert ltk.condition(f_list,{"A" : True},return_string=True) == "BvC"
+    f_list[0][2] = "D"
+    assert ltk.condition(f_list,{"A" : True},return_string=True) == "DvC"
+    f_list[2] = ['E','a','A']
+    assert ltk.condition(f_list,{"A" : True},return_string=True) == "DvE"
+    assert ltk.condition("(AaB)vC",{"A" : True},return_string=True) == "BvC"
+    assert ltk.condition("(AaB)vC",{"C" : False},return_string=True) == "AaB"
+
+
+def test_evaluate_batch_matches_the_truth_table():
+    numpy = pytest.importorskip("numpy")
+    ltk = LogicToolkit()
+    rows = list(itertools.product([True,False],repeat=4))
+    assignments = numpy.array(rows,dtype=bool)
+    for seed in range(20):
+        formula = WorkloadGenerator(seed).random_formula(10,n_variables=4)
+        result = ltk.evaluate_batch(formula,assignments,variables="ABCD")
+        assert result.tolist() == [evaluate(formula,dict(zip("ABCD",row))) for row in rows]
+        packed = numpy.packbits(assignments,axis=1).tobytes()
+        assert ltk.evaluate_batch(formula,packed,variables="ABCD").tolist() == result.tolist()
+    with pytest.raises(ValueError):
+        ltk.evaluate_batch("AvB",assignments)
+
+
+def test_iter_cnf_clauses_matches_to_cnf():
+    ltk = LogicToolkit()
+    for seed in range(30):
+        formula = WorkloadGenerator(seed).random_formula(10,n_variables=4)
+        streamed = list(ltk.iter_cnf_clauses(formula,skip_duplicates=True))
+        assert len(streamed) == len(set(frozenset(clause) for clause in streamed))
+        assert all(not any("!" + literal in clause for literal in clause) for clause in streamed)
+        if not streamed:
+            assert ltk.is_tautology(formula)
+        elif () in streamed:
+            assert ltk.is_contradiction(formula)
+        else:
+            assert_equivalent(formula,"a".join("(" + "v".join(clause) + ")" for clause in streamed))
+
+    clauses = ltk.iter_cnf_clauses("(AaB)v(Aa!B)v(CaD)")
+    assert next(clauses) == ('A','C')
+    assert list(ltk.iter_cnf_clauses("(Av!A)aB")) == [('B',)]
+    assert list(ltk.iter_cnf_clauses("(Av!A)aB",skip_tautologies=False)) == [('A','!A'),('B',)]
+    assert list(ltk.iter_cnf_clauses("(AvB)a(BvA)",skip_duplicates=True)) == [('A','B')]
+
+
+def test_parallel_conversion_matches_the_serial_one():
+    ltk = LogicToolkit()
+    generator = WorkloadGenerator(7)
+    conjunction = "a".join("(" + generator.random_formula(8,n_variables=5) + ")" for _ in range(12))
+    disjunction = "(AaB)v((CaD)v(Ea!A))v(Ba!C)"
+    try:
+        for formula in (conjunction,disjunction,"A","!(AvB)"):
+            assert ltk.to_cnf(formula,workers=2) == ltk.to_cnf(formula)
+    finally:
+        ltk.close()
+    with pytest.raises(ValueError):
+        ltk.to_cnf("AvB",workers=0)
+
+
+def test_exclusive_or_and_biconditional_convert():
+    ltk = LogicToolkit()
+    formulas = ["AxB","A<->B","!(AxB)","AxBxC","A<->B<->C","AaBxCvD","AxB->C<->D","!(A<->(BxC))a(CvD)",
+        "(AxB)a(B<->!C)","A->BxC"]
+    for formula in formulas:
+        assert ltk._is_valid_formula(formula)
+        assert_equivalent(formula,ltk.to_cnf(formula,return_string=True))
+        assert_equivalent(formula,ltk.to_dnf(formula,return_string=True))
+        assert ltk.is_satisfiable(formula) == any(evaluate(formula,dict(zip("ABCD",bits)))
+            for bits in itertools.product([True,False],repeat=4))
+    for formula in ["A<-B","AxxB","A<-->B","A<>B","xA","A<->"]:
+        assert not ltk._is_valid_formula(formula)
+    assert ltk.condition("(AxB)<->C",{"A" : True},return_string=True) == "!B<->C"
+
+
+def test_parity_constraints_mixed_with_clauses():
+    ltk = LogicToolkit()
+    ltk._collecting_stats = True
+    formulas = ["(AxBxC)a(AvB)","(AxB)a(AaB)","(AxB)a(A->B)a(B->A)","(A<->B)a(CxD)a(Av!C)a(!BvD)",
+        "(AxBxCxD)a(AvB)a(!Av!B)a(CaD)","(AxC)a!(BvD)a(A<->!D)"]
+    for formula in formulas:
+        assert ltk.is_satisfiable(formula) == any(evaluate(formula,dict(zip("ABCD",bits)))
+            for bits in itertools.product([True,False],repeat=4)), formula
+    assert ltk.stats()["satisfiability"]["gauss"] == len(formulas)
+    # the chain isn't expanded, only the variables it shares with the clauses are enumerated
+    chain = "x".join(chr(ord("A") + i) for i in range(24))
+    assert ltk.is_satisfiable("(" + chain + ")a(AvB)a(!Av!B)")
+    assert not ltk.is_satisfiable("(" + chain + ")a(" + chain.replace("AxB","Ax!B") + ")a(CvD)")
+
+
+def test_exclusive_or_chains_give_their_parity_clauses():
+    ltk = LogicToolkit()
+    assert clause_set(ltk.to_cnf("AxB",return_string=True)) == {frozenset(["A","B"]),frozenset(["!A","!B"])}
+    assert clause_set(ltk.to_cnf("A<->B",return_string=True)) == {frozenset(["A","!B"]),frozenset(["!A","B"])}
+    for n in (8,10):
+        chain = "x".join(chr(ord("A") + i) for i in range(n))
+        # one clause for every assignment with the wrong parity, and nothing else
+        clauses = clause_set(ltk.to_cnf(chain,return_string=True,max_clauses=2**(n - 1)))
+        assert len(clauses) == 2**(n - 1)
+        assert all(len(clause) == n and sum(literal.startswith("!") for literal in clause) % 2 == n % 2
+            for clause in clauses)
+    assert ltk.to_cnf("(AxB)v(A<->B)") == [True]
+
+
+def test_exclusive_or_chains_stay_linear():
+    ltk = LogicToolkit()
+    variables = [chr(ord("A") + i) for i in range(20)]
+    chain = "x".join(variables)
+    # the NNF keeps both polarities of every step of the chain, so it grows linearly
+    assert ltk.formula_size(chain)["nodes"] < 20 * len(variables)
+    encoded = ltk.to_cnf(chain,max_clauses=64,fallback=True)
+    assert len(encoded) < 40 * len(variables)
+    # the encoding has a new variable per connective, too many for the truth table
+    session = SatSession()
+    session.add_formula(encoded)
+    assert session.solve()
+    session = SatSession()
+    session.add_formula(ltk.to_cnf("(" + chain + ")a!(" + chain + ")",max_clauses=64,fallback=True))
+    assert not session.solve()
+
+
+def test_parity_constraints_use_gaussian_elimination():
+    ltk = LogicToolkit()
+    ltk._collecting_stats = True
+    checks = {"(AxBxC)a(CxD)a(A<->D)" : True, "(AxB)a(BxC)a(AxC)" : False, "(AxBxCxD)a!(A<->B)a(C<->!D)" : False,
+        "Aa(AxB)a!(B<->C)" : True, "!(AxB)a(A<->!B)" : False}
+    for formula,satisfiable in checks.items():
+        assert ltk.is_satisfiable(formula) == satisfiable
+        assert satisfiable == any(evaluate(formula,dict(zip("ABCD",bits)))
+            for bits in itertools.product([True,False],repeat=4))
+    assert ltk.stats()["satisfiability"]["gauss"] == len(checks)
+    # a system far too big for the truth table
+    names = ["V" + str(i) for i in range(62)]
+    equations = [[names[i],'x',names[i + 1],'x',names[i + 2]] for i in range(60)]
+    f_list = equations[0]
+    for equation in equations[1:]:
+        f_list = [f_list,'a',equation]
+    assert ltk.is_satisfiable(f_list)
+    # every equation minus the next one gives Vi = Vi+3
+    assert not ltk.is_satisfiable([f_list,'a',[names[0],'x',names[3]]])
+    assert ltk.is_satisfiable([f_list,'a',[names[0],'x',names[3],'<->',names[6]]])
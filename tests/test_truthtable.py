@@ -0,0 +1,34 @@
+import itertools
+
+import pytest
+
+from logic_toolkit import LogicToolkit, TruthTableFile, WorkloadGenerator
+
+
+def test_table_matches_the_clause_set(tmp_path):
+    ltk = LogicToolkit()
+    for seed in range(20):
+        formula = WorkloadGenerator(seed).random_formula(10,n_variables=6)
+        clause_set = ltk.to_clause_set(formula)
+        variables = clause_set.variables
+        # small chunks, so the table is written in several of them
+        with ltk.export_truth_table(formula,tmp_path / "table.bin",variables,chunk_bits=8) as table:
+            assert table.variables == variables and len(table) == 2**len(variables)
+            for number,values in enumerate(itertools.product([False,True],repeat=len(variables))):
+                assert table[number] == clause_set.evaluate(values)
+                assert table.lookup(dict(zip(variables,values))) == clause_set.evaluate(values)
+            assert table.count() == len(list(clause_set.models()))
+
+
+def test_small_and_invalid_tables(tmp_path):
+    ltk = LogicToolkit()
+    with ltk.export_truth_table("A->B",tmp_path / "table.bin") as table:
+        assert [table[i] for i in range(4)] == [True,True,False,True]
+        assert table.lookup([True,False]) is False
+        with pytest.raises(IndexError):
+            table[4]
+    with pytest.raises(ValueError):
+        ltk.export_truth_table("AvC",tmp_path / "other.bin",["A","B"])
+    (tmp_path / "other.bin").write_bytes(b"not a table at all!!!")
+    with pytest.raises(ValueError):
+        TruthTableFile(tmp_path / "other.bin")
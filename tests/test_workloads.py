@@ -0,0 +1,43 @@
+from logic_toolkit import LogicToolkit
+from logic_toolkit.workloads import WorkloadGenerator
+
+
+def test_same_seed_same_workloads():
+    assert WorkloadGenerator(7).random_kcnf(10) == WorkloadGenerator(7).random_kcnf(10)
+    assert WorkloadGenerator(7).deep_formula(30) == WorkloadGenerator(7).deep_formula(30)
+    assert WorkloadGenerator(7).random_horn_rules(40) == WorkloadGenerator(7).random_horn_rules(40)
+
+
+def test_kcnf_shape():
+    f_list = WorkloadGenerator(1).random_kcnf(6,k=3,n_clauses=5,as_string=False)
+    clauses = [c for c in f_list if c != 'a']
+    assert len(clauses) == 5
+    for clause in clauses:
+        literals = [l for l in clause if l != 'v']
+        variables = [l[1] if type(l) == list else l for l in literals]
+        assert len(literals) == 3 and len(set(variables)) == 3
+
+
+def test_generated_formulas_are_valid():
+    ltk = LogicToolkit()
+    for seed in range(20):
+        generator = WorkloadGenerator(seed)
+        assert ltk._is_valid_formula(generator.random_kcnf(5))
+        assert ltk._is_valid_formula(generator.deep_formula(12))
+        assert ltk._is_valid_formula(generator.random_formula(12,n_variables=4))
+
+
+def test_string_and_list_forms_agree():
+    ltk = LogicToolkit()
+    for seed in range(10):
+        string = WorkloadGenerator(seed).random_formula(6)
+        f_list = WorkloadGenerator(seed).random_formula(6,as_string=False)
+        assert ltk.formula_to_list(string) == f_list
+
+
+def test_horn_rules_can_be_added_and_queried():
+    ltk = LogicToolkit()
+    for rule in WorkloadGenerator(3).random_horn_rules(30,n_literals=10):
+        ltk.add_rule(rule)
+    assert ltk.make_query("A")
+    ltk.make_query("J") # terminates, the rules have no cycles